@@ -48,8 +48,13 @@ __status__ = "4 - Beta" # "3 - Alpha", "4 - Beta", "5 - Production/Stable"
 #
 # import statements here. (built-in first, then 3rd party, then yours)
 import numpy as np
-from math import log10, log, exp, sqrt
+from math import log10, log, exp, sqrt, copysign
 import cmath
+try:
+    from math import cbrt
+except ImportError: # math.cbrt is new in python 3.11
+    def cbrt( x ):
+        return copysign( abs(x)**(1.0/3.0), x )
 from abc import ABC, abstractmethod
 
 RGAS = 83.145 # bar-cm**3 / gmole-K
@@ -332,14 +337,27 @@ class CubicEqnOfState(ABC):
         a3*Z**3 + a2*Z**2 + a1*Z + a0 = 0
         """
         a0, a1, a2, a3 = self.get_z_cubic_coeff()
-        I = complex(0,1)
-            
+        
+        # common subexpressions of the sympy Cardano solution
+        a2_a3 = a2/a3
+        p = -3*a1/a3 + a2_a3**2
+        q = 27*a0/a3 - 9*a1*a2_a3/a3 + 2*a2_a3**3
+        disc = q**2 - 4*p**3
+        
+        if disc >= 0.0:
+            # radicand is real, use the (faster) real cube root
+            C = cbrt( (q + sqrt(disc))/2 )
+        else:
+            C = ((q + cmath.sqrt(disc))/2)**(1.0/3.0)
+        
         #one not explicitly imaginary
-        Z1 = -a2/(3*a3) - (-3*a1/a3 + a2**2/a3**2)/(3*(27*a0/(2*a3) - 9*a1*a2/(2*a3**2) + a2**3/a3**3 + cmath.sqrt(-4*(-3*a1/a3 + a2**2/a3**2)**3 + (27*a0/a3 - 9*a1*a2/a3**2 + 2*a2**3/a3**3)**2)/2)**(1.0/3.0)) - (27*a0/(2*a3) - 9*a1*a2/(2*a3**2) + a2**3/a3**3 + cmath.sqrt(-4*(-3*a1/a3 + a2**2/a3**2)**3 + (27*a0/a3 - 9*a1*a2/a3**2 + 2*a2**3/a3**3)**2)/2)**(1.0/3.0)/3
+        Z1 = -a2_a3/3 - p/(3*C) - C/3
 
         #two imaginary
-        Z2 = -a2/(3*a3) - (-3*a1/a3 + a2**2/a3**2)/(3*(-0.5 - cmath.sqrt(3)*I/2)*(27*a0/(2*a3) - 9*a1*a2/(2*a3**2) + a2**3/a3**3 + cmath.sqrt(-4*(-3*a1/a3 + a2**2/a3**2)**3 + (27*a0/a3 - 9*a1*a2/a3**2 + 2*a2**3/a3**3)**2)/2)**(1.0/3.0)) - (-0.5 - cmath.sqrt(3)*I/2)*(27*a0/(2*a3) - 9*a1*a2/(2*a3**2) + a2**3/a3**3 + cmath.sqrt(-4*(-3*a1/a3 + a2**2/a3**2)**3 + (27*a0/a3 - 9*a1*a2/a3**2 + 2*a2**3/a3**3)**2)/2)**(1.0/3.0)/3.0
-        Z3 = -a2/(3*a3) - (-3*a1/a3 + a2**2/a3**2)/(3*(-0.5 + cmath.sqrt(3)*I/2)*(27*a0/(2*a3) - 9*a1*a2/(2*a3**2) + a2**3/a3**3 + cmath.sqrt(-4*(-3*a1/a3 + a2**2/a3**2)**3 + (27*a0/a3 - 9*a1*a2/a3**2 + 2*a2**3/a3**3)**2)/2)**(1.0/3.0)) - (-0.5 + cmath.sqrt(3)*I/2)*(27*a0/(2*a3) - 9*a1*a2/(2*a3**2) + a2**3/a3**3 + cmath.sqrt(-4*(-3*a1/a3 + a2**2/a3**2)**3 + (27*a0/a3 - 9*a1*a2/a3**2 + 2*a2**3/a3**3)**2)/2)**(1.0/3.0)/3.0
+        w = complex(-0.5, -sqrt(3)/2)
+        Z2 = -a2_a3/3 - p/(3*w*C) - w*C/3.0
+        w = w.conjugate()
+        Z3 = -a2_a3/3 - p/(3*w*C) - w*C/3.0
 
         z_rootL = [Z1, Z2, Z3]
         #print( 'sympy roots = ', z_rootL )
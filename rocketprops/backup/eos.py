@@ -29,9 +29,19 @@ Standard Peng Robinson
 ----------------------
 .. autoclass:: PR
    :show-inheritance:
-   :members: a_alpha_pure, a_alpha_and_derivatives_pure, d3a_alpha_dT3_pure,
+   :members: a_alpha_pure, a_alpha_and_derivatives_pure,
+             a_alpha_and_derivatives_pure_vec, d3a_alpha_dT3_pure,
              solve_T, P_max_at_V, c1, c2, Zc
 
+Arrays of States
+================
+.. autoclass:: EOSArray
+   :members: from_scalars, to_TP, discriminant, derivatives,
+             departure_derivatives, departure_second_derivatives
+.. autoclass:: EOSBatch
+   :members: derivatives, departure_derivatives,
+             departure_second_derivatives
+
 Ideal Gas Equation of State
 ===========================
 .. autoclass:: IG
@@ -40,8 +50,31 @@ Ideal Gas Equation of State
 
 '''
 
-from math import sqrt, log
-from cmath import  atanh as catanh
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import partial
+try:
+    from functools import cached_property
+except ImportError:
+    # Python < 3.8
+    class cached_property(object):
+        r'''Minimal stand-in for :obj:`functools.cached_property`; the value
+        is computed on first access and stored in the instance `__dict__`,
+        which shadows this non-data descriptor afterwards.
+        '''
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+from math import sqrt, exp, log, log10, atanh, isinf, isnan
+import numpy as np
+from scipy.optimize import brenth
 
 k = 1.380649e-23
 N_A = 6.02214076e23
@@ -53,6 +86,32 @@ R2 = R*R
 R_2 = 0.5*R
 R_inv = 1.0/R
 R_inv2 = R_inv*R_inv
+# Largest argument exp accepts without overflowing
+ln_float_max = 709.782712893384
+
+# Starting temperatures for the discriminant-zero searches, [K]
+T_discriminant_zero_l_guesses = (100.0, 150.0, 200.0, 250.0, 300.0, 350.0, 400.0, 450.0)
+T_discriminant_zero_g_guesses = (700.0, 600.0, 500.0, 400.0, 300.0, 200.0)
+
+def _atanh_real(x):
+    r'''Real part of the inverse hyperbolic tangent of a real number, as
+    returned by `cmath.atanh(x).real`, without complex arithmetic.
+
+    Outside the unit interval the real part is that of the reciprocal, which
+    avoids the cancellation of the logarithmic form for large `x`.
+
+    .. math::
+        \Re\left[\text{atanh}(x)\right] = \frac{1}{2}\ln\left|
+        \frac{1 + x}{1 - x}\right| = \text{atanh}\left(\frac{1}{x}\right)
+        \text{ for } |x| > 1
+
+    The array kernels use the same identity element-wise, as
+    `np.arctanh(np.where(np.abs(x) < 1.0, x, 1.0/x))` or in the logarithmic
+    form.
+    '''
+    if abs(x) < 1.0:
+        return atanh(x)
+    return atanh(1.0/x)
 
 def deflate_cubic_real_roots(b, c, d, x0):
     F = b + x0
@@ -658,6 +717,22 @@ def chebder(c, m=1, scl=1.0):
     return c
 
 
+def _poly16_estrin(x, c):
+    """Evaluates a 16-term polynomial with Estrin's scheme; `c` is ordered
+    highest power first, as for `horner`, so the same coefficient lists can be
+    used with either. The four pair-wise chains are independent of each other,
+    unlike the single serial chain of Horner's method.
+    """
+    (c15, c14, c13, c12, c11, c10, c9, c8,
+     c7, c6, c5, c4, c3, c2, c1, c0) = c
+    x2 = x*x
+    x4 = x2*x2
+    return (((c0 + c1*x) + (c2 + c3*x)*x2)
+            + ((c4 + c5*x) + (c6 + c7*x)*x2)*x4
+            + (((c8 + c9*x) + (c10 + c11*x)*x2)
+               + ((c12 + c13*x) + (c14 + c15*x)*x2)*x4)*(x4*x4))
+
+
 def main_derivatives_and_departures(T, P, V, b, delta, epsilon, a_alpha,
                                     da_alpha_dT, d2a_alpha_dT2):
     epsilon2 = epsilon + epsilon
@@ -682,7 +757,7 @@ def main_derivatives_and_departures(T, P, V, b, delta, epsilon, a_alpha,
 #    arg2 = (arg + 1.0)/(arg - 1.0)
 #    fancy = 0.25*log(arg2*arg2)
 #    x12 = 2.*x11*fancy # Possible to use a catan, but then a complex division and sq root is needed too
-    x12 = 2.*x11*catanh(x11*x5).real # Possible to use a catan, but then a complex division and sq root is needed too
+    x12 = 2.*x11*_atanh_real(x11*x5) # Possible to use a catan, but then a complex division and sq root is needed too
     x14 = 0.5*x5
     x15 = epsilon2*x11
     x16 = x11_half*x9
@@ -790,7 +865,7 @@ def eos_lnphi(T, P, V, b, delta, epsilon, a_alpha):
     x0 = 1.0/sqrt(delta*delta - 4.0*epsilon)
 
     arg = 2.0*V*x0 + delta*x0
-    fancy = catanh(arg).real
+    fancy = _atanh_real(arg)
 
 # Possible optimization, numerical analysis required.
 #     arg2 = (arg + 1.0)/(arg - 1.0)
@@ -799,6 +874,656 @@ def eos_lnphi(T, P, V, b, delta, epsilon, a_alpha):
     return (P*V*RT_inv + log(RT/(P*(V-b))) - 1.0
             - 2.0*a_alpha*fancy*RT_inv*x0)
 
+def eos_discriminant(T, P, b, delta, epsilon, a_alpha, RT=None, RT6_inv=None):
+    r'''Calculate the discriminant of the cubic volume solution of the
+    general cubic equation of state form. See :obj:`GCEOS.discriminant` for
+    the formula.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the result is then broadcast element-wise.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    RT : float, optional
+        Precomputed `R*T`, [J/mol]
+    RT6_inv : float, optional
+        Precomputed `1/(R*T)^6`, [mol^6/J^6]
+
+    Returns
+    -------
+    discriminant : float
+        Discriminant, [-]
+    '''
+    if RT is None:
+        RT = R*T
+    if RT6_inv is None:
+        RT6_inv = RT*RT
+        RT6_inv = 1.0/(RT6_inv*RT6_inv*RT6_inv)
+    x0 = P*P
+    x1 = P*b + RT
+    x2 = a_alpha*b + epsilon*x1
+    x3 = P*epsilon
+    x4 = delta*x1
+    x5 = -P*delta + x1
+    x6 = a_alpha + x3 - x4
+    x2_2 = x2*x2
+    x5_2 = x5*x5
+    x6_2 = x6*x6
+    x7 = (-a_alpha - x3 + x4)
+    return x0*(18.0*P*x2*x5*x6 + 4.0*P*x7*x7*x7
+               - 27.0*x0*x2_2 - 4.0*x2*x5_2*x5 + x5_2*x6_2)*RT6_inv
+
+def eos_P_discriminant_zero_coeffs(T, b, delta, epsilon, a_alpha):
+    r'''Calculate the coefficients of the quartic in `P` whose roots zero
+    the discriminant of the general cubic equation of state form. See
+    :obj:`GCEOS.P_discriminant_zeros_analytical` for the derivation.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the coefficients are then broadcast element-wise.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    coeffs : tuple[float]
+        Quartic coefficients, highest order first, [various]
+    '''
+    # With u = a_alpha/(RT), every coefficient is a low-order polynomial in u
+    # whose coefficients factor over s = 2b + delta, g = delta^2 - 4epsilon
+    # (the discriminant of the attractive term's denominator), and
+    # h = b^2 + b*delta + epsilon; found with sympy from the expanded
+    # expressions kept below for reference.
+    RT_inv = R_inv/T
+    u = a_alpha*RT_inv
+    delta2 = delta*delta
+    q = b*(b + delta)
+    s = b + b + delta
+    g = delta2 - 4.0*epsilon
+    h = q + epsilon
+    sg = s*g
+
+    e = (u*(s + s - u) - g)*R*T
+    d = (u*(u*(4.0*u - 10.0*s) + 4.0*(3.0*q + delta2 + delta2 - 5.0*epsilon))
+         - (sg + sg))
+    c = RT_inv*(u*(u*(8.0*q - delta2 + 12.0*epsilon)
+                   + 2.0*s*(3.0*q + delta2 - epsilon))
+                - g*(6.0*q + delta2 + epsilon + epsilon))
+    b_coeff = 2.0*h*RT_inv*RT_inv*(u*(q + q - delta2 + 6.0*epsilon) - sg)
+    a_coeff = -g*h*h*RT_inv*RT_inv*RT_inv
+
+#        e = (2*a*delta + 4*a*b -R*T*delta**2 - a**2/(R*T) + 4*R*T*epsilon)
+#        d = (-4*b*delta**2 + 16*b*epsilon - 2*delta**3 + 8*delta*epsilon + 12*a*b**2/(R*T) + 12*a*b*delta/(R*T) + 8*a*delta**2/(R*T) - 20*a*epsilon/(R*T) - 20*a**2*b/(R**2*T**2) - 10*a**2*delta/(R**2*T**2) + 4*a**3/(R**3*T**3))
+#        c = (-6*b**2*delta**2/(R*T) + 24*b**2*epsilon/(R*T) - 6*b*delta**3/(R*T) + 24*b*delta*epsilon/(R*T) - delta**4/(R*T) + 2*delta**2*epsilon/(R*T) + 8*epsilon**2/(R*T) + 12*a*b**3/(R**2*T**2) + 18*a*b**2*delta/(R**2*T**2) + 10*a*b*delta**2/(R**2*T**2) - 4*a*b*epsilon/(R**2*T**2) + 2*a*delta**3/(R**2*T**2) - 2*a*delta*epsilon/(R**2*T**2) + 8*a**2*b**2/(R**3*T**3) + 8*a**2*b*delta/(R**3*T**3) - a**2*delta**2/(R**3*T**3) + 12*a**2*epsilon/(R**3*T**3))
+#        b_coeff = (-4*b**3*delta**2/(R**2*T**2) + 16*b**3*epsilon/(R**2*T**2) - 6*b**2*delta**3/(R**2*T**2) + 24*b**2*delta*epsilon/(R**2*T**2) - 2*b*delta**4/(R**2*T**2) + 4*b*delta**2*epsilon/(R**2*T**2) + 16*b*epsilon**2/(R**2*T**2) - 2*delta**3*epsilon/(R**2*T**2) + 8*delta*epsilon**2/(R**2*T**2) + 4*a*b**4/(R**3*T**3) + 8*a*b**3*delta/(R**3*T**3) + 2*a*b**2*delta**2/(R**3*T**3) + 16*a*b**2*epsilon/(R**3*T**3) - 2*a*b*delta**3/(R**3*T**3) + 16*a*b*delta*epsilon/(R**3*T**3) - 2*a*delta**2*epsilon/(R**3*T**3) + 12*a*epsilon**2/(R**3*T**3))
+#        a_coeff = (-b**4*delta**2/(R**3*T**3) + 4*b**4*epsilon/(R**3*T**3) - 2*b**3*delta**3/(R**3*T**3) + 8*b**3*delta*epsilon/(R**3*T**3) - b**2*delta**4/(R**3*T**3) + 2*b**2*delta**2*epsilon/(R**3*T**3) + 8*b**2*epsilon**2/(R**3*T**3) - 2*b*delta**3*epsilon/(R**3*T**3) + 8*b*delta*epsilon**2/(R**3*T**3) - delta**2*epsilon**2/(R**3*T**3) + 4*epsilon**3/(R**3*T**3))
+    return a_coeff, b_coeff, c, d, e
+
+def eos_P_discriminant_zero_newton(P, T, b, delta, epsilon, a_alpha, low=None,
+                                   xtol=4e-12, maxiter=80, history=None):
+    r'''Newton's method solver for a pressure which zeros the discriminant
+    of the general cubic equation of state form, starting from the guess `P`.
+    The discriminant and its analytical pressure derivative are evaluated
+    together with a shared set of subexpressions at each step.
+
+    Parameters
+    ----------
+    P : float
+        Initial pressure guess, [Pa]
+    T : float
+        Temperature, [K]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    low : float, optional
+        Lower bound the iteration is clamped to, [Pa]
+    xtol : float, optional
+        Relative tolerance on the pressure step, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    history : list, optional
+        If provided, every evaluated `(P, err)` pair is appended to it, [-]
+
+    Returns
+    -------
+    P : float
+        Pressure which makes the discriminant zero, [Pa]
+
+    Notes
+    -----
+    A ValueError is raised when the iteration goes negative, fails to
+    converge, or shows the slow linear convergence (step ratio near one half)
+    which indicates it is approaching a double root it will not reach.
+    '''
+    RT = R*T
+    x13 = RT**-6.0
+    x14 = b*epsilon
+    x15 = -b*delta + epsilon
+    x18 = b - delta
+    for niter in range(1, maxiter+1):
+        if P < 0.0:
+            raise ValueError("Will not converge")
+        x0 = P*P
+        x1 = P*epsilon
+        x2 = P*b + RT
+        x3 = a_alpha - delta*x2 + x1
+        x3_x3 = x3*x3
+        x4 = x3*x3_x3
+        x5 = a_alpha*b + epsilon*x2
+        x6 = 27.0*x5*x5
+        x7 = -P*delta + x2
+        x9 = x7*x7
+        x8 = x7*x9
+        x11 = x3*x5*x7
+        x12 = -18.0*P*x11 + 4.0*(P*x4 +x5*x8) + x0*x6 - x3_x3*x9
+        x16 = P*x15
+        x17 = 9.0*x3
+        x19 = x18*x5
+        # 26 mult so far
+        err = -x0*x12*x13
+        if history is not None:
+            history.append((P, err))
+        fprime = (-2.0*P*x13*(P*(-P*x17*x19 + P*x6 - b*x1*x17*x7
+                                 + 27.0*x0*x14*x5 + 6.0*x3_x3*x16 - x3_x3*x18*x7
+                                 - 9.0*x11 + 2.0*x14*x8 - x15*x3*x9 - 9.0*x16*x5*x7 + 6.0*x19*x9 + 2.0*x4) + x12))
+
+        if niter > 3 and (.40 < (err/(P*fprime)) < 0.55):
+            raise ValueError("Not going to work")
+        P_new = P - err/fprime
+        if low is not None and P_new < low:
+            P_new = low
+        if abs(P_new - P) < abs(xtol*P_new):
+            return P_new
+        P = P_new
+    raise ValueError("Failed to converge")
+
+def eos_second_derivatives(dP_dV, dP_dT, d2P_dV2, d2P_dT2, d2P_dTdV):
+    r'''Calculate the second partial derivatives of `T` and `V` of an
+    equation of state from the primitive pressure derivatives; the shared
+    bracketed terms and reciprocals are calculated once for all six.
+
+    Parameters
+    ----------
+    dP_dV : float
+        First volume derivative of pressure at constant `T`, [Pa*mol/m^3]
+    dP_dT : float
+        First temperature derivative of pressure at constant `V`, [Pa/K]
+    d2P_dV2 : float
+        Second volume derivative of pressure at constant `T`, [Pa*mol^2/m^6]
+    d2P_dT2 : float
+        Second temperature derivative of pressure at constant `V`, [Pa/K^2]
+    d2P_dTdV : float
+        Mixed second derivative of pressure, [Pa*mol/(K*m^3)]
+
+    Returns
+    -------
+    d2T_dPdV : float
+        See :obj:`GCEOS.d2T_dPdV_l`, [K*mol/(Pa*m^3)]
+    d2V_dPdT : float
+        See :obj:`GCEOS.d2V_dPdT_l`, [m^3/(K*Pa*mol)]
+    d2T_dP2 : float
+        See :obj:`GCEOS.d2T_dP2_l`, [K/Pa^2]
+    d2V_dP2 : float
+        See :obj:`GCEOS.d2V_dP2_l`, [m^3/(Pa^2*mol)]
+    d2T_dV2 : float
+        See :obj:`GCEOS.d2T_dV2_l`, [K*mol^2/m^6]
+    d2V_dT2 : float
+        See :obj:`GCEOS.d2V_dT2_l`, [m^3/(mol*K^2)]
+    '''
+    dV_dP = 1.0/dP_dV
+    dT_dP = 1.0/dP_dT
+    dV_dP2 = dV_dP*dV_dP
+    dT_dP2 = dT_dP*dT_dP
+    dV_dP3 = dV_dP2*dV_dP
+    dT_dP3 = dT_dP2*dT_dP
+    T_mixed = d2P_dTdV*dP_dT - dP_dV*d2P_dT2
+    V_mixed = d2P_dTdV*dP_dV - dP_dT*d2P_dV2
+    return (-T_mixed*dT_dP3, -V_mixed*dV_dP3, -d2P_dT2*dT_dP3, -d2P_dV2*dV_dP3,
+            dT_dP2*(-(d2P_dV2*dP_dT - dP_dV*d2P_dTdV) + T_mixed*dT_dP*dP_dV),
+            dV_dP2*(-(d2P_dT2*dP_dV - dP_dT*d2P_dTdV) + V_mixed*dV_dP*dP_dT))
+
+def eos_P_derivatives_batch(T, V, b, delta, epsilon, a_alpha, da_alpha_dT,
+                            d2a_alpha_dT2):
+    r'''Calculate the first and second partial derivatives of pressure of
+    a cubic equation of state with respect to `T` and `V`, for many states at
+    once. The formulas are those of :obj:`GCEOS.derivatives_and_departures`.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the results are then calculated element-wise.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    V : float
+        Molar volume, [m^3/mol]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+
+    Returns
+    -------
+    dP_dV : float
+        First volume derivative of pressure at constant `T`, [Pa*mol/m^3]
+    dP_dT : float
+        First temperature derivative of pressure at constant `V`, [Pa/K]
+    d2P_dV2 : float
+        Second volume derivative of pressure at constant `T`, [Pa*mol^2/m^6]
+    d2P_dT2 : float
+        Second temperature derivative of pressure at constant `V`, [Pa/K^2]
+    d2P_dTdV : float
+        Mixed second derivative of pressure, [Pa*mol/(K*m^3)]
+    '''
+    RT = R*T
+    x0 = 1.0/(V - b)
+    x1 = 1.0/(V*(V + delta) + epsilon)
+    x5 = V + V + delta
+    dP_dT = R*x0 - da_alpha_dT*x1
+    dP_dV = a_alpha*x5*x1*x1 - RT*x0*x0
+    d2P_dT2 = -d2a_alpha_dT2*x1
+    d2P_dV2 = 2.0*(a_alpha*x1*x1 + RT*x0*x0*x0 - a_alpha*x5*x5*x1*x1*x1)
+    d2P_dTdV = da_alpha_dT*x5*x1*x1 - R*x0*x0
+    return dP_dV, dP_dT, d2P_dV2, d2P_dT2, d2P_dTdV
+
+def eos_derivatives_batch(V, dP_dV, dP_dT, d2P_dV2, d2P_dT2, d2P_dTdV):
+    r'''Calculate the derived first and second partial derivatives of an
+    equation of state from the primitive pressure derivatives, for many
+    states at once. The formulas are those of the corresponding phase
+    properties of :obj:`GCEOS`, such as :obj:`GCEOS.d2T_dV2_l`.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the results are then calculated element-wise.
+
+    Parameters
+    ----------
+    V : float
+        Molar volume, [m^3/mol]
+    dP_dV : float
+        First volume derivative of pressure at constant `T`, [Pa*mol/m^3]
+    dP_dT : float
+        First temperature derivative of pressure at constant `V`, [Pa/K]
+    d2P_dV2 : float
+        Second volume derivative of pressure at constant `T`, [Pa*mol^2/m^6]
+    d2P_dT2 : float
+        Second temperature derivative of pressure at constant `V`, [Pa/K^2]
+    d2P_dTdV : float
+        Mixed second derivative of pressure, [Pa*mol/(K*m^3)]
+
+    Returns
+    -------
+    derivatives : dict[str, float]
+        Derivatives keyed by the name of the :obj:`GCEOS` property without
+        its phase suffix, [various]
+    '''
+    V2 = V*V
+    V_inv = 1.0/V
+    V_inv2 = V_inv*V_inv
+    V_inv3 = V_inv2*V_inv
+    dV_dP = 1.0/dP_dV
+    dT_dP = 1.0/dP_dT
+    dV_dP2 = dV_dP*dV_dP
+    dV_dT = -dP_dT*dV_dP
+    dT_dV = 1.0/dV_dT
+
+    (d2T_dPdV, d2V_dPdT, d2T_dP2, d2V_dP2, d2T_dV2,
+     d2V_dT2) = eos_second_derivatives(dP_dV, dP_dT, d2P_dV2, d2P_dT2, d2P_dTdV)
+    return {'dV_dP': dV_dP, 'dT_dP': dT_dP, 'dV_dT': dV_dT, 'dT_dV': dT_dV,
+            'd2T_dPdV': d2T_dPdV, 'd2V_dPdT': d2V_dPdT,
+            'd2T_dP2': d2T_dP2, 'd2V_dP2': d2V_dP2,
+            'd2T_dV2': d2T_dV2, 'd2V_dT2': d2V_dT2,
+            'dP_drho': -V2*dP_dV,
+            'drho_dP': -dV_dP*V_inv2,
+            'd2P_drho2': -V2*(-V2*d2P_dV2 - 2.0*V*dP_dV),
+            'd2rho_dP2': -d2V_dP2*V_inv2 + 2.0*dV_dP2*V_inv3,
+            'dT_drho': -V2*dT_dV,
+            'd2T_drho2': -V2*(-V2*d2T_dV2 - 2.0*V*dT_dV),
+            'drho_dT': -dV_dT*V_inv2,
+            'd2rho_dT2': -d2V_dT2*V_inv2 + 2.0*dV_dT*dV_dT*V_inv3,
+            'd2P_dTdrho': -V2*d2P_dTdV,
+            'd2T_dPdrho': -V2*d2T_dPdV,
+            'd2rho_dPdT': -d2V_dPdT*V_inv2 + 2.0*dV_dT*dV_dP*V_inv3,
+            'dbeta_dT': V_inv*(d2V_dT2 - dV_dT*dV_dT*V_inv),
+            'dbeta_dP': V_inv*(d2V_dPdT - dV_dT*dV_dP*V_inv),
+            'd2P_dVdP': d2P_dV2*dV_dP,
+            'd2P_dVdT_TP': d2P_dV2*dV_dT + d2P_dTdV,
+            'd2P_dT2_PV': d2P_dTdV*dV_dT + d2P_dT2,
+            'd2P_dTdP': d2P_dTdV*dV_dP}
+
+def eos_departure_derivatives_batch(T, P, V, dV_dT, dV_dP, b, delta, epsilon,
+                                    a_alpha, da_alpha_dT, d2a_alpha_dT2):
+    r'''Calculate the first temperature and pressure derivatives of the
+    departure enthalpy and entropy of a cubic equation of state, for many
+    states at once. The formulas are those of the corresponding phase
+    properties of :obj:`GCEOS`, such as :obj:`GCEOS.dH_dep_dT_l`.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the results are then calculated element-wise.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    V : float
+        Molar volume, [m^3/mol]
+    dV_dT : float
+        First temperature derivative of volume at constant `P`, [m^3/(mol*K)]
+    dV_dP : float
+        First pressure derivative of volume at constant `T`, [m^3/(mol*Pa)]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+
+    Returns
+    -------
+    derivatives : dict[str, float]
+        `dH_dep_dT`, `dH_dep_dP`, `dS_dep_dT`, `dS_dep_dP`, `dH_dep_dT_V`
+        and `dS_dep_dT_V`, keyed by the name of the :obj:`GCEOS` property
+        without its phase suffix, [various]
+    '''
+    inv_sqrt_disc = 1.0/np.sqrt(delta*delta - 4.0*epsilon)
+    arg = inv_sqrt_disc*(delta + V + V)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        atanh_term = np.arctanh(np.where(np.abs(arg) < 1.0, arg, 1.0/arg))
+        # 4/((delta + 2V)^2 - (delta^2 - 4 epsilon))
+        x0 = 1.0/(V*(delta + V) + epsilon)
+        x1 = 2.0*inv_sqrt_disc*atanh_term*d2a_alpha_dT2
+        x2 = T*da_alpha_dT - a_alpha
+        x3 = x0*da_alpha_dT + R/(b - V)
+        dP_dT = -dV_dT/dV_dP
+        return {'dH_dep_dT': P*dV_dT - R + T*x1 - dV_dT*x0*x2,
+                'dH_dep_dP': V + dV_dP*(P - x0*x2),
+                'dS_dep_dT': x1 - R/T - dV_dT*x3,
+                'dS_dep_dP': R/P - dV_dP*x3,
+                'dH_dep_dT_V': -R + T*x1 + V*dP_dT,
+                'dS_dep_dT_V': R*(dP_dT/P - 1.0/T) + x1}
+
+def eos_phi_derivatives_batch(T, H_dep, S_dep, dH_dep_dT, dH_dep_dP,
+                               dS_dep_dT, dS_dep_dP):
+    r'''Calculate the fugacity coefficient of a phase and its first
+    temperature and pressure derivatives from the departure properties, for
+    many states at once. The formulas are those of :obj:`GCEOS.phi_l`,
+    :obj:`GCEOS.dphi_dT_l` and :obj:`GCEOS.dphi_dP_l`.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the results are then calculated element-wise.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    H_dep : float
+        Departure enthalpy, [J/mol]
+    S_dep : float
+        Departure entropy, [J/mol/K]
+    dH_dep_dT : float
+        Temperature derivative of departure enthalpy at constant `P`,
+        [(J/mol)/K]
+    dH_dep_dP : float
+        Pressure derivative of departure enthalpy at constant `T`,
+        [(J/mol)/Pa]
+    dS_dep_dT : float
+        Temperature derivative of departure entropy at constant `P`,
+        [(J/mol)/K^2]
+    dS_dep_dP : float
+        Pressure derivative of departure entropy at constant `T`,
+        [(J/mol)/K/Pa]
+
+    Returns
+    -------
+    derivatives : dict[str, float]
+        `phi`, `dphi_dT` and `dphi_dP`, keyed by the name of the
+        :obj:`GCEOS` property without its phase suffix, [various]
+    '''
+    RT_inv = R_inv/T
+    G_dep = H_dep - T*S_dep
+    phi = np.exp(G_dep*RT_inv)
+    return {'phi': phi,
+            'dphi_dT': RT_inv*(dH_dep_dT - T*dS_dep_dT - S_dep - G_dep/T)*phi,
+            'dphi_dP': RT_inv*(dH_dep_dP - T*dS_dep_dP)*phi}
+
+def _departure_second_T_derivatives(T, P, V, b, dV_dT, d2V_dT2, da_alpha_dT,
+                                    d2a_alpha_dT2, d3a_alpha_dT3,
+                                    T_da_alpha_dT_minus_a_alpha, inv_sqrt_disc,
+                                    atanh_term, delta_2V, denom_inv):
+    # Second temperature derivatives of the departure enthalpy and entropy,
+    # evaluated together as they share most of their terms; `denom_inv` is
+    # 0.25/(V*(delta + V) + epsilon). Branch-free, so NumPy arrays work too.
+    x0 = T_da_alpha_dT_minus_a_alpha
+    x1 = dV_dT*dV_dT
+    x2 = 2.0*inv_sqrt_disc*atanh_term
+    x3 = 4.0*denom_inv
+    x4 = dV_dT*x3
+    x4 = delta_2V*x4*x4
+    x5 = 1.0/(b - V)
+    V_inv = 1.0/V
+    T_inv = 1.0/T
+    x6 = R*V_inv
+    x7 = V_inv*V_inv
+    x8 = R*x1
+    x9 = dV_dT - V*T_inv
+    d2H_dep_dT2 = (P*d2V_dT2 + x2*(d2a_alpha_dT2 + T*d3a_alpha_dT3)
+                   - x3*d2V_dT2*x0 - 2.0*T*x3*d2a_alpha_dT2*dV_dT + x0*x4)
+    d2S_dep_dT2 = (-R*d2V_dT2*x5 - R*x7*dV_dT*x9 - x3*d2V_dT2*da_alpha_dT
+                   - d2V_dT2*x6 + x2*d3a_alpha_dT3
+                   - 2.0*x3*dV_dT*d2a_alpha_dT2 + x6*T_inv*x9
+                   + x6*(d2V_dT2 - 2.0*dV_dT*T_inv + 2.0*V*T_inv*T_inv)
+                   + x7*x8 - x8*x5*x5 + da_alpha_dT*x4)
+    return d2H_dep_dT2, d2S_dep_dT2
+
+def eos_departure_second_derivatives_batch(T, P, V, dV_dT, d2V_dT2, b, delta,
+                                           epsilon, a_alpha, da_alpha_dT,
+                                           d2a_alpha_dT2, d3a_alpha_dT3):
+    r'''Calculate the second temperature derivatives of the departure
+    enthalpy and entropy of a cubic equation of state, for many states at
+    once. The formulas are those of :obj:`GCEOS.d2H_dep_dT2_l` and
+    :obj:`GCEOS.d2S_dep_dT2_l` and their gas counterparts.
+
+    The expression is branch-free, so any of the arguments may be NumPy
+    arrays; the results are then calculated element-wise.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    V : float
+        Molar volume, [m^3/mol]
+    dV_dT : float
+        First temperature derivative of volume at constant `P`, [m^3/(mol*K)]
+    d2V_dT2 : float
+        Second temperature derivative of volume at constant `P`,
+        [m^3/(mol*K^2)]
+    b : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    d3a_alpha_dT3 : float
+        Third temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**3]
+
+    Returns
+    -------
+    derivatives : dict[str, float]
+        `d2H_dep_dT2` and `d2S_dep_dT2`, keyed by the name of the
+        :obj:`GCEOS` property without its phase suffix, [various]
+    '''
+    inv_sqrt_disc = 1.0/np.sqrt(delta*delta - 4.0*epsilon)
+    delta_2V = delta + V + V
+    arg = inv_sqrt_disc*delta_2V
+    with np.errstate(invalid='ignore', divide='ignore'):
+        atanh_term = np.arctanh(np.where(np.abs(arg) < 1.0, arg, 1.0/arg))
+        d2H_dep_dT2, d2S_dep_dT2 = _departure_second_T_derivatives(
+                T, P, V, b, dV_dT, d2V_dT2, da_alpha_dT, d2a_alpha_dT2,
+                d3a_alpha_dT3, T*da_alpha_dT - a_alpha, inv_sqrt_disc,
+                atanh_term, delta_2V, 0.25/(V*(delta + V) + epsilon))
+    return {'d2H_dep_dT2': d2H_dep_dT2, 'd2S_dep_dT2': d2S_dep_dT2}
+
+def chandrupatla(f, a, b, xtol=1e-12, maxiter=100):
+    r'''Find a root of `f` in the bracket [`a`, `b`] with Chandrupatla's
+    method, which takes inverse quadratic interpolation steps when they are
+    safe and bisection steps otherwise, keeping the bracket throughout.
+
+    Parameters
+    ----------
+    f : callable
+        Function of one variable, [-]
+    a : float
+        One end of the bracket, [-]
+    b : float
+        Other end of the bracket, where `f` has the opposite sign, [-]
+    xtol : float, optional
+        Absolute tolerance on the root, [-]
+    maxiter : int, optional
+        Maximum number of function evaluations, [-]
+
+    Returns
+    -------
+    x : float
+        Root, [-]
+    '''
+    fa, fb = f(a), f(b)
+    if fa*fb > 0.0:
+        raise ValueError("Root is not bracketed")
+    c, fc = a, fa
+    t = 0.5
+    for _ in range(maxiter):
+        xt = a + t*(b - a)
+        ft = f(xt)
+        if (ft > 0.0) == (fa > 0.0):
+            c, fc = a, fa
+        else:
+            c, fc = b, fb
+            b, fb = a, fa
+        a, fa = xt, ft
+
+        if abs(fa) < abs(fb):
+            xm, fm = a, fa
+        else:
+            xm, fm = b, fb
+        if fm == 0.0:
+            return xm
+        tlim = (4.4e-16*abs(xm) + xtol)/abs(b - c)
+        if tlim > 0.5:
+            return xm
+
+        xi = (a - b)/(c - b)
+        phi = (fa - fb)/(fc - fb)
+        if phi*phi < xi and (1.0 - phi)*(1.0 - phi) < 1.0 - xi:
+            t = (fa/(fb - fa)*fc/(fb - fc)
+                 + (c - a)/(b - a)*fa/(fc - fa)*fb/(fc - fb))
+        else:
+            t = 0.5
+        t = min(1.0 - tlim, max(tlim, t))
+    raise ValueError("Failed to converge")
+
+def cheb_affine_constants(low, high):
+    r'''Calculate the constants of the affine map from the interval
+    [`low`, `high`] onto the Chebyshev domain [-1, 1], so a series fit on that
+    interval is evaluated as `chebval(factor*(x + constant), coeffs)`.
+
+    Parameters
+    ----------
+    low : float
+        Lower limit of the fit interval, [-]
+    high : float
+        Upper limit of the fit interval, [-]
+
+    Returns
+    -------
+    constant : float
+        Offset added before scaling, [-]
+    factor : float
+        Scale factor, [-]
+    '''
+    return 0.5*(-low - high), 2.0/(high - low)
+
+def polyroots_vec(coeffs):
+    r'''Calculate the roots of many polynomials of the same order at once,
+    as the eigenvalues of a stack of companion matrices.
+
+    Parameters
+    ----------
+    coeffs : tuple[float or ndarray]
+        Polynomial coefficients, highest order first; each may be an array,
+        and they are broadcast together, [-]
+
+    Returns
+    -------
+    roots : ndarray
+        Complex roots, with a trailing axis of length `len(coeffs) - 1`, [-]
+    '''
+    coeffs = np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in coeffs])
+    n = len(coeffs) - 1
+    lead_inv = 1.0/coeffs[0]
+    companion = np.zeros(coeffs[0].shape + (n, n))
+    for i in range(n):
+        companion[..., 0, i] = -coeffs[i+1]*lead_inv
+    for i in range(1, n):
+        companion[..., i, i-1] = 1.0
+    return np.linalg.eigvals(companion).astype(complex)
+
 class GCEOS(object):
     r'''Class for solving a generic Pressure-explicit three-parameter cubic
     equation of state. Does not implement any parameters itself; must be
@@ -1222,8 +1947,10 @@ class GCEOS(object):
     '''Whether or not the EOS is multicomponent or not'''
     _P_zero_l_cheb_coeffs = None
     P_zero_l_cheb_limits = (0.0, 0.0)
+    _P_zero_l_cheb_affine = (0.0, 0.0)
     _P_zero_g_cheb_coeffs = None
     P_zero_g_cheb_limits = (0.0, 0.0)
+    _P_zero_g_cheb_affine = (0.0, 0.0)
     Psat_cheb_range = (0.0, 0.0)
 
     main_derivatives_and_departures = staticmethod(main_derivatives_and_departures)
@@ -1235,10 +1962,29 @@ class GCEOS(object):
 
     nonstate_constants = ('Tc', 'Pc', 'omega', 'kwargs', 'a', 'b', 'delta', 'epsilon')
     kwargs_keys = tuple()
+
+    to_cache_size = 0
+    '''Maximum number of objects created by `to_TP`, `to_TV` and `to_PV` which
+    an instance keeps for reuse when the same state is requested from it
+    again; 0 (the default) disables the cache. Set this on an instance to
+    opt in, e.g. before running an iterative solver. Cached objects are
+    shared with the caller and must not be mutated.'''
+    # Memoized values stored on instances which are not part of the state;
+    # excluded from hashing and serialization. Every `cached_property` of the
+    # class is added to these when the class is created, see
+    # `_collect_cache_attributes` and `__init_subclass__`
+    _cache_attributes_extra = ('_a_alpha_cache', '_discriminant_mp_consts',
+                               '_to_constructor', '_to_cache', 'to_cache_size')
+    _cache_attributes = _cache_attributes_extra
+
+    # Specification flags (T given, P given, V given) -> `to_*` method name
+    _to_dispatch = {(True, True, False): 'to_TP', (True, True, True): 'to_TP',
+                    (True, False, True): 'to_TV', (False, True, True): 'to_PV'}
     
     if not is_micropython:
         def __init_subclass__(cls):
             cls.__full_path__ = "%s.%s" %(cls.__module__, cls.__qualname__)
+            cls._cache_attributes = _collect_cache_attributes(cls)
     else:
         __full_path__ = None
 
@@ -1297,6 +2043,8 @@ class GCEOS(object):
             Hash of the object, [-]
         '''
         d = self.__dict__
+        if any(k in d for k in self._cache_attributes):
+            d = {k: v for k, v in d.items() if k not in self._cache_attributes}
         ans = hash_any_primitive((self.__class__.__name__, d))
         return ans
 
@@ -1385,6 +2133,8 @@ class GCEOS(object):
             del d['kwargs']
         except:
             pass
+        for k in self._cache_attributes:
+            d.pop(k, None)
         d["py/object"] = self.__full_path__
         d['json_version'] = 1
         return d
@@ -1514,6 +2264,7 @@ class GCEOS(object):
         for any previously solved roots.
         '''
         self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2 = self.a_alpha_and_derivatives(self.T, full=True, pure_a_alphas=False)
+        self._clear_cache()
         self.set_from_PT(self.raw_volumes, only_l=hasattr(self, 'V_l'), only_g=hasattr(self, 'V_g'))
 
     def solve_missing_volumes(self):
@@ -1525,12 +2276,23 @@ class GCEOS(object):
             try:
                 self.V_l
             except:
+                self._clear_cache()
                 self.set_from_PT(self.raw_volumes, only_l=True, only_g=False)
             try:
                 self.V_g
             except:
+                self._clear_cache()
                 self.set_from_PT(self.raw_volumes, only_l=False, only_g=True)
 
+    def _clear_cache(self):
+        # Memoized values belong to the previous solution; drop them before
+        # the state is updated in place. The opt-in `to_cache_size` setting
+        # is kept.
+        d = self.__dict__
+        for k in self._cache_attributes:
+            if k != 'to_cache_size':
+                d.pop(k, None)
+
 
     def set_from_PT(self, Vs, only_l=False, only_g=False):
         r'''Counts the number of real volumes in `Vs`, and determines what to do.
@@ -1840,7 +2602,21 @@ class GCEOS(object):
         '''
         if full:
             return self.a_alpha_and_derivatives_pure(T=T)
-        return self.a_alpha_pure(T)
+        # Saturation and discriminant routines ask for the same temperatures
+        # repeatedly; keep a small per-object memo of the plain values
+        try:
+            cache = self._a_alpha_cache
+        except AttributeError:
+            cache = self._a_alpha_cache = {}
+        try:
+            return cache[T]
+        except KeyError:
+            pass
+        a_alpha = self.a_alpha_pure(T)
+        if len(cache) >= 64:
+            del cache[next(iter(cache))]
+        cache[T] = a_alpha
+        return a_alpha
 
     def a_alpha_and_derivatives_pure(self, T):
         r'''Dummy method to calculate :math:`a \alpha` and its first and second
@@ -3200,7 +3976,9 @@ class GCEOS(object):
             except:
                 pass
             fprime = False
-            if Tsat is None or abs(to_solve_newton(Tsat)) == P:
+            # `curr_err` holds the last fugacity error seen by newton; checking
+            # it avoids constructing another EOS just to validate the result
+            if Tsat is None or abs(curr_err) >= 0.5*P:
                 Tsat = brenth(to_solve_newton, low, high)
 
         return Tsat
@@ -3277,12 +4055,8 @@ class GCEOS(object):
                     x = Psat_ranges_low[-1]
                     polish = True
 
-            for i in range(len(Psat_ranges_low)):
-                if x < Psat_ranges_low[i]:
-                    break
-            y = 0.0
-            for c in self.Psat_coeffs_low[i]:
-                y = y*x + c
+            i = bisect_right(Psat_ranges_low, x, 0, len(Psat_ranges_low) - 1)
+            y = _poly16_estrin(x, self.Psat_coeffs_low[i])
 
             try:
                 Psat = exp(y)*Tr*Pc
@@ -3509,9 +4283,7 @@ class GCEOS(object):
             if x > Psat_ranges_low[-1]:
                 raise NoSolutionError("T %.8f K is too low for equations to converge" %(T))
 
-            for i in range(len(Psat_ranges_low)):
-                if x < Psat_ranges_low[i]:
-                    break
+            i = bisect_right(Psat_ranges_low, x, 0, len(Psat_ranges_low) - 1)
             y, dy = 0.0, 0.0
             for c in Psat_coeffs_low[i]:
                 dy = x*dy + y
@@ -3571,7 +4343,7 @@ class GCEOS(object):
 
         alpha = self.a_alpha_and_derivatives(T, full=False)/self.a
         x = alpha/Tr - 1.
-        return horner(self.phi_sat_coeffs, x)
+        return _poly16_estrin(x, self.phi_sat_coeffs)
 
     def dphi_sat_dT(self, T, polish=True):
         r'''Method to calculate the temperature derivative of saturation
@@ -3723,8 +4495,8 @@ class GCEOS(object):
         .. [1] Walas, Stanley M. Phase Equilibria in Chemical Engineering.
            Butterworth-Heinemann, 1985.
         '''
-        Psat = self.Psat(T)
-        dPsat_dT = self.dPsat_dT(T)
+        # dPsat_dT necessarily computes Psat; reuse it rather than re-evaluating
+        dPsat_dT, Psat = self.dPsat_dT(T, also_Psat=True)
         a_alpha = self.a_alpha_and_derivatives(T, full=False)
         Vs = self.volume_solutions(T, Psat, self.b, self.delta, self.epsilon, a_alpha)
         # Assume we can safely take the Vmax as gas, Vmin as l on the saturation line
@@ -3925,7 +4697,7 @@ class GCEOS(object):
         def fug(V, a_alpha):
             # Can simplify this to not use a function, avoid 1 log anywayS
             G_dep = (P*V - RT - RT*log(P*RT_inv*(V-b))
-                      - x2*a_alpha*catanh(2.0*V*x0 + x1).real)
+                      - x2*a_alpha*_atanh_real(2.0*V*x0 + x1))
             return G_dep # No point going all the way to fugacity
 
         def err(a_alpha):
@@ -3981,7 +4753,7 @@ class GCEOS(object):
         ({'T': 500.0, 'P': 1000000.0}, {'T': 1.0, 'P': 2.0})
         '''
         if T != self.T or P != self.P:
-            return self.__class__(T=T, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
+            return self._to_cached(T=T, P=P)
         else:
             return self
 
@@ -4018,7 +4790,7 @@ class GCEOS(object):
         if T != self.T or V != self.V:
             # Only allow creation of new class if volume actually specified
             # Ignores the posibility that V is V_l or V_g
-            return self.__class__(T=T, V=V, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
+            return self._to_cached(T=T, V=V)
         else:
             return self
 
@@ -4053,10 +4825,78 @@ class GCEOS(object):
         ({'T': 500.0, 'P': 1000000.0}, {'P': 1000.0, 'V': 1.0})
         '''
         if P != self.P or V != self.V:
-            return self.__class__(V=V, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
+            return self._to_cached(P=P, V=V)
         else:
             return self
 
+    def _to_cached(self, T=None, P=None, V=None):
+        # Iterative solvers revisit the same states; when opted in, keep the
+        # most recently used objects so the cubic is not re-solved for them
+        try:
+            constructor = self._to_constructor
+        except AttributeError:
+            # Bind the model parameters once instead of splatting the kwargs
+            # dictionary on every call
+            constructor = partial(self.__class__, Tc=self.Tc, Pc=self.Pc,
+                                  omega=self.omega, **self.kwargs)
+            self._to_constructor = constructor
+        size = self.to_cache_size
+        if not size:
+            return constructor(T=T, P=P, V=V)
+        try:
+            cache = self._to_cache
+        except AttributeError:
+            cache = self._to_cache = OrderedDict()
+        key = (T, P, V)
+        try:
+            obj = cache[key]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(key)
+            return obj
+        obj = constructor(T=T, P=P, V=V)
+        cache[key] = obj
+        while len(cache) > size:
+            cache.popitem(last=False)
+        return obj
+
+    def evaluate(self, T, P, props=('Z', 'H_dep', 'S_dep'), phase=None):
+        r'''Method to calculate several properties of the EOS at the specified
+        `T` and `P` with a single volume solution. The new state is obtained
+        with :obj:`GCEOS.to_TP`, so the cubic is solved once and every
+        requested property is read from that one object.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        props : tuple[str], optional
+            Names of the properties to return without their phase suffix,
+            e.g. 'Z', 'H_dep', 'S_dep', 'G_dep', 'Cp_dep' or 'fugacity', [-]
+        phase : str, optional
+            'l' or 'g'; if not specified the more stable phase is used, [-]
+
+        Returns
+        -------
+        values : tuple[float]
+            Values of the requested properties, in the order of `props`,
+            [various]
+
+        Examples
+        --------
+        >>> base = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=500.0, P=1E6)
+        >>> base.evaluate(T=300.0, P=1e5, props=('Z', 'H_dep'))
+        (0.0052372349, -31163.9946)
+        '''
+        e = self.to_TP(T, P)
+        if phase is None:
+            phase = e.phase if e.phase != 'l/g' else e.more_stable_phase
+        suffix = '_' + phase
+        return tuple([getattr(e, name + suffix) for name in props])
+
     def to(self, T=None, P=None, V=None):
         r'''Method to construct a new EOS object at two of `T`, `P` or `V`.
         In the event the specs match those of the current object, it will be
@@ -4092,15 +4932,15 @@ class GCEOS(object):
         >>> base.to(P=1e5, V=1.0).state_specs
         {'P': 100000.0, 'V': 1.0}
         '''
-        if T is not None and P is not None:
-            return self.to_TP(T, P)
-        elif T is not None and V is not None:
-            return self.to_TV(T, V)
-        elif P is not None and V is not None:
-            return self.to_PV(P, V)
-        else:
+        key = (T is not None, P is not None, V is not None)
+        try:
+            method = self._to_dispatch[key]
+        except KeyError:
             # Error message
             return self.__class__(T=T, V=V, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
+        if key[0]:
+            return getattr(self, method)(T, P if key[1] else V)
+        return getattr(self, method)(P, V)
 
     def T_min_at_V(self, V, Pmin=1e-15):
         '''Returns the minimum temperature for the EOS to have the
@@ -4170,17 +5010,10 @@ class GCEOS(object):
         >>> PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6).more_stable_phase
         'l'
         '''
-        try:
-            if self.G_dep_l < self.G_dep_g:
-                return 'l'
-            else:
-                return 'g'
-        except:
-            try:
-                self.Z_g
-                return 'g'
-            except:
-                return 'l'
+        has_l, has_g = hasattr(self, 'G_dep_l'), hasattr(self, 'G_dep_g')
+        if has_l and has_g:
+            return 'l' if self.G_dep_l < self.G_dep_g else 'g'
+        return 'g' if has_g else 'l'
 
     def discriminant(self, T=None, P=None):
         r'''Method to compute the discriminant of the cubic volume solution
@@ -4258,9 +5091,9 @@ class GCEOS(object):
         >>> base.discriminant()
         -0.001026390999
         >>> base.discriminant(T=400)
-         0.0010458828
+        0.0025372611
         >>> base.discriminant(T=400, P=1e9)
-        12584660355.4
+        46987558800.4
         '''
         if P is None:
             P = self.P
@@ -4269,22 +5102,46 @@ class GCEOS(object):
             a_alpha = self.a_alpha
         else:
             a_alpha = self.a_alpha_and_derivatives(T, full=False)
-        RT = R*self.T
-        RT6 = RT*RT
-        RT6 *= RT6*RT6
-        x0 = P*P
-        x1 = P*self.b + RT
-        x2 = a_alpha*self.b + self.epsilon*x1
-        x3 = P*self.epsilon
-        x4 = self.delta*x1
-        x5 = -P*self.delta + x1
-        x6 = a_alpha + x3 - x4
-        x2_2 = x2*x2
-        x5_2 = x5*x5
-        x6_2 = x6*x6
-        x7 = (-a_alpha - x3 + x4)
-        return x0*(18.0*P*x2*x5*x6 + 4.0*P*x7*x7*x7
-                   - 27.0*x0*x2_2 - 4.0*x2*x5_2*x5 + x5_2*x6_2)/RT6
+            return eos_discriminant(T, P, self.b, self.delta, self.epsilon, a_alpha)
+        return eos_discriminant(T, P, self.b, self.delta, self.epsilon, a_alpha,
+                                RT=self._RT, RT6_inv=self._RT6_inv)
+
+    def discriminant_vec(self, Ts=None, Ps=None):
+        r'''Method to compute the discriminant of the cubic volume solution
+        for arrays of temperatures and/or pressures in a single call. This
+        is the vectorized form of :obj:`GCEOS.discriminant`, and gives the
+        same result element-wise.
+
+        Parameters
+        ----------
+        Ts : array-like, optional
+            Temperatures; the current `T` is used if not specified, [K]
+        Ps : array-like, optional
+            Pressures; the current `P` is used if not specified, [Pa]
+
+        Returns
+        -------
+        discriminants : ndarray
+            Discriminants, broadcast to the shape of `Ts` and `Ps`, [-]
+
+        Notes
+        -----
+        :math:`a \alpha` is evaluated once per distinct temperature; the
+        discriminant itself is evaluated in one NumPy pass by
+        :obj:`eos_discriminant`.
+        '''
+        Ps = np.asarray(self.P if Ps is None else Ps, dtype=float)
+        if Ts is None:
+            a_alphas = self.a_alpha
+        else:
+            Ts = np.asarray(Ts, dtype=float)
+            T_unique, T_index = np.unique(Ts, return_inverse=True)
+            a_alphas = np.array([self.a_alpha_and_derivatives(T, full=False)
+                                 for T in T_unique.tolist()])[T_index].reshape(Ts.shape)
+            Ts, Ps = np.broadcast_arrays(Ts, Ps)
+            return eos_discriminant(Ts, Ps, self.b, self.delta, self.epsilon, a_alphas)
+        return eos_discriminant(self.T, Ps, self.b, self.delta, self.epsilon, a_alphas,
+                                RT=self._RT, RT6_inv=self._RT6_inv)
 
 
     def _discriminant_at_T_mp(self, P):
@@ -4292,9 +5149,15 @@ class GCEOS(object):
         # not need mpmath
         import mpmath as mp
         mp.mp.dps = 70
-        P, T, b, a_alpha, delta, epsilon, R_mp = [mp.mpf(i) for i in [P, self.T, self.b, self.a_alpha, self.delta, self.epsilon, R]]
-        RT = R_mp*T
-        RT6 = RT**6
+        # Only P changes between calls; promote the T-dependent terms once
+        try:
+            RT, RT6, b, a_alpha, delta, epsilon = self._discriminant_mp_consts
+        except AttributeError:
+            T, b, a_alpha, delta, epsilon, R_mp = [mp.mpf(i) for i in [self.T, self.b, self.a_alpha, self.delta, self.epsilon, R]]
+            RT = R_mp*T
+            RT6 = RT**6
+            self._discriminant_mp_consts = (RT, RT6, b, a_alpha, delta, epsilon)
+        P = mp.mpf(P)
         x0 = P*P
         x1 = P*b + RT
         x2 = a_alpha*b + epsilon*x1
@@ -4305,7 +5168,7 @@ class GCEOS(object):
         x2_2 = x2*x2
         x5_2 = x5*x5
         x6_2 = x6*x6
-        disc = (x0*(18.0*P*x2*x5*x6 + 4.0*P*(-a_alpha - x3 + x4)**3
+        disc = (x0*(18.0*P*x2*x5*x6 - 4.0*P*x6_2*x6
                    - 27.0*x0*x2_2 - 4.0*x2*x5_2*x5 + x5_2*x6_2)/RT6)
         return disc
 
@@ -4439,77 +5302,7 @@ class GCEOS(object):
         >>> base = -(expand(disc/P**2*R**3*T**3))
         >>> sln = collect(base, P)
         '''
-        # Can also have one at g
-#        T, a_alpha = self.T, self.a_alpha
-        a = a_alpha
-#        b, epsilon, delta = self.b, self.epsilon, self.delta
-
-        T_inv = 1.0/T
-        # TODO cse
-        x0 = 4.0*a
-        x1 = b*x0
-        x2 = a+a
-        x3 = delta*x2
-        x4 = R*T
-        x5 = 4.0*epsilon
-        x6 = delta*delta
-        x7 = a*a
-        x8 = T_inv*R_inv
-        x9 = 8.0*epsilon
-        x10 = b*x9
-        x11 = 4.0*delta
-        x12 = delta*x6
-        x13 = 2.0*x6
-        x14 = b*x13
-        x15 = a*x8
-        x16 = epsilon*x15
-        x20 = x8*x8
-        x17 = x20*x8
-        x18 = b*delta
-        x19 = 6.0*x15
-        x21 = x20*x7
-        x22 = 10.0*b
-        x23 = b*b
-        x24 = 6.0*x23
-        x25 = x0*x8
-        x26 = x6*x6
-        x27 = epsilon*epsilon
-        x28 = 8.0*x27
-        x29 = 24.0*epsilon
-        x30 = b*x12
-        x31 = epsilon*x13
-        x32 = epsilon*x8
-        x33 = 12.0*epsilon
-        x34 = b*x23
-        x35 = x2*x8
-        x36 = 8.0*x21
-        x37 = x15*x6
-        x38 = delta*x23
-        x39 = b*x28
-        x40 = x34*x9
-        x41 = epsilon*x12
-        x42 = x23*x23
-
-        e = x1 + x3 + x4*x5 - x4*x6 - x7*x8
-        d = (4.0*x7*a*x17 - 10.0*delta*x21 + 2.0*(epsilon*x11 + x10 - x12
-             - x14 + x15*x24 + x18*x19 - x21*x22 + x25*x6) - 20.0*x16)
-        c = x8*(-x1*x32 + x12*x35 + x15*(12.0*x34 + 18.0*x38) + x18*(x29 + x36)
-                + x21*(x33 - x6) + x22*x37 + x23*(x29 + x36) - x24*x6 - x26
-                + x28 - x3*x32 - 6.0*x30 + x31)
-        b_coeff = (2.0*x20*(-b*x26 + delta*(x10*x15 + x25*x34) + epsilon*x14
-                            + x23*(x15*x9 - 3.0*x12 + x37) - x13*x34 - x15*x30
-                            -x16*x6 + x27*(x19 + x11) + x33*x38 + x35*x42
-                            + x39 + x40 - x41))
-        a_coeff = x17*(-2.0*b*x41 + delta*(x39 + x40)
-                       + x27*(4.0*epsilon - x6)
-                       - 2.0*x12*x34 + x23*(x28 + x31 - x26)
-                       + x42*(x5 - x6))
-
-#        e = (2*a*delta + 4*a*b -R*T*delta**2 - a**2/(R*T) + 4*R*T*epsilon)
-#        d = (-4*b*delta**2 + 16*b*epsilon - 2*delta**3 + 8*delta*epsilon + 12*a*b**2/(R*T) + 12*a*b*delta/(R*T) + 8*a*delta**2/(R*T) - 20*a*epsilon/(R*T) - 20*a**2*b/(R**2*T**2) - 10*a**2*delta/(R**2*T**2) + 4*a**3/(R**3*T**3))
-#        c = (-6*b**2*delta**2/(R*T) + 24*b**2*epsilon/(R*T) - 6*b*delta**3/(R*T) + 24*b*delta*epsilon/(R*T) - delta**4/(R*T) + 2*delta**2*epsilon/(R*T) + 8*epsilon**2/(R*T) + 12*a*b**3/(R**2*T**2) + 18*a*b**2*delta/(R**2*T**2) + 10*a*b*delta**2/(R**2*T**2) - 4*a*b*epsilon/(R**2*T**2) + 2*a*delta**3/(R**2*T**2) - 2*a*delta*epsilon/(R**2*T**2) + 8*a**2*b**2/(R**3*T**3) + 8*a**2*b*delta/(R**3*T**3) - a**2*delta**2/(R**3*T**3) + 12*a**2*epsilon/(R**3*T**3))
-#        b_coeff = (-4*b**3*delta**2/(R**2*T**2) + 16*b**3*epsilon/(R**2*T**2) - 6*b**2*delta**3/(R**2*T**2) + 24*b**2*delta*epsilon/(R**2*T**2) - 2*b*delta**4/(R**2*T**2) + 4*b*delta**2*epsilon/(R**2*T**2) + 16*b*epsilon**2/(R**2*T**2) - 2*delta**3*epsilon/(R**2*T**2) + 8*delta*epsilon**2/(R**2*T**2) + 4*a*b**4/(R**3*T**3) + 8*a*b**3*delta/(R**3*T**3) + 2*a*b**2*delta**2/(R**3*T**3) + 16*a*b**2*epsilon/(R**3*T**3) - 2*a*b*delta**3/(R**3*T**3) + 16*a*b*delta*epsilon/(R**3*T**3) - 2*a*delta**2*epsilon/(R**3*T**3) + 12*a*epsilon**2/(R**3*T**3))
-#        a_coeff = (-b**4*delta**2/(R**3*T**3) + 4*b**4*epsilon/(R**3*T**3) - 2*b**3*delta**3/(R**3*T**3) + 8*b**3*delta*epsilon/(R**3*T**3) - b**2*delta**4/(R**3*T**3) + 2*b**2*delta**2*epsilon/(R**3*T**3) + 8*b**2*epsilon**2/(R**3*T**3) - 2*b*delta**3*epsilon/(R**3*T**3) + 8*b*delta*epsilon**2/(R**3*T**3) - delta**2*epsilon**2/(R**3*T**3) + 4*epsilon**3/(R**3*T**3))
+        a_coeff, b_coeff, c, d, e = eos_P_discriminant_zero_coeffs(T, b, delta, epsilon, a_alpha)
         roots = roots_quartic(a_coeff, b_coeff, c, d, e)
 #        roots = np.roots([a_coeff, b_coeff, c, d, e]).tolist()
         if valid:
@@ -4519,50 +5312,46 @@ class GCEOS(object):
             roots.sort()
         return roots
 
+    @staticmethod
+    def P_discriminant_zeros_analytical_vec(Ts, b, delta, epsilon, a_alphas):
+        r'''Vectorized form of :obj:`GCEOS.P_discriminant_zeros_analytical`,
+        calculating the pressures which zero the discriminant for many states
+        at once.
+
+        Parameters
+        ----------
+        Ts : array-like
+            Temperatures, [K]
+        b : float or array-like
+            Coefficient calculated by EOS-specific method, [m^3/mol]
+        delta : float or array-like
+            Coefficient calculated by EOS-specific method, [m^3/mol]
+        epsilon : float or array-like
+            Coefficient calculated by EOS-specific method, [m^6/mol^2]
+        a_alphas : array-like
+            Coefficients calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+        Returns
+        -------
+        P_discriminant_zeros : ndarray
+            Complex pressures which make the discriminants zero, one row of
+            four per state, [Pa]
+
+        Notes
+        -----
+        The quartic coefficients are computed in one NumPy pass; all quartics
+        are then solved together as the eigenvalues of a stack of companion
+        matrices.
+        '''
+        return polyroots_vec(eos_P_discriminant_zero_coeffs(
+                np.asarray(Ts, dtype=float), b, delta, epsilon,
+                np.asarray(a_alphas, dtype=float)))
+
 
     def _P_discriminant_zero(self, low):
         # Can also have one at g
         T, a_alpha = self.T, self.a_alpha
         b, epsilon, delta = self.b, self.epsilon, self.delta
-        global niter
-        niter = 0
-        RT = R*T
-        x13 = RT**-6.0
-        x14 = b*epsilon
-        x15 = -b*delta + epsilon
-        x18 = b - delta
-        def discriminant_fun(P):
-            if P < 0:
-                raise ValueError("Will not converge")
-            global niter
-            niter += 1
-            x0 = P*P
-            x1 = P*epsilon
-            x2 = P*b + RT
-            x3 = a_alpha - delta*x2 + x1
-            x3_x3 = x3*x3
-            x4 = x3*x3_x3
-            x5 = a_alpha*b + epsilon*x2
-            x6 = 27.0*x5*x5
-            x7 = -P*delta + x2
-            x9 = x7*x7
-            x8 = x7*x9
-            x11 = x3*x5*x7
-            x12 = -18.0*P*x11 + 4.0*(P*x4 +x5*x8) + x0*x6 - x3_x3*x9
-            x16 = P*x15
-            x17 = 9.0*x3
-            x19 = x18*x5
-            # 26 mult so far
-            err = -x0*x12*x13
-            fprime = (-2.0*P*x13*(P*(-P*x17*x19 + P*x6 - b*x1*x17*x7
-                                     + 27.0*x0*x14*x5 + 6.0*x3_x3*x16 - x3_x3*x18*x7
-                                     - 9.0*x11 + 2.0*x14*x8 - x15*x3*x9 - 9.0*x16*x5*x7 + 6.0*x19*x9 + 2.0*x4) + x12))
-
-            if niter > 3 and (.40 < (err/(P*fprime)) < 0.55):
-                raise ValueError("Not going to work")
-                # a = (err/fprime)/P
-                # print('low probably kill point')
-            return err, fprime
 
         # New answer: Above critical T only high P result
         # Ps = logspace(log10(1), log10(1e10), 40000)
@@ -4594,7 +5383,7 @@ class GCEOS(object):
             Tc = self.Tc
         except:
             Tc = self.pseudo_Tc
-
+        Tr = T/Tc
 
         guesses = [1e5, 1e6, 1e7, 1e8, 1e9, .5, 1e-4, 1e-8, 1e-12, 1e-16, 1e-20]
         if not low:
@@ -4615,9 +5404,11 @@ class GCEOS(object):
         if low:
             coeffs = self._P_zero_l_cheb_coeffs
             coeffs_low, coeffs_high = self.P_zero_l_cheb_limits
+            constant, factor = self._P_zero_l_cheb_affine
         else:
             coeffs = self._P_zero_g_cheb_coeffs
             coeffs_low, coeffs_high = self.P_zero_g_cheb_limits
+            constant, factor = self._P_zero_g_cheb_affine
 
 
         if coeffs is not None:
@@ -4632,24 +5423,19 @@ class GCEOS(object):
             except:
                 Pc = self.pseudo_Pc
 
-            Tr = self.T/Tc
             alpha_Tr = alpha/(Tr)
             x = alpha_Tr - 1.0
             if coeffs_low < x <  coeffs_high:
-                constant = 0.5*(-coeffs_low - coeffs_high)
-                factor = 2.0/(coeffs_high - coeffs_low)
-
                 y = chebval(factor*(x + constant), coeffs)
                 P_trans = y*Tr*Pc
 
                 guesses.insert(0, P_trans)
 
 
-        global_iter = 0
+        history = []
+        low_bound = None
         for P in guesses:
             try:
-                global_iter += niter
-                niter = 0
                 # try:
                 #     P_disc = newton(discriminant_fun, P, fprime=True, xtol=1e-16, low=1, maxiter=200, bisection=False, damping=1)
                 # except:
@@ -4667,20 +5453,32 @@ class GCEOS(object):
                         low_bound = 1.0
                     else:
                         low_bound = None
-                P_disc = newton(discriminant_fun, P, fprime=True, xtol=4e-12, low=low_bound,
-                                maxiter=80, bisection=False, damping=1)
+                P_disc = eos_P_discriminant_zero_newton(P, T, b, delta, epsilon, a_alpha,
+                                                        low=low_bound, xtol=4e-12, maxiter=80,
+                                                        history=history)
                 assert P_disc > 0 and not P_disc == 1
                 if not low:
                     assert P_disc > low_bound
                 break
             except:
-                pass
+                # Failed guesses still map out the error curve; once any two
+                # evaluated points straddle a zero, bracket it instead of
+                # starting newton again from the next guess
+                points = sorted(history)
+                P_min = low_bound if low_bound is not None else 0.0
+                brackets = [(points[i][0], points[i+1][0]) for i in range(len(points) - 1)
+                            if points[i][1]*points[i+1][1] < 0.0 and points[i][0] > P_min]
+                if brackets:
+                    P_low, P_high = brackets[0] if low else brackets[-1]
+                    try:
+                        P_disc = brenth(lambda P: self.discriminant(P=P), P_low, P_high, rtol=4e-12)
+                        break
+                    except:
+                        pass
 
         if not low:
             assert P_disc > low_bound
 
-
-        global_iter += niter
         # for i in range(1000):
         #     a = 1
 
@@ -4770,26 +5568,7 @@ class GCEOS(object):
         ((9.309597822372529e-05-0.00015876248805149625j), (9.309597822372529e-05+0.00015876248805149625j), (0.005064847204219234+0j))
         '''
         # Can also have one at g
-        global niter
-        niter = 0
-        guesses = [100, 150, 200, 250, 300, 350, 400, 450]
-        if T_guess is not None:
-            guesses.append(T_guess)
-        if self.N == 1:
-            pass
-
-        global_iter = 0
-        for T in guesses:
-            try:
-                global_iter += niter
-                niter = 0
-                T_disc = secant(lambda T: self.discriminant(T=T), T, xtol=1e-10, low=1, maxiter=60, bisection=False, damping=1)
-                assert T_disc > 0 and not T_disc == 1
-                break
-            except:
-                pass
-        global_iter += niter
-        return T_disc
+        return self._T_discriminant_zero(T_discriminant_zero_l_guesses, T_guess, low=True)
 
     def T_discriminant_zero_g(self, T_guess=None):
         r'''Method to calculate the temperature which zeros the discriminant
@@ -4825,26 +5604,38 @@ class GCEOS(object):
         >>> eos.to(P=eos.P, T=T_trans).mpmath_volumes_float
         ((9.309597822372529e-05-0.00015876248805149625j), (9.309597822372529e-05+0.00015876248805149625j), (0.005064847204219234+0j))
         '''
-        global niter
-        niter = 0
-        guesses = [700, 600, 500, 400, 300, 200]
+        return self._T_discriminant_zero(T_discriminant_zero_g_guesses, T_guess, low=False)
+
+    def _T_discriminant_zero(self, guesses, T_guess, low):
+        guesses = list(guesses)
         if T_guess is not None:
             guesses.append(T_guess)
-        if self.N == 1:
-            pass
 
-        global_iter = 0
-        for T in guesses:
+        # Evaluate every guess in one pass; a sign change between neighbouring
+        # guesses is solved directly with a bracketed solver
+        errs = self.discriminant_vec(guesses).tolist()
+        points = sorted(zip(guesses, errs))
+        brackets = [(points[i][0], points[i+1][0]) for i in range(len(points) - 1)
+                    if points[i][1]*points[i+1][1] < 0.0]
+        if not brackets:
+            # Scan a log-spaced grid out to the far supercritical region
             try:
-                global_iter += niter
-                niter = 0
-                T_disc = secant(lambda T: self.discriminant(T=T), T, xtol=1e-10, low=1, maxiter=60, bisection=False, damping=1)
-                assert T_disc > 0 and not T_disc == 1
-                break
+                Tc = self.Tc
+            except:
+                Tc = self.pseudo_Tc
+            Ts = np.logspace(log10(50.0), log10(5.0*Tc), 16)
+            grid_errs = self.discriminant_vec(Ts)
+            brackets = [(float(Ts[i]), float(Ts[i+1])) for i in range(len(Ts) - 1)
+                        if grid_errs[i]*grid_errs[i+1] < 0.0]
+        if brackets:
+            T_low, T_high = brackets[0] if low else brackets[-1]
+            try:
+                return brenth(lambda T: self.discriminant(T=T), T_low, T_high, xtol=1e-10)
             except:
                 pass
-        global_iter += niter
-        return T_disc
+
+        # No sign change anywhere on the guesses or the grid
+        raise ValueError("Could not converge")
 
     def P_PIP_transition(self, T, low_P_limit=0.0):
         r'''Method to calculate the pressure which makes the phase
@@ -4906,14 +5697,16 @@ class GCEOS(object):
                     return e.PIP_g-1.0
         try:
             # Near the critical point these equations turn extremely nasty!
-            # bisection is the most reliable solver
+            # a bracketing solver is required; working in ln(P) reduces the
+            # fourteen decade bracket to a span of ~32
             if subcritical:
                 Psat = self.Psat(T)
                 low, high = 10.0*Psat, Psat
             else:
                 low, high = 1e-3, 1e11
-            P = bisect(to_solve, low, high)
-            return P
+            lnP = chandrupatla(lambda lnP: to_solve(exp(lnP)), log(low), log(high),
+                               xtol=1e-13)
+            return exp(lnP)
         except:
             err_low = to_solve(low_P_limit)
             if abs(err_low) < 1e-9:
@@ -4926,22 +5719,36 @@ class GCEOS(object):
 
 
 
+    def _to_TP_same_zs(self, T, P):
+        if self.multicomponent:
+            return self.to_TP_zs(T=T, P=P, zs=self.zs)
+        return self.to_TP(T, P)
+
     def _V_g_extrapolated(self):
-        P_pseudo_mc = sum([self.Pcs[i]*self.zs[i] for i in self.cmps])
-        T_pseudo_mc = sum([(self.Tcs[i]*self.Tcs[j])**0.5*self.zs[j]*self.zs[i]
-                           for i in self.cmps for j in self.cmps])
-        V_pseudo_mc = (self.Zc*R*T_pseudo_mc)/P_pseudo_mc
-        rho_pseudo_mc = 1.0/V_pseudo_mc
+        if not self.multicomponent:
+            # The pseudo-critical point of a pure component is its critical point
+            rho_pseudo_mc = 1.0/self.Vc
+        else:
+            # The double sum of sqrt(Tci*Tcj)*zi*zj factors into the square of
+            # sum(zi*sqrt(Tci)), so only N square roots are needed
+            zs, Tcs, Pcs = self.zs, self.Tcs, self.Pcs
+            P_pseudo_mc = zs_sqrt_Tcs = 0.0
+            for i in self.cmps:
+                P_pseudo_mc += Pcs[i]*zs[i]
+                zs_sqrt_Tcs += sqrt(Tcs[i])*zs[i]
+            T_pseudo_mc = zs_sqrt_Tcs*zs_sqrt_Tcs
+            V_pseudo_mc = (self.Zc*R*T_pseudo_mc)/P_pseudo_mc
+            rho_pseudo_mc = 1.0/V_pseudo_mc
 
         P_disc = self.P_discriminant_zero_l()
 
         try:
             P_low = max(P_disc - 10.0, 1e-3)
-            eos_low = self.to_TP_zs(T=self.T, P=P_low, zs=self.zs)
+            eos_low = self._to_TP_same_zs(self.T, P_low)
             rho_low = 1.0/eos_low.V_g
         except:
             P_low = max(P_disc + 10.0, 1e-3)
-            eos_low = self.to_TP_zs(T=self.T, P=P_low, zs=self.zs)
+            eos_low = self._to_TP_same_zs(self.T, P_low)
             rho_low = 1.0/eos_low.V_g
 
         rho0 = (rho_low + 1.4*rho_pseudo_mc)*0.5
@@ -4953,59 +5760,138 @@ class GCEOS(object):
         rho_ans = rho0 + rho1/eos_low.P + rho2/(eos_low.P*eos_low.P)
         return 1.0/rho_ans
 
-    @property
+    @cached_property
+    def _inv_disc(self):
+        # 1/(delta^2 - 4 epsilon), kept finite for models where it is zero
+        disc = self.delta*self.delta - 4.0*self.epsilon
+        if disc == 0.0:
+            disc = 1e-100
+        return 1.0/disc
+
+    @cached_property
+    def _inv_sqrt_disc(self):
+        return sqrt(self._inv_disc)
+
+    @cached_property
+    def _T_da_alpha_dT_minus_a_alpha(self):
+        # Common factor of the departure enthalpy and its derivatives
+        return self.T*self.da_alpha_dT - self.a_alpha
+
+    @cached_property
+    def _d2HS_dep_dT2_l(self):
+        return _departure_second_T_derivatives(
+                self.T, self.P, self.V_l, self.b, self.dV_dT_l, self.d2V_dT2_l,
+                self.da_alpha_dT, self.d2a_alpha_dT2, self.d3a_alpha_dT3,
+                self._T_da_alpha_dT_minus_a_alpha, self._inv_sqrt_disc,
+                self._atanh_term_l, self._delta_2V_l, self._disc_denom_inv_l)
+
+    @cached_property
+    def _d2HS_dep_dT2_g(self):
+        return _departure_second_T_derivatives(
+                self.T, self.P, self.V_g, self.b, self.dV_dT_g, self.d2V_dT2_g,
+                self.da_alpha_dT, self.d2a_alpha_dT2, self.d3a_alpha_dT3,
+                self._T_da_alpha_dT_minus_a_alpha, self._inv_sqrt_disc,
+                self._atanh_term_g, self._delta_2V_g, self._disc_denom_inv_g)
+
+    @cached_property
+    def _delta_2V_l(self):
+        return self.delta + 2.0*self.V_l
+
+    @cached_property
+    def _delta_2V_g(self):
+        return self.delta + 2.0*self.V_g
+
+    @cached_property
+    def _disc_denom_inv_l(self):
+        # 1/((delta + 2V)^2 - (delta^2 - 4 epsilon)) at `V_l`, the denominator
+        # of the a_alpha terms of the departure derivatives; expanded so it
+        # does not cancel and stays finite when delta^2 = 4 epsilon
+        V = self.V_l
+        return 0.25/(V*(self.delta + V) + self.epsilon)
+
+    @cached_property
+    def _disc_denom_inv_g(self):
+        V = self.V_g
+        return 0.25/(V*(self.delta + V) + self.epsilon)
+
+    @cached_property
+    def _atanh_term_l(self):
+        # Real part of atanh((2V + delta)/sqrt(delta^2 - 4 epsilon)) at `V_l`;
+        # shared by the departure enthalpy and entropy derivatives
+        x0 = self._inv_sqrt_disc
+        return _atanh_real(x0*self._delta_2V_l)
+
+    @cached_property
+    def _atanh_term_g(self):
+        # Real part of atanh((2V + delta)/sqrt(delta^2 - 4 epsilon)) at `V_g`
+        x0 = self._inv_sqrt_disc
+        return _atanh_real(x0*self._delta_2V_g)
+
+    @cached_property
+    def _T_inv(self):
+        return 1.0/self.T
+
+    @cached_property
+    def _RT_inv(self):
+        return R_inv/self.T
+
+    @cached_property
+    def _RT(self):
+        return R*self.T
+
+    @cached_property
+    def _RT6_inv(self):
+        # Temperature-only group reused by every discriminant evaluation
+        RT2 = self._RT*self._RT
+        return 1.0/(RT2*RT2*RT2)
+
+    @cached_property
+    def _P_inv(self):
+        return 1.0/self.P
+
+    @cached_property
     def fugacity_l(self):
         r'''Fugacity for the liquid phase, [Pa].
 
         .. math::
             \text{fugacity} = P\exp\left(\frac{G_{dep}}{RT}\right)
         '''
-        arg = self.G_dep_l*R_inv/self.T
-        try:
-            return self.P*exp(arg)
-        except:
-            return self.P*1e308
+        return self.P*self.phi_l
 
-    @property
+    @cached_property
     def fugacity_g(self):
         r'''Fugacity for the gas phase, [Pa].
 
         .. math::
             \text{fugacity} = P\exp\left(\frac{G_{dep}}{RT}\right)
         '''
-        arg = self.G_dep_g*R_inv/self.T
-        try:
-            return self.P*exp(arg)
-        except:
-            return self.P*1e308
+        return self.P*self.phi_g
 
-    @property
+    @cached_property
     def phi_l(self):
         r'''Fugacity coefficient for the liquid phase, [Pa].
 
         .. math::
             \phi = \frac{\text{fugacity}}{P}
         '''
-        arg = self.G_dep_l*R_inv/self.T
-        try:
-            return exp(arg)
-        except:
+        arg = self.G_dep_l*self._RT_inv
+        if arg > ln_float_max:
             return 1e308
+        return exp(arg)
 
-    @property
+    @cached_property
     def phi_g(self):
         r'''Fugacity coefficient for the gas phase, [Pa].
 
         .. math::
             \phi = \frac{\text{fugacity}}{P}
         '''
-        arg = self.G_dep_g*R_inv/self.T
-        try:
-            return exp(arg)
-        except:
+        arg = self.G_dep_g*self._RT_inv
+        if arg > ln_float_max:
             return 1e308
+        return exp(arg)
 
-    @property
+    @cached_property
     def Cp_minus_Cv_l(self):
         r'''Cp - Cv for the liquid phase, [J/mol/K].
 
@@ -5015,7 +5901,7 @@ class GCEOS(object):
         '''
         return -self.T*self.dP_dT_l*self.dP_dT_l*self.dV_dP_l
 
-    @property
+    @cached_property
     def Cp_minus_Cv_g(self):
         r'''Cp - Cv for the gas phase, [J/mol/K].
 
@@ -5025,7 +5911,7 @@ class GCEOS(object):
         '''
         return -self.T*self.dP_dT_g*self.dP_dT_g*self.dV_dP_g
 
-    @property
+    @cached_property
     def beta_l(self):
         r'''Isobaric (constant-pressure) expansion coefficient for the liquid
         phase, [1/K].
@@ -5033,9 +5919,9 @@ class GCEOS(object):
         .. math::
             \beta = \frac{1}{V}\frac{\partial V}{\partial T}
         '''
-        return self.dV_dT_l/self.V_l
+        return self.dV_dT_l*self.rho_l
 
-    @property
+    @cached_property
     def beta_g(self):
         r'''Isobaric (constant-pressure) expansion coefficient for the gas
         phase, [1/K].
@@ -5043,9 +5929,9 @@ class GCEOS(object):
         .. math::
             \beta = \frac{1}{V}\frac{\partial V}{\partial T}
         '''
-        return self.dV_dT_g/self.V_g
+        return self.dV_dT_g*self.rho_g
 
-    @property
+    @cached_property
     def kappa_l(self):
         r'''Isothermal (constant-temperature) expansion coefficient for the liquid
         phase, [1/Pa].
@@ -5055,7 +5941,7 @@ class GCEOS(object):
         '''
         return -self.dV_dP_l/self.V_l
 
-    @property
+    @cached_property
     def kappa_g(self):
         r'''Isothermal (constant-temperature) expansion coefficient for the gas
         phase, [1/Pa].
@@ -5065,7 +5951,7 @@ class GCEOS(object):
         '''
         return -self.dV_dP_g/self.V_g
 
-    @property
+    @cached_property
     def V_dep_l(self):
         r'''Departure molar volume from ideal gas behavior for the liquid phase,
         [m^3/mol].
@@ -5073,9 +5959,9 @@ class GCEOS(object):
         .. math::
             V_{dep} = V - \frac{RT}{P}
         '''
-        return self.V_l - self.T*R/self.P
+        return self.V_l - self._RT/self.P
 
-    @property
+    @cached_property
     def V_dep_g(self):
         r'''Departure molar volume from ideal gas behavior for the gas phase,
         [m^3/mol].
@@ -5083,9 +5969,9 @@ class GCEOS(object):
         .. math::
             V_{dep} = V - \frac{RT}{P}
         '''
-        return self.V_g - self.T*R/self.P
+        return self.V_g - self._RT/self.P
 
-    @property
+    @cached_property
     def U_dep_l(self):
         r'''Departure molar internal energy from ideal gas behavior for the
         liquid phase, [J/mol].
@@ -5093,9 +5979,9 @@ class GCEOS(object):
         .. math::
             U_{dep} = H_{dep} - P V_{dep}
         '''
-        return self.H_dep_l - self.P*(self.V_l - self.T*R/self.P)
+        return self.H_dep_l - self.P*self.V_l + self._RT
 
-    @property
+    @cached_property
     def U_dep_g(self):
         r'''Departure molar internal energy from ideal gas behavior for the
         gas phase, [J/mol].
@@ -5103,9 +5989,9 @@ class GCEOS(object):
         .. math::
             U_{dep} = H_{dep} - P V_{dep}
         '''
-        return self.H_dep_g - self.P*(self.V_g - self.T*R/self.P)
+        return self.H_dep_g - self.P*self.V_g + self._RT
 
-    @property
+    @cached_property
     def A_dep_l(self):
         r'''Departure molar Helmholtz energy from ideal gas behavior for the
         liquid phase, [J/mol].
@@ -5113,9 +5999,9 @@ class GCEOS(object):
         .. math::
             A_{dep} = U_{dep} - T S_{dep}
         '''
-        return self.H_dep_l - self.P*(self.V_l - self.T*R/self.P) - self.T*self.S_dep_l
+        return self.U_dep_l - self.T*self.S_dep_l
 
-    @property
+    @cached_property
     def A_dep_g(self):
         r'''Departure molar Helmholtz energy from ideal gas behavior for the
         gas phase, [J/mol].
@@ -5123,7 +6009,17 @@ class GCEOS(object):
         .. math::
             A_{dep} = U_{dep} - T S_{dep}
         '''
-        return self.H_dep_g - self.P*(self.V_g - self.T*R/self.P) - self.T*self.S_dep_g
+        return self.U_dep_g - self.T*self.S_dep_g
+
+    @cached_property
+    def _second_derivs_l(self):
+        return eos_second_derivatives(self.dP_dV_l, self.dP_dT_l, self.d2P_dV2_l,
+                                      self.d2P_dT2_l, self.d2P_dTdV_l)
+
+    @cached_property
+    def _second_derivs_g(self):
+        return eos_second_derivatives(self.dP_dV_g, self.dP_dT_g, self.d2P_dV2_g,
+                                      self.d2P_dT2_g, self.d2P_dTdV_g)
 
     @property
     def d2T_dPdV_l(self):
@@ -5140,10 +6036,7 @@ class GCEOS(object):
             \right]\left(\frac{\partial P}{\partial T}\right)_V^{-3}
 
         '''
-        inverse_dP_dT2 = self.dT_dP_l*self.dT_dP_l
-        inverse_dP_dT3 = inverse_dP_dT2*self.dT_dP_l
-        d2T_dPdV = -(self.d2P_dTdV_l*self.dP_dT_l - self.dP_dV_l*self.d2P_dT2_l)*inverse_dP_dT3
-        return d2T_dPdV
+        return self._second_derivs_l[0]
 
     @property
     def d2T_dPdV_g(self):
@@ -5160,10 +6053,7 @@ class GCEOS(object):
             \right]\left(\frac{\partial P}{\partial T}\right)_V^{-3}
 
         '''
-        inverse_dP_dT2 = self.dT_dP_g*self.dT_dP_g
-        inverse_dP_dT3 = inverse_dP_dT2*self.dT_dP_g
-        d2T_dPdV = -(self.d2P_dTdV_g*self.dP_dT_g - self.dP_dV_g*self.d2P_dT2_g)*inverse_dP_dT3
-        return d2T_dPdV
+        return self._second_derivs_g[0]
 
     @property
     def d2V_dPdT_l(self):
@@ -5179,8 +6069,7 @@ class GCEOS(object):
             \left(\frac{\partial^2 P}{\partial V^2}\right)_T
             \right]\left(\frac{\partial P}{\partial V}\right)_T^{-3}
         '''
-        dV_dP = self.dV_dP_l
-        return -(self.d2P_dTdV_l*self.dP_dV_l - self.dP_dT_l*self.d2P_dV2_l)*dV_dP*dV_dP*dV_dP
+        return self._second_derivs_l[1]
 
     @property
     def d2V_dPdT_g(self):
@@ -5196,8 +6085,7 @@ class GCEOS(object):
             \left(\frac{\partial^2 P}{\partial V^2}\right)_T
             \right]\left(\frac{\partial P}{\partial V}\right)_T^{-3}
         '''
-        dV_dP = self.dV_dP_g
-        return -(self.d2P_dTdV_g*self.dP_dV_g - self.dP_dT_g*self.d2P_dV2_g)*dV_dP*dV_dP*dV_dP
+        return self._second_derivs_g[1]
 
     @property
     def d2T_dP2_l(self):
@@ -5210,8 +6098,7 @@ class GCEOS(object):
             \partial T}\right)^{-3}_V
 
         '''
-        dT_dP = self.dT_dP_l
-        return -self.d2P_dT2_l*dT_dP*dT_dP*dT_dP # unused
+        return self._second_derivs_l[2]
 
     @property
     def d2T_dP2_g(self):
@@ -5224,8 +6111,7 @@ class GCEOS(object):
             \partial T}\right)^{-3}_V
 
         '''
-        dT_dP = self.dT_dP_g
-        return -self.d2P_dT2_g*dT_dP*dT_dP*dT_dP # unused
+        return self._second_derivs_g[2]
 
     @property
     def d2V_dP2_l(self):
@@ -5238,8 +6124,7 @@ class GCEOS(object):
             \partial V}\right)^{-3}_T
 
         '''
-        dV_dP = self.dV_dP_l
-        return -self.d2P_dV2_l*dV_dP*dV_dP*dV_dP
+        return self._second_derivs_l[3]
 
     @property
     def d2V_dP2_g(self):
@@ -5252,8 +6137,7 @@ class GCEOS(object):
             \partial V}\right)^{-3}_T
 
         '''
-        dV_dP = self.dV_dP_g
-        return -self.d2P_dV2_g*dV_dP*dV_dP*dV_dP
+        return self._second_derivs_g[3]
 
     @property
     def d2T_dV2_l(self):
@@ -5274,12 +6158,7 @@ class GCEOS(object):
             \left(\frac{\partial P}{\partial T}\right)_V^{-3}
             \left(\frac{\partial P}{\partial V}\right)_T
         '''
-        dT_dP = self.dT_dP_l
-        dT_dP2 = dT_dP*dT_dP
-
-        d2T_dV2 = dT_dP2*(-(self.d2P_dV2_l*self.dP_dT_l - self.dP_dV_l*self.d2P_dTdV_l)
-                   +(self.d2P_dTdV_l*self.dP_dT_l - self.dP_dV_l*self.d2P_dT2_l)*dT_dP*self.dP_dV_l)
-        return d2T_dV2
+        return self._second_derivs_l[4]
 
     @property
     def d2T_dV2_g(self):
@@ -5300,12 +6179,7 @@ class GCEOS(object):
             \left(\frac{\partial P}{\partial T}\right)_V^{-3}
             \left(\frac{\partial P}{\partial V}\right)_T
         '''
-        dT_dP = self.dT_dP_g
-        dT_dP2 = dT_dP*dT_dP
-
-        d2T_dV2 = dT_dP2*(-(self.d2P_dV2_g*self.dP_dT_g - self.dP_dV_g*self.d2P_dTdV_g)
-                   +(self.d2P_dTdV_g*self.dP_dT_g - self.dP_dV_g*self.d2P_dT2_g)*dT_dP*self.dP_dV_g)
-        return d2T_dV2
+        return self._second_derivs_g[4]
 
 
     @property
@@ -5328,13 +6202,7 @@ class GCEOS(object):
             \left(\frac{\partial P}{\partial T}\right)_V
 
         '''
-        dV_dP = self.dV_dP_l
-        dP_dV = self.dP_dV_l
-        d2P_dTdV = self.d2P_dTdV_l
-        dP_dT = self.dP_dT_l
-        d2V_dT2 = dV_dP*dV_dP*(-(self.d2P_dT2_l*dP_dV - dP_dT*d2P_dTdV) # unused
-                   +(d2P_dTdV*dP_dV - dP_dT*self.d2P_dV2_l)*dV_dP*dP_dT)
-        return d2V_dT2
+        return self._second_derivs_l[5]
 
 
     @property
@@ -5357,15 +6225,9 @@ class GCEOS(object):
             \left(\frac{\partial P}{\partial T}\right)_V
 
         '''
-        dV_dP = self.dV_dP_g
-        dP_dV = self.dP_dV_g
-        d2P_dTdV = self.d2P_dTdV_g
-        dP_dT = self.dP_dT_g
-        d2V_dT2 = dV_dP*dV_dP*(-(self.d2P_dT2_g*dP_dV - dP_dT*d2P_dTdV) # unused
-                   +(d2P_dTdV*dP_dV - dP_dT*self.d2P_dV2_g)*dV_dP*dP_dT)
-        return d2V_dT2
+        return self._second_derivs_g[5]
 
-    @property
+    @cached_property
     def Vc(self):
         r'''Critical volume, [m^3/mol].
 
@@ -5375,7 +6237,7 @@ class GCEOS(object):
         '''
         return self.Zc*R*self.Tc/self.Pc
 
-    @property
+    @cached_property
     def rho_l(self):
         r'''Liquid molar density, [mol/m^3].
 
@@ -5385,7 +6247,7 @@ class GCEOS(object):
         '''
         return 1.0/self.V_l
 
-    @property
+    @cached_property
     def rho_g(self):
         r'''Gas molar density, [mol/m^3].
 
@@ -5407,8 +6269,8 @@ class GCEOS(object):
             \right)
 
         '''
-        T_inv = 1.0/self.T
-        return self.P*R_inv*T_inv*(self.dV_dT_l - self.V_l*T_inv)
+        T_inv = self._T_inv
+        return self.P*self._RT_inv*(self.dV_dT_l - self.V_l*T_inv)
 
     @property
     def dZ_dT_g(self):
@@ -5421,8 +6283,8 @@ class GCEOS(object):
             \right)
 
         '''
-        T_inv = 1.0/self.T
-        return self.P*R_inv*T_inv*(self.dV_dT_g - self.V_g*T_inv)
+        T_inv = self._T_inv
+        return self.P*self._RT_inv*(self.dV_dT_g - self.V_g*T_inv)
 
     @property
     def dZ_dP_l(self):
@@ -5435,7 +6297,7 @@ class GCEOS(object):
             \right)
 
         '''
-        return (self.V_l + self.P*self.dV_dP_l)/(self.T*R)
+        return (self.V_l + self.P*self.dV_dP_l)*self._RT_inv
 
     @property
     def dZ_dP_g(self):
@@ -5448,7 +6310,7 @@ class GCEOS(object):
             \right)
 
         '''
-        return (self.V_g + self.P*self.dV_dP_g)/(self.T*R)
+        return (self.V_g + self.P*self.dV_dP_g)*self._RT_inv
 
     d2V_dTdP_l = d2V_dPdT_l
     d2V_dTdP_g = d2V_dPdT_g
@@ -5515,7 +6377,8 @@ class GCEOS(object):
             -V^2\frac{\partial^2 P}{\partial V^2} - 2V \frac{\partial P}{\partial V}
             \right)
         '''
-        return -self.V_l**2*(-self.V_l**2*self.d2P_dV2_l - 2*self.V_l*self.dP_dV_l)
+        V = self.V_l
+        return V*V*V*(V*self.d2P_dV2_l + 2.0*self.dP_dV_l)
 
     @property
     def d2P_drho2_g(self):
@@ -5527,7 +6390,8 @@ class GCEOS(object):
             -V^2\frac{\partial^2 P}{\partial V^2} - 2V \frac{\partial P}{\partial V}
             \right)
         '''
-        return -self.V_g**2*(-self.V_g**2*self.d2P_dV2_g - 2*self.V_g*self.dP_dV_g)
+        V = self.V_g
+        return V*V*V*(V*self.d2P_dV2_g + 2.0*self.dP_dV_g)
 
     @property
     def d2rho_dP2_l(self):
@@ -5539,7 +6403,9 @@ class GCEOS(object):
             -\frac{\partial^2 V}{\partial P^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial P}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dP2_l/self.V_l**2 + 2*self.dV_dP_l**2/self.V_l**3
+        V_inv = 1.0/self.V_l
+        dV_dP = self.dV_dP_l
+        return V_inv*V_inv*(2.0*dV_dP*dV_dP*V_inv - self.d2V_dP2_l)
 
     @property
     def d2rho_dP2_g(self):
@@ -5551,7 +6417,9 @@ class GCEOS(object):
             -\frac{\partial^2 V}{\partial P^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial P}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dP2_g/self.V_g**2 + 2*self.dV_dP_g**2/self.V_g**3
+        V_inv = 1.0/self.V_g
+        dV_dP = self.dV_dP_g
+        return V_inv*V_inv*(2.0*dV_dP*dV_dP*V_inv - self.d2V_dP2_g)
 
 
     @property
@@ -5560,7 +6428,7 @@ class GCEOS(object):
         liquid phase, [K/(mol/m^3)].
 
         .. math::
-            \frac{\partial T}{\partial \rho} = V^2 \frac{\partial T}{\partial V}
+            \frac{\partial T}{\partial \rho} = -V^2 \frac{\partial T}{\partial V}
         '''
         return -self.V_l*self.V_l*self.dT_dV_l
 
@@ -5570,7 +6438,7 @@ class GCEOS(object):
         gas phase, [K/(mol/m^3)].
 
         .. math::
-            \frac{\partial T}{\partial \rho} = V^2 \frac{\partial T}{\partial V}
+            \frac{\partial T}{\partial \rho} = -V^2 \frac{\partial T}{\partial V}
         '''
         return -self.V_g*self.V_g*self.dT_dV_g
 
@@ -5581,9 +6449,11 @@ class GCEOS(object):
 
         .. math::
             \frac{\partial^2 T}{\partial \rho^2} =
-            -V^2(-V^2 \frac{\partial^2 T}{\partial V^2} -2V \frac{\partial T}{\partial V}  )
+            V^3\left(V \frac{\partial^2 T}{\partial V^2}
+            + 2\frac{\partial T}{\partial V}\right)
         '''
-        return -self.V_l**2*(-self.V_l**2*self.d2T_dV2_l - 2*self.V_l*self.dT_dV_l)
+        V = self.V_l
+        return V*V*V*(V*self.d2T_dV2_l + 2.0*self.dT_dV_l)
 
     @property
     def d2T_drho2_g(self):
@@ -5592,9 +6462,11 @@ class GCEOS(object):
 
         .. math::
             \frac{\partial^2 T}{\partial \rho^2} =
-            -V^2(-V^2 \frac{\partial^2 T}{\partial V^2} -2V \frac{\partial T}{\partial V}  )
+            V^3\left(V \frac{\partial^2 T}{\partial V^2}
+            + 2\frac{\partial T}{\partial V}\right)
         '''
-        return -self.V_g**2*(-self.V_g**2*self.d2T_dV2_g - 2*self.V_g*self.dT_dV_g)
+        V = self.V_g
+        return V*V*V*(V*self.d2T_dV2_g + 2.0*self.dT_dV_g)
 
 
     @property
@@ -5629,7 +6501,9 @@ class GCEOS(object):
             -\frac{\partial^2 V}{\partial T^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial T}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dT2_l/self.V_l**2 + 2*self.dV_dT_l**2/self.V_l**3
+        V_inv = 1.0/self.V_l
+        dV_dT = self.dV_dT_l
+        return V_inv*V_inv*(2.0*dV_dT*dV_dT*V_inv - self.d2V_dT2_l)
 
     @property
     def d2rho_dT2_g(self):
@@ -5641,7 +6515,9 @@ class GCEOS(object):
             -\frac{\partial^2 V}{\partial T^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial T}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dT2_g/self.V_g**2 + 2*self.dV_dT_g**2/self.V_g**3
+        V_inv = 1.0/self.V_g
+        dV_dT = self.dV_dT_g
+        return V_inv*V_inv*(2.0*dV_dT*dV_dT*V_inv - self.d2V_dT2_g)
 
     @property
     def d2P_dTdrho_l(self):
@@ -5665,7 +6541,7 @@ class GCEOS(object):
         '''
         return -(self.V_g*self.V_g)*self.d2P_dTdV_g
 
-    @property
+    @cached_property
     def d2T_dPdrho_l(self):
         r'''Derivative of temperature with respect to molar density, and
         pressure for the liquid phase, [K/(Pa*mol/m^3)].
@@ -5676,7 +6552,7 @@ class GCEOS(object):
         '''
         return -(self.V_l*self.V_l)*self.d2T_dPdV_l
 
-    @property
+    @cached_property
     def d2T_dPdrho_g(self):
         r'''Derivative of temperature with respect to molar density, and
         pressure for the gas phase, [K/(Pa*mol/m^3)].
@@ -5687,7 +6563,7 @@ class GCEOS(object):
         '''
         return -(self.V_g*self.V_g)*self.d2T_dPdV_g
 
-    @property
+    @cached_property
     def d2rho_dPdT_l(self):
         r'''Second derivative of molar density with respect to pressure
         and temperature for the liquid phase, [(mol/m^3)/(K*Pa)].
@@ -5699,9 +6575,10 @@ class GCEOS(object):
             \left(\frac{\partial V}{\partial P}\right)
             \frac{1}{V^3}
         '''
-        return -self.d2V_dPdT_l/self.V_l**2 + 2*self.dV_dT_l*self.dV_dP_l/self.V_l**3
+        V_inv = 1.0/self.V_l
+        return V_inv*V_inv*(2.0*self.dV_dT_l*self.dV_dP_l*V_inv - self.d2V_dPdT_l)
 
-    @property
+    @cached_property
     def d2rho_dPdT_g(self):
         r'''Second derivative of molar density with respect to pressure
         and temperature for the gas phase, [(mol/m^3)/(K*Pa)].
@@ -5713,9 +6590,10 @@ class GCEOS(object):
             \left(\frac{\partial V}{\partial P}\right)
             \frac{1}{V^3}
         '''
-        return -self.d2V_dPdT_g/self.V_g**2 + 2*self.dV_dT_g*self.dV_dP_g/self.V_g**3
+        V_inv = 1.0/self.V_g
+        return V_inv*V_inv*(2.0*self.dV_dT_g*self.dV_dP_g*V_inv - self.d2V_dPdT_g)
 
-    @property
+    @cached_property
     def dH_dep_dT_l(self):
         r'''Derivative of departure enthalpy with respect to
         temperature for the liquid phase, [(J/mol)/K].
@@ -5732,20 +6610,12 @@ class GCEOS(object):
                 \right) \left(- \frac{\left(\delta + 2 V{\left (T \right )}
                 \right)^{2}}{\delta^{2} - 4 \epsilon} + 1\right)}
         '''
-        x0 = self.V_l
         x1 = self.dV_dT_l
-        x2 = self.a_alpha
-        x3 = self.delta*self.delta - 4.0*self.epsilon
-        if x3 == 0.0:
-            x3 = 1e-100
+        x4 = self._inv_sqrt_disc
+        return (self.P*x1 - R + 2.0*self.T*x4*self._atanh_term_l*self.d2a_alpha_dT2
+                - 4.0*x1*self._T_da_alpha_dT_minus_a_alpha*self._disc_denom_inv_l)
 
-        x4 = x3**-0.5
-        x5 = self.delta + x0 + x0
-        x6 = 1.0/x3
-        return (self.P*x1 - R + 2.0*self.T*x4*catanh(x4*x5).real*self.d2a_alpha_dT2
-                - 4.0*x1*x6*(self.T*self.da_alpha_dT - x2)/(x5*x5*x6 - 1.0))
-
-    @property
+    @cached_property
     def dH_dep_dT_g(self):
         r'''Derivative of departure enthalpy with respect to
         temperature for the gas phase, [(J/mol)/K].
@@ -5765,19 +6635,13 @@ class GCEOS(object):
         x0 = self.V_g
         x1 = self.dV_dT_g
         if x0 > 1e50:
-            if isinf(self.dV_dT_g) or self.H_dep_g == 0.0:
+            if isinf(x1) or self.H_dep_g == 0.0:
                 return 0.0
-        x2 = self.a_alpha
-        x3 = self.delta*self.delta - 4.0*self.epsilon
-        if x3 == 0.0:
-            x3 = 1e-100
-        x4 = x3**-0.5
-        x5 = self.delta + x0 + x0
-        x6 = 1.0/x3
-        return (self.P*x1 - R + 2.0*self.T*x4*catanh(x4*x5).real*self.d2a_alpha_dT2
-                - 4.0*x1*x6*(self.T*self.da_alpha_dT - x2)/(x5*x5*x6 - 1.0))
+        x4 = self._inv_sqrt_disc
+        return (self.P*x1 - R + 2.0*self.T*x4*self._atanh_term_g*self.d2a_alpha_dT2
+                - 4.0*x1*self._T_da_alpha_dT_minus_a_alpha*self._disc_denom_inv_g)
 
-    @property
+    @cached_property
     def dH_dep_dT_l_V(self):
         r'''Derivative of departure enthalpy with respect to
         temperature at constant volume for the liquid phase, [(J/mol)/K].
@@ -5791,16 +6655,12 @@ class GCEOS(object):
             + V_l \frac{\partial}{\partial T} P{\left(T,V \right)}
         '''
         T = self.T
-        delta, epsilon = self.delta, self.epsilon
         V = self.V_l
         dP_dT = self.dP_dT_l
-        try:
-            x0 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x0 = 1e100
-        return -R + 2.0*T*x0*catanh(x0*(V + V + delta)).real*self.d2a_alpha_dT2 + V*dP_dT
+        x0 = self._inv_sqrt_disc
+        return -R + 2.0*T*x0*self._atanh_term_l*self.d2a_alpha_dT2 + V*dP_dT
 
-    @property
+    @cached_property
     def dH_dep_dT_g_V(self):
         r'''Derivative of departure enthalpy with respect to
         temperature at constant volume for the gas phase, [(J/mol)/K].
@@ -5815,16 +6675,12 @@ class GCEOS(object):
         '''
 
         T = self.T
-        delta, epsilon = self.delta, self.epsilon
         V = self.V_g
         dP_dT = self.dP_dT_g
-        try:
-            x0 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x0 = 1e100
-        return -R + 2.0*T*x0*catanh(x0*(V + V + delta)).real*self.d2a_alpha_dT2 + V*dP_dT
+        x0 = self._inv_sqrt_disc
+        return -R + 2.0*T*x0*self._atanh_term_g*self.d2a_alpha_dT2 + V*dP_dT
 
-    @property
+    @cached_property
     def dH_dep_dP_l(self):
         r'''Derivative of departure enthalpy with respect to
         pressure for the liquid phase, [(J/mol)/Pa].
@@ -5838,14 +6694,11 @@ class GCEOS(object):
             + 2 V{\left (P \right )}\right)^{2}}{\delta^{2} - 4 \epsilon}
             + 1\right)}
         '''
-        delta = self.delta
         x0 = self.V_l
-        x2 = delta*delta - 4.0*self.epsilon
-        x4 = (delta + x0 + x0)
-        return (x0 + self.dV_dP_l*(self.P - 4.0*(self.T*self.da_alpha_dT
-                - self.a_alpha)/(x4*x4 - x2)))
+        return (x0 + self.dV_dP_l*(self.P - 4.0*self._T_da_alpha_dT_minus_a_alpha
+                *self._disc_denom_inv_l))
 
-    @property
+    @cached_property
     def dH_dep_dP_g(self):
         r'''Derivative of departure enthalpy with respect to
         pressure for the gas phase, [(J/mol)/Pa].
@@ -5859,17 +6712,14 @@ class GCEOS(object):
             + 2 V{\left (P \right )}\right)^{2}}{\delta^{2} - 4 \epsilon}
             + 1\right)}
         '''
-        delta = self.delta
         x0 = self.V_g
-        x2 = delta*delta - 4.0*self.epsilon
-        x4 = (delta + x0 + x0)
 #        if isinf(self.dV_dP_g):
             # This does not appear to be correct
 #            return 0.0
-        return (x0 + self.dV_dP_g*(self.P - 4.0*(self.T*self.da_alpha_dT
-                - self.a_alpha)/(x4*x4 - x2)))
+        return (x0 + self.dV_dP_g*(self.P - 4.0*self._T_da_alpha_dT_minus_a_alpha
+                *self._disc_denom_inv_g))
 
-    @property
+    @cached_property
     def dH_dep_dP_l_V(self):
         r'''Derivative of departure enthalpy with respect to
         pressure at constant volume for the gas phase, [(J/mol)/Pa].
@@ -5887,22 +6737,12 @@ class GCEOS(object):
             - 4 \epsilon}}
         '''
 
-        T, V, delta, epsilon = self.T, self.V_l, self.delta, self.epsilon
-        da_alpha_dT, d2a_alpha_dT2 = self.da_alpha_dT, self.d2a_alpha_dT2
-        dT_dP = self.dT_dP_l
-
-        d2a_alpha_dTdP_V = d2a_alpha_dT2*dT_dP
-        da_alpha_dP_V = da_alpha_dT*dT_dP
-        try:
-            x0 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x0 = 1e100
-
-        return (-R*dT_dP + V + 2.0*x0*(
-                T*d2a_alpha_dTdP_V + dT_dP*da_alpha_dT - da_alpha_dP_V)
-                *catanh(x0*(V + V + delta)).real)
+        # The da_alpha_dT*dT_dP - da_alpha_dP_V terms of the expression cancel
+        x0 = self._inv_sqrt_disc
+        return (-R*self.dT_dP_l + self.V_l + 2.0*x0*self.T
+                *self.d2a_alpha_dTdP_l_V*self._atanh_term_l)
 
-    @property
+    @cached_property
     def dH_dep_dP_g_V(self):
         r'''Derivative of departure enthalpy with respect to
         pressure at constant volume for the liquid phase, [(J/mol)/Pa].
@@ -5919,22 +6759,12 @@ class GCEOS(object):
             {\sqrt{\delta^{2} - 4 \epsilon}} \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        T, V, delta, epsilon = self.T, self.V_g, self.delta, self.epsilon
-        da_alpha_dT, d2a_alpha_dT2 = self.da_alpha_dT, self.d2a_alpha_dT2
-        dT_dP = self.dT_dP_g
-
-        d2a_alpha_dTdP_V = d2a_alpha_dT2*dT_dP
-        da_alpha_dP_V = da_alpha_dT*dT_dP
-        try:
-            x0 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x0 = 1e100
+        # The da_alpha_dT*dT_dP - da_alpha_dP_V terms of the expression cancel
+        x0 = self._inv_sqrt_disc
+        return (-R*self.dT_dP_g + self.V_g + 2.0*x0*self.T
+                *self.d2a_alpha_dTdP_g_V*self._atanh_term_g)
 
-        return (-R*dT_dP + V + 2.0*x0*(
-                T*d2a_alpha_dTdP_V + dT_dP*da_alpha_dT - da_alpha_dP_V)
-                *catanh(x0*(V + V + delta)).real)
-
-    @property
+    @cached_property
     def dH_dep_dV_g_T(self):
         r'''Derivative of departure enthalpy with respect to
         volume at constant temperature for the gas phase, [J/m^3].
@@ -5946,7 +6776,7 @@ class GCEOS(object):
         '''
         return self.dH_dep_dP_g*self.dP_dV_g
 
-    @property
+    @cached_property
     def dH_dep_dV_l_T(self):
         r'''Derivative of departure enthalpy with respect to
         volume at constant temperature for the gas phase, [J/m^3].
@@ -5958,7 +6788,7 @@ class GCEOS(object):
         '''
         return self.dH_dep_dP_l*self.dP_dV_l
 
-    @property
+    @cached_property
     def dH_dep_dV_g_P(self):
         r'''Derivative of departure enthalpy with respect to
         volume at constant pressure for the gas phase, [J/m^3].
@@ -5970,7 +6800,7 @@ class GCEOS(object):
         '''
         return self.dH_dep_dT_g*self.dT_dV_g
 
-    @property
+    @cached_property
     def dH_dep_dV_l_P(self):
         r'''Derivative of departure enthalpy with respect to
         volume at constant pressure for the liquid phase, [J/m^3].
@@ -5982,7 +6812,7 @@ class GCEOS(object):
         '''
         return self.dH_dep_dT_l*self.dT_dV_l
 
-    @property
+    @cached_property
     def dS_dep_dT_l(self):
         r'''Derivative of departure entropy with respect to
         temperature for the liquid phase, [(J/mol)/K^2].
@@ -6002,22 +6832,14 @@ class GCEOS(object):
             {R T} \frac{d}{d T} V{\left (T \right )} - \frac{P}{R T^{2}}
             V{\left (T \right )}\right)
         '''
-        x0 = self.V_l
-        x1 = 1./x0
+        # The R/V terms of the ideal-gas part cancel, leaving -R/T
         x2 = self.dV_dT_l
-        x3 = R*x2
-        x4 = self.a_alpha
-        x5 = self.delta*self.delta - 4.0*self.epsilon
-        if x5 == 0.0:
-            x5 = 1e-100
-        x6 = x5**-0.5
-        x7 = self.delta + 2.0*x0
-        x8 = 1.0/x5
-        return (R*x1*(x2 - x0/self.T) - x1*x3 - 4.0*x2*x8*self.da_alpha_dT
-                /(x7*x7*x8 - 1.0) - x3/(self.b - x0)
-                + 2.0*x6*catanh(x6*x7).real*self.d2a_alpha_dT2)
+        x6 = self._inv_sqrt_disc
+        x3 = 4.0*self.da_alpha_dT*self._disc_denom_inv_l
+        return (-R*self._T_inv - x2*(x3 + R/(self.b - self.V_l))
+                + 2.0*x6*self._atanh_term_l*self.d2a_alpha_dT2)
 
-    @property
+    @cached_property
     def dS_dep_dT_g(self):
         r'''Derivative of departure entropy with respect to
         temperature for the gas phase, [(J/mol)/K^2].
@@ -6041,24 +6863,16 @@ class GCEOS(object):
         if x0 > 1e50:
             if self.S_dep_g == 0.0:
                 return 0.0
-        x1 = 1./x0
         x2 = self.dV_dT_g
         if isinf(x2):
             return 0.0
-        x3 = R*x2
-        x4 = self.a_alpha
-
-        x5 = self.delta*self.delta - 4.0*self.epsilon
-        if x5 == 0.0:
-            x5 = 1e-100
-        x6 = x5**-0.5
-        x7 = self.delta + 2.0*x0
-        x8 = 1.0/x5
-        return (R*x1*(x2 - x0/self.T) - x1*x3 - 4.0*x2*x8*self.da_alpha_dT
-                /(x7*x7*x8 - 1.0) - x3/(self.b - x0)
-                + 2.0*x6*catanh(x6*x7).real*self.d2a_alpha_dT2)
+        # The R/V terms of the ideal-gas part cancel, leaving -R/T
+        x6 = self._inv_sqrt_disc
+        x3 = 4.0*self.da_alpha_dT*self._disc_denom_inv_g
+        return (-R*self._T_inv - x2*(x3 + R/(self.b - x0))
+                + 2.0*x6*self._atanh_term_g*self.d2a_alpha_dT2)
 
-    @property
+    @cached_property
     def dS_dep_dT_l_V(self):
         r'''Derivative of departure entropy with respect to
         temperature at constant volume for the liquid phase, [(J/mol)/K^2].
@@ -6072,17 +6886,11 @@ class GCEOS(object):
             \frac{d^{2}}{d T^{2}} \operatorname{a \alpha}{\left(T \right)}}
             {\sqrt{\delta^{2} - 4 \epsilon}}
         '''
-        T, P = self.T, self.P
-        delta, epsilon = self.delta, self.epsilon
-        V = self.V_l
-        dP_dT = self.dP_dT_l
-        try:
-            x1 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x1 = 1e100
-        return (R*(dP_dT/P - 1.0/T) + 2.0*x1*catanh(x1*(V + V + delta)).real*self.d2a_alpha_dT2)
+        x1 = self._inv_sqrt_disc
+        return (R*(self.dP_dT_l*self._P_inv - self._T_inv)
+                + 2.0*x1*self._atanh_term_l*self.d2a_alpha_dT2)
 
-    @property
+    @cached_property
     def dS_dep_dT_g_V(self):
         r'''Derivative of departure entropy with respect to
         temperature at constant volume for the gas phase, [(J/mol)/K^2].
@@ -6096,17 +6904,11 @@ class GCEOS(object):
             \frac{d^{2}}{d T^{2}} \operatorname{a \alpha}{\left(T \right)}}
             {\sqrt{\delta^{2} - 4 \epsilon}}
         '''
-        T, P = self.T, self.P
-        delta, epsilon = self.delta, self.epsilon
-        V = self.V_g
-        dP_dT = self.dP_dT_g
-        try:
-            x1 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x1 = 1e100
-        return (R*(dP_dT/P - 1.0/T) + 2.0*x1*catanh(x1*(V + V + delta)).real*self.d2a_alpha_dT2)
+        x1 = self._inv_sqrt_disc
+        return (R*(self.dP_dT_g*self._P_inv - self._T_inv)
+                + 2.0*x1*self._atanh_term_g*self.d2a_alpha_dT2)
 
-    @property
+    @cached_property
     def dS_dep_dP_l(self):
         r'''Derivative of departure entropy with respect to
         pressure for the liquid phase, [(J/mol)/K/Pa].
@@ -6122,18 +6924,12 @@ class GCEOS(object):
             \right )}} \left(\frac{P}{R T} \frac{d}{d P} V{\left (P \right )}
             + \frac{V{\left (P \right )}}{R T}\right)
         '''
-        x0 = self.V_l
-        x1 = 1.0/x0
+        # The R/V terms of the ideal-gas part cancel, leaving R/P
         x2 = self.dV_dP_l
-        x3 = R*x2
-        try:
-            x4 = 1.0/(self.delta*self.delta - 4.0*self.epsilon)
-        except ZeroDivisionError:
-            x4 = 1e50
-        return (-x1*x3 - 4.0*x2*x4*self.da_alpha_dT/(x4*(self.delta + 2*x0)**2
-                - 1) - x3/(self.b - x0) + R*x1*(self.P*x2 + x0)/self.P)
+        return R*self._P_inv - x2*(4.0*self.da_alpha_dT*self._disc_denom_inv_l
+                                   + R/(self.b - self.V_l))
 
-    @property
+    @cached_property
     def dS_dep_dP_g(self):
         r'''Derivative of departure entropy with respect to
         pressure for the gas phase, [(J/mol)/K/Pa].
@@ -6149,19 +6945,12 @@ class GCEOS(object):
             \right )}} \left(\frac{P}{R T} \frac{d}{d P} V{\left (P \right )}
             + \frac{V{\left (P \right )}}{R T}\right)
         '''
-        x0 = self.V_g
-        x1 = 1.0/x0
+        # The R/V terms of the ideal-gas part cancel, leaving R/P
         x2 = self.dV_dP_g
-        x3 = R*x2
-        try:
-            x4 = 1.0/(self.delta*self.delta - 4.0*self.epsilon)
-        except ZeroDivisionError:
-            x4 = 1e200
-        ans = (-x1*x3 - 4.0*x2*x4*self.da_alpha_dT/(x4*(self.delta + 2*x0)**2
-                - 1) - x3/(self.b - x0) + R*x1*(self.P*x2 + x0)/self.P)
-        return ans
+        return R*self._P_inv - x2*(4.0*self.da_alpha_dT*self._disc_denom_inv_g
+                                   + R/(self.b - self.V_g))
 
-    @property
+    @cached_property
     def dS_dep_dP_g_V(self):
         r'''Derivative of departure entropy with respect to
         pressure at constant volume for the gas phase, [(J/mol)/K/Pa].
@@ -6176,18 +6965,11 @@ class GCEOS(object):
             {R T^{2}{\left(P \right)}}
              + \frac{V}{R T{\left(P \right)}}\right) T{\left(P \right)}}{P V}
         '''
-        T, P, delta, epsilon = self.T, self.P, self.delta, self.epsilon
-        d2a_alpha_dT2 = self.d2a_alpha_dT2
-        V, dT_dP = self.V_g, self.dT_dP_g
-        d2a_alpha_dTdP_V = d2a_alpha_dT2*dT_dP
-        try:
-            x0 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x0 = 1e100
-        return (2.0*x0*catanh(x0*(V + V + delta)).real*d2a_alpha_dTdP_V
-                - R*(P*dT_dP/T - 1.0)/P)
+        x0 = self._inv_sqrt_disc
+        return (2.0*x0*self._atanh_term_g*self.d2a_alpha_dTdP_g_V
+                - R*(self.dT_dP_g*self._T_inv - self._P_inv))
 
-    @property
+    @cached_property
     def dS_dep_dP_l_V(self):
         r'''Derivative of departure entropy with respect to
         pressure at constant volume for the liquid phase, [(J/mol)/K/Pa].
@@ -6202,18 +6984,11 @@ class GCEOS(object):
             {R T^{2}{\left(P \right)}}
              + \frac{V}{R T{\left(P \right)}}\right) T{\left(P \right)}}{P V}
         '''
-        T, P, delta, epsilon = self.T, self.P, self.delta, self.epsilon
-        d2a_alpha_dT2 = self.d2a_alpha_dT2
-        V, dT_dP = self.V_l, self.dT_dP_l
-        d2a_alpha_dTdP_V = d2a_alpha_dT2*dT_dP
-        try:
-            x0 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x0 = 1e100
-        return (2.0*x0*catanh(x0*(V + V + delta)).real*d2a_alpha_dTdP_V
-                - R*(P*dT_dP/T - 1.0)/P)
+        x0 = self._inv_sqrt_disc
+        return (2.0*x0*self._atanh_term_l*self.d2a_alpha_dTdP_l_V
+                - R*(self.dT_dP_l*self._T_inv - self._P_inv))
 
-    @property
+    @cached_property
     def dS_dep_dV_g_T(self):
         r'''Derivative of departure entropy with respect to
         volume at constant temperature for the gas phase, [J/K/m^3].
@@ -6225,7 +7000,7 @@ class GCEOS(object):
         '''
         return self.dS_dep_dP_g*self.dP_dV_g
 
-    @property
+    @cached_property
     def dS_dep_dV_l_T(self):
         r'''Derivative of departure entropy with respect to
         volume at constant temperature for the gas phase, [J/K/m^3].
@@ -6237,7 +7012,7 @@ class GCEOS(object):
         '''
         return self.dS_dep_dP_l*self.dP_dV_l
 
-    @property
+    @cached_property
     def dS_dep_dV_g_P(self):
         r'''Derivative of departure entropy with respect to
         volume at constant pressure for the gas phase, [J/K/m^3].
@@ -6249,7 +7024,7 @@ class GCEOS(object):
         '''
         return self.dS_dep_dT_g*self.dT_dV_g
 
-    @property
+    @cached_property
     def dS_dep_dV_l_P(self):
         r'''Derivative of departure entropy with respect to
         volume at constant pressure for the liquid phase, [J/K/m^3].
@@ -6292,25 +7067,7 @@ class GCEOS(object):
             \operatorname{a\alpha}{\left(T \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        T, P, delta, epsilon = self.T, self.P, self.delta, self.epsilon
-        x0 = self.V_g
-        x1 = self.d2V_dT2_g
-        x2 = self.a_alpha
-        x3 = self.d2a_alpha_dT2
-        x4 = delta*delta - 4.0*epsilon
-        try:
-            x5 = x4**-0.5
-        except:
-            x5 = 1e100
-        x6 = delta + x0 + x0
-        x7 = 2.0*x5*catanh(x5*x6).real
-        x8 = self.dV_dT_g
-        x9 = x5*x5
-        x10 = x6*x6*x9 - 1.0
-        x11 = x9/x10
-        x12 = T*self.da_alpha_dT - x2
-        x50 = self.d3a_alpha_dT3
-        return (P*x1  + x3*x7  + T*x7*x50- 4.0*x1*x11*x12  - 8.0*T*x11*x3*x8 + 16.0*x12*x6*x8*x8*x11*x11)
+        return self._d2HS_dep_dT2_g[0]
 
     d2H_dep_dT2_g_P = d2H_dep_dT2_g
 
@@ -6345,25 +7102,7 @@ class GCEOS(object):
             \operatorname{a\alpha}{\left(T \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        T, P, delta, epsilon = self.T, self.P, self.delta, self.epsilon
-        x0 = self.V_l
-        x1 = self.d2V_dT2_l
-        x2 = self.a_alpha
-        x3 = self.d2a_alpha_dT2
-        x4 = delta*delta - 4.0*epsilon
-        try:
-            x5 = x4**-0.5
-        except:
-            x5 = 1e100
-        x6 = delta + x0 + x0
-        x7 = 2.0*x5*catanh(x5*x6).real
-        x8 = self.dV_dT_l
-        x9 = x5*x5
-        x10 = x6*x6*x9 - 1.0
-        x11 = x9/x10
-        x12 = T*self.da_alpha_dT - x2
-        x50 = self.d3a_alpha_dT3
-        return (P*x1  + x3*x7  + T*x7*x50- 4.0*x1*x11*x12  - 8.0*T*x11*x3*x8 + 16.0*x12*x6*x8*x8*x11*x11)
+        return self._d2HS_dep_dT2_l[0]
 
     d2H_dep_dT2_l_P = d2H_dep_dT2_l
 
@@ -6404,39 +7143,7 @@ class GCEOS(object):
             {d T^{3}} \operatorname{a\alpha}{\left(T \right)}}
             {\sqrt{\delta^{2} - 4 \epsilon}}
         '''
-        T, P, b, delta, epsilon = self.T, self.P, self.b, self.delta, self.epsilon
-        V = x0 = self.V_g
-        V_inv = 1.0/V
-        x1 = self.d2V_dT2_g
-        x2 = R*V_inv
-        x3 = V_inv*V_inv
-        x4 = self.dV_dT_g
-        x5 = x4*x4
-        x6 = R*x5
-        x7 = b - x0
-        x8 = 1.0/T
-        x9 = -x0*x8 + x4
-        x10 = x0 + x0
-        x11 = self.a_alpha
-        x12 = delta*delta - 4.0*epsilon
-        try:
-            x13 = x12**-0.5
-        except ZeroDivisionError:
-            x13 = 1e100
-        x14 = delta + x10
-        x15 = x13*x13
-        x16 = x14*x14*x15 - 1.0
-        x51 = 1.0/x16
-        x17 = x15*x51
-        x18 = self.da_alpha_dT
-        x50 = 1.0/x7
-        d2a_alpha_dT2 = self.d2a_alpha_dT2
-        d3a_alpha_dT3 = self.d3a_alpha_dT3
-        return (-R*x1*x50 - R*x3*x4*x9 - 4.0*x1*x17*x18 - x1*x2
-                + 2.0*x13*catanh(x13*x14).real*d3a_alpha_dT3
-                - 8.0*x17*x4*d2a_alpha_dT2 + x2*x8*x9
-                + x2*(x1 - 2.0*x4*x8 + x10*x8*x8) + x3*x6 - x6*x50*x50
-                + 16.0*x14*x18*x5*x51*x51*x15*x15)
+        return self._d2HS_dep_dT2_g[1]
 
     @property
     def d2S_dep_dT2_l(self):
@@ -6475,41 +7182,9 @@ class GCEOS(object):
             {d T^{3}} \operatorname{a\alpha}{\left(T \right)}}
             {\sqrt{\delta^{2} - 4 \epsilon}}
         '''
-        T, P, b, delta, epsilon = self.T, self.P, self.b, self.delta, self.epsilon
-        V = x0 = self.V_l
-        V_inv = 1.0/V
-        x1 = self.d2V_dT2_l
-        x2 = R*V_inv
-        x3 = V_inv*V_inv
-        x4 = self.dV_dT_l
-        x5 = x4*x4
-        x6 = R*x5
-        x7 = b - x0
-        x8 = 1.0/T
-        x9 = -x0*x8 + x4
-        x10 = x0 + x0
-        x11 = self.a_alpha
-        x12 = delta*delta - 4.0*epsilon
-        try:
-            x13 = x12**-0.5
-        except ZeroDivisionError:
-            x13 = 1e100
-        x14 = delta + x10
-        x15 = x13*x13
-        x16 = x14*x14*x15 - 1.0
-        x51 = 1.0/x16
-        x17 = x15*x51
-        x18 = self.da_alpha_dT
-        x50 = 1.0/x7
-        d2a_alpha_dT2 = self.d2a_alpha_dT2
-        d3a_alpha_dT3 = self.d3a_alpha_dT3
-        return (-R*x1*x50 - R*x3*x4*x9 - 4.0*x1*x17*x18 - x1*x2
-                + 2.0*x13*catanh(x13*x14).real*d3a_alpha_dT3
-                - 8.0*x17*x4*d2a_alpha_dT2 + x2*x8*x9
-                + x2*(x1 - 2.0*x4*x8 + x10*x8*x8) + x3*x6 - x6*x50*x50
-                + 16.0*x14*x18*x5*x51*x51*x15*x15)
+        return self._d2HS_dep_dT2_l[1]
 
-    @property
+    @cached_property
     def d2H_dep_dT2_g_V(self):
         r'''Second temperature derivative of departure enthalpy with respect to
         temperature at constant volume for the gas phase, [(J/mol)/K^2].
@@ -6525,19 +7200,15 @@ class GCEOS(object):
             {d T^{2}} \operatorname{a\alpha}{\left(T \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        V, T, delta, epsilon = self.V_g, self.T, self.delta, self.epsilon
-        x51 = delta*delta - 4.0*epsilon
+        V, T = self.V_g, self.T
         d2a_alpha_dT2 = self.d2a_alpha_dT2
         d3a_alpha_dT3 = self.d3a_alpha_dT3
         d2P_dT2 = self.d2P_dT2_g
-        try:
-            x1 = x51**-0.5
-        except ZeroDivisionError:
-            x1 = 1e100
-        x2 = 2.0*x1*catanh(x1*(V + V + delta)).real
+        x1 = self._inv_sqrt_disc
+        x2 = 2.0*x1*self._atanh_term_g
         return T*x2*d3a_alpha_dT3 + V*d2P_dT2 + x2*d2a_alpha_dT2
 
-    @property
+    @cached_property
     def d2H_dep_dT2_l_V(self):
         r'''Second temperature derivative of departure enthalpy with respect to
         temperature at constant volume for the liquid phase, [(J/mol)/K^2].
@@ -6553,16 +7224,12 @@ class GCEOS(object):
             {d T^{2}} \operatorname{a\alpha}{\left(T \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        V, T, delta, epsilon = self.V_l, self.T, self.delta, self.epsilon
-        x51 = delta*delta - 4.0*epsilon
+        V, T = self.V_l, self.T
         d2a_alpha_dT2 = self.d2a_alpha_dT2
         d3a_alpha_dT3 = self.d3a_alpha_dT3
         d2P_dT2 = self.d2P_dT2_l
-        try:
-            x1 = x51**-0.5
-        except ZeroDivisionError:
-            x1 = 1e100
-        x2 = 2.0*x1*catanh(x1*(V + V + delta)).real
+        x1 = self._inv_sqrt_disc
+        x2 = 2.0*x1*self._atanh_term_l
         return T*x2*d3a_alpha_dT3 + V*d2P_dT2 + x2*d2a_alpha_dT2
 
     @property
@@ -6585,24 +7252,13 @@ class GCEOS(object):
             \operatorname{a\alpha}{\left(T \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        V, T, delta, epsilon = self.V_g, self.T, self.delta, self.epsilon
-        d2a_alpha_dT2 = self.d2a_alpha_dT2
-        d3a_alpha_dT3 = self.d3a_alpha_dT3
-        d2P_dT2 = self.d2P_dT2_g
-
-        x0 = 1.0/T
-        x1 = self.P
-        P_inv = 1.0/x1
-        x2 = self.dP_dT_g
-        x3 = -x0*x1 + x2
-        x4 = R*P_inv
-        try:
-            x5 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x5 = 1e100
-        return (-R*x2*x3*P_inv*P_inv + x0*x3*x4 + x4*(d2P_dT2 - 2.0*x0*x2
-                + 2.0*x1*x0*x0) + 2.0*x5*catanh(x5*(V + V + delta)
-                ).real*d3a_alpha_dT3)
+        P_inv = self._P_inv
+        x0 = self._T_inv
+        x1 = self.dP_dT_g*P_inv
+        x5 = self._inv_sqrt_disc
+        # The dP_dT/T and P/T^2 cross terms of the derivation cancel
+        return (R*(self.d2P_dT2_g*P_inv - x1*x1 + x0*x0)
+                + 2.0*x5*self._atanh_term_g*self.d3a_alpha_dT3)
 
     @property
     def d2S_dep_dT2_l_V(self):
@@ -6624,23 +7280,13 @@ class GCEOS(object):
             \operatorname{a\alpha}{\left(T \right)}}{\sqrt{\delta^{2}
             - 4 \epsilon}}
         '''
-        V, T, delta, epsilon = self.V_l, self.T, self.delta, self.epsilon
-        d2a_alpha_dT2 = self.d2a_alpha_dT2
-        d3a_alpha_dT3 = self.d3a_alpha_dT3
-        d2P_dT2 = self.d2P_dT2_l
-        x0 = 1.0/T
-        x1 = self.P
-        P_inv = 1.0/x1
-        x2 = self.dP_dT_l
-        x3 = -x0*x1 + x2
-        x4 = R*P_inv
-        try:
-            x5 = (delta*delta - 4.0*epsilon)**-0.5
-        except ZeroDivisionError:
-            x5 = 1e100
-        return (-R*x2*x3*P_inv*P_inv + x0*x3*x4 + x4*(d2P_dT2 - 2.0*x0*x2
-                + 2.0*x1*x0*x0) + 2.0*x5*catanh(x5*(V + V + delta)
-                ).real*d3a_alpha_dT3)
+        P_inv = self._P_inv
+        x0 = self._T_inv
+        x1 = self.dP_dT_l*P_inv
+        x5 = self._inv_sqrt_disc
+        # The dP_dT/T and P/T^2 cross terms of the derivation cancel
+        return (R*(self.d2P_dT2_l*P_inv - x1*x1 + x0*x0)
+                + 2.0*x5*self._atanh_term_l*self.d3a_alpha_dT3)
 
     @property
     def d2H_dep_dTdP_g(self):
@@ -6669,24 +7315,16 @@ class GCEOS(object):
             \left(\frac{\left(\delta + 2 V{\left(T,P \right)}\right)^{2}}
             {\delta^{2} - 4 \epsilon} - 1\right)}
         '''
-        V, T, P, delta, epsilon = self.V_g, self.T, self.P, self.delta, self.epsilon
+        T, P = self.T, self.P
         dV_dT = self.dV_dT_g
         d2V_dTdP = self.d2V_dTdP_g
         dV_dP = self.dV_dP_g
-        a_alpha = self.a_alpha
         d2a_alpha_dT2 = self.d2a_alpha_dT2
-        x5 = delta*delta - 4.0*epsilon
-        try:
-            x6 = 1.0/x5
-        except ZeroDivisionError:
-            x6 = 1e100
-        x7 = delta + V  + V
-        x8 = x6*x7*x7 - 1.0
-        x8_inv = 1.0/x8
-        x9 = 4.0*x6*x8_inv
-        x10 = T*self.da_alpha_dT - a_alpha
+        x7 = self._delta_2V_g
+        x9 = 4.0*self._disc_denom_inv_g
+        x10 = self._T_da_alpha_dT_minus_a_alpha
         return (P*d2V_dTdP - T*dV_dP*x9*d2a_alpha_dT2
-                + 16.0*dV_dT*x10*dV_dP*x7*x6*x6*x8_inv*x8_inv
+                + x10*x7*dV_dT*dV_dP*x9*x9
                 + dV_dT - x10*d2V_dTdP*x9)
 
     @property
@@ -6716,24 +7354,16 @@ class GCEOS(object):
             \left(\frac{\left(\delta + 2 V{\left(T,P \right)}\right)^{2}}
             {\delta^{2} - 4 \epsilon} - 1\right)}
         '''
-        V, T, P, delta, epsilon = self.V_l, self.T, self.P, self.delta, self.epsilon
+        T, P = self.T, self.P
         dV_dT = self.dV_dT_l
         d2V_dTdP = self.d2V_dTdP_l
         dV_dP = self.dV_dP_l
-        a_alpha = self.a_alpha
         d2a_alpha_dT2 = self.d2a_alpha_dT2
-        x5 = delta*delta - 4.0*epsilon
-        try:
-            x6 = 1.0/x5
-        except ZeroDivisionError:
-            x6 = 1e100
-        x7 = delta + V  + V
-        x8 = x6*x7*x7 - 1.0
-        x8_inv = 1.0/x8
-        x9 = 4.0*x6*x8_inv
-        x10 = T*self.da_alpha_dT - a_alpha
+        x7 = self._delta_2V_l
+        x9 = 4.0*self._disc_denom_inv_l
+        x10 = self._T_da_alpha_dT_minus_a_alpha
         return (P*d2V_dTdP - T*dV_dP*x9*d2a_alpha_dT2
-                + 16.0*dV_dT*x10*dV_dP*x7*x6*x6*x8_inv*x8_inv
+                + x10*x7*dV_dT*dV_dP*x9*x9
                 + dV_dT - x10*d2V_dTdP*x9)
 
     @property
@@ -6776,41 +7406,17 @@ class GCEOS(object):
             + \frac{R \left(P \frac{\partial}{\partial P} V{\left(T,P \right)}
             + V{\left(T,P \right)}\right)}{P T V{\left(T,P \right)}}
         '''
-        V, T, P, b, delta, epsilon = self.V_g, self.T, self.P, self.b, self.delta, self.epsilon
         dV_dT = self.dV_dT_g
         d2V_dTdP = self.d2V_dTdP_g
         dV_dP = self.dV_dP_g
+        da_alpha_dT = self.da_alpha_dT
 
-        x0 = V
-        V_inv = 1.0/V
-        x2 = d2V_dTdP
-        x3 = R*x2
-        x4 = dV_dT
-        x5 = x4*V_inv*V_inv
-        x6 = dV_dP
-        x7 = R*x6
-        x8 = b - V
-        x8_inv = 1.0/x8
-        x9 = 1.0/T
-        x10 = P*x6
-        x11 = V + x10
-        x12 = R/P
-        x13 = V_inv*x12
-        x14 = self.a_alpha
-        x15 = delta*delta - 4.0*epsilon
-        try:
-            x16 = 1.0/x15
-        except ZeroDivisionError:
-            x16 = 1e100
-        x17 = delta + V + V
-        x18 = x16*x17*x17 - 1.0
-        x50 = 1.0/x18
-        x19 = 4.0*x16*x50
-        x20 = self.da_alpha_dT
-        return (-V_inv*x3 - x11*x12*x5 + x11*x13*x9 + x13*(P*x2 - V*x9 - x10*x9
-                + x4) - x19*x2*x20 - x19*x6*self.d2a_alpha_dT2 - x3*x8_inv
-                - x4*x7*x8_inv*x8_inv + x5*x7
-                + 16.0*x17*x20*x4*x6*x16*x16*x50*x50)
+        # The ideal-gas R/V and R/P terms of the derivation cancel exactly
+        x3 = 1.0/(self.b - self.V_g)
+        x8 = 4.0*self._disc_denom_inv_g
+        return (-R*x3*(d2V_dTdP + dV_dT*dV_dP*x3)
+                - x8*(d2V_dTdP*da_alpha_dT + dV_dP*self.d2a_alpha_dT2)
+                + self._delta_2V_g*da_alpha_dT*dV_dT*dV_dP*x8*x8)
 
     @property
     def d2S_dep_dTdP_l(self):
@@ -6852,41 +7458,17 @@ class GCEOS(object):
             + \frac{R \left(P \frac{\partial}{\partial P} V{\left(T,P \right)}
             + V{\left(T,P \right)}\right)}{P T V{\left(T,P \right)}}
         '''
-        V, T, P, b, delta, epsilon = self.V_l, self.T, self.P, self.b, self.delta, self.epsilon
         dV_dT = self.dV_dT_l
         d2V_dTdP = self.d2V_dTdP_l
         dV_dP = self.dV_dP_l
+        da_alpha_dT = self.da_alpha_dT
 
-        x0 = V
-        V_inv = 1.0/V
-        x2 = d2V_dTdP
-        x3 = R*x2
-        x4 = dV_dT
-        x5 = x4*V_inv*V_inv
-        x6 = dV_dP
-        x7 = R*x6
-        x8 = b - V
-        x8_inv = 1.0/x8
-        x9 = 1.0/T
-        x10 = P*x6
-        x11 = V + x10
-        x12 = R/P
-        x13 = V_inv*x12
-        x14 = self.a_alpha
-        x15 = delta*delta - 4.0*epsilon
-        try:
-            x16 = 1.0/x15
-        except ZeroDivisionError:
-            x16 = 1e100
-        x17 = delta + V + V
-        x18 = x16*x17*x17 - 1.0
-        x50 = 1.0/x18
-        x19 = 4.0*x16*x50
-        x20 = self.da_alpha_dT
-        return (-V_inv*x3 - x11*x12*x5 + x11*x13*x9 + x13*(P*x2 - V*x9 - x10*x9
-                + x4) - x19*x2*x20 - x19*x6*self.d2a_alpha_dT2 - x3*x8_inv
-                - x4*x7*x8_inv*x8_inv + x5*x7
-                + 16.0*x17*x20*x4*x6*x16*x16*x50*x50)
+        # The ideal-gas R/V and R/P terms of the derivation cancel exactly
+        x3 = 1.0/(self.b - self.V_l)
+        x8 = 4.0*self._disc_denom_inv_l
+        return (-R*x3*(d2V_dTdP + dV_dT*dV_dP*x3)
+                - x8*(d2V_dTdP*da_alpha_dT + dV_dP*self.d2a_alpha_dT2)
+                + self._delta_2V_l*da_alpha_dT*dV_dT*dV_dP*x8*x8)
 
     @property
     def dfugacity_dT_l(self):
@@ -6904,12 +7486,7 @@ class GCEOS(object):
                 \operatorname{S_{dep}}{\left (T,P \right )} + \operatorname
                 {H_{dep}}{\left (T,P \right )}\right)}
         '''
-        T, P = self.T, self.P
-        T_inv = 1.0/T
-        S_dep_l = self.S_dep_l
-        x4 = R_inv*(self.H_dep_l - T*S_dep_l)
-        return P*(T_inv*R_inv*(self.dH_dep_dT_l - T*self.dS_dep_dT_l - S_dep_l)
-                  - x4*T_inv*T_inv)*exp(T_inv*x4)
+        return self.P*self.dphi_dT_l
 
     @property
     def dfugacity_dT_g(self):
@@ -6927,12 +7504,7 @@ class GCEOS(object):
             \operatorname{S_{dep}}{\left (T,P \right )} + \operatorname
             {H_{dep}}{\left (T,P \right )}\right)}
         '''
-        T, P = self.T, self.P
-        T_inv = 1.0/T
-        S_dep_g = self.S_dep_g
-        x4 = R_inv*(self.H_dep_g - T*S_dep_g)
-        return P*(T_inv*R_inv*(self.dH_dep_dT_g - T*self.dS_dep_dT_g - S_dep_g)
-                  - x4*T_inv*T_inv)*exp(T_inv*x4)
+        return self.P*self.dphi_dT_g
 
     @property
     def dfugacity_dP_l(self):
@@ -6949,10 +7521,7 @@ class GCEOS(object):
             \left(- T \operatorname{S_{dep}}{\left (T,P \right )}
             + \operatorname{H_{dep}}{\left (T,P \right )}\right)}
         '''
-        T, P = self.T, self.P
-        x0 = 1.0/(R*T)
-        return (1.0 - P*x0*(T*self.dS_dep_dP_l - self.dH_dep_dP_l))*exp(
-                -x0*(T*self.S_dep_l - self.H_dep_l))
+        return self.phi_l + self.P*self.dphi_dP_l
 
     @property
     def dfugacity_dP_g(self):
@@ -6969,22 +7538,16 @@ class GCEOS(object):
             \left(- T \operatorname{S_{dep}}{\left (T,P \right )}
             + \operatorname{H_{dep}}{\left (T,P \right )}\right)}
         '''
-        T, P = self.T, self.P
-        x0 = 1.0/(R*T)
-        try:
-            ans =  (1.0 - P*x0*(T*self.dS_dep_dP_g - self.dH_dep_dP_g))*exp(
-                    -x0*(T*self.S_dep_g - self.H_dep_g))
-            if isinf(ans) or isnan(ans):
-                return 1.0
-            return ans
-        except Exception as e:
-            if P < 1e-50:
-                # Applies to gas phase only!
-                return 1.0
-            else:
-                raise e
+        P = self.P
+        if P < 1e-50:
+            # Applies to gas phase only!
+            return 1.0
+        ans = self.phi_g + P*self.dphi_dP_g
+        if isinf(ans) or isnan(ans):
+            return 1.0
+        return ans
 
-    @property
+    @cached_property
     def dphi_dT_l(self):
         r'''Derivative of fugacity coefficient with respect to temperature for
         the liquid phase, [1/K].
@@ -6999,13 +7562,12 @@ class GCEOS(object):
             e^{\frac{- T \operatorname{S_{dep}}{\left(T,P \right)}
             + \operatorname{H_{dep}}{\left(T,P \right)}}{R T}}
         '''
-        T, P = self.T, self.P
-        T_inv = 1.0/T
-        x4 = T_inv*(T*self.S_dep_l - self.H_dep_l)
-        return (-R_inv*T_inv*(T*self.dS_dep_dT_l + self.S_dep_l - x4
-                             - self.dH_dep_dT_l)*exp(-R_inv*x4))
+        T = self.T
+        return self._RT_inv*(self.dH_dep_dT_l - T*self.dS_dep_dT_l
+                             - self.S_dep_l - self.G_dep_l*self._T_inv
+                             )*self.phi_l
 
-    @property
+    @cached_property
     def dphi_dT_g(self):
         r'''Derivative of fugacity coefficient with respect to temperature for
         the gas phase, [1/K].
@@ -7020,13 +7582,12 @@ class GCEOS(object):
             e^{\frac{- T \operatorname{S_{dep}}{\left(T,P \right)}
             + \operatorname{H_{dep}}{\left(T,P \right)}}{R T}}
         '''
-        T, P = self.T, self.P
-        T_inv = 1.0/T
-        x4 = T_inv*(T*self.S_dep_g - self.H_dep_g)
-        return (-R_inv*T_inv*(T*self.dS_dep_dT_g + self.S_dep_g - x4
-                             - self.dH_dep_dT_g)*exp(-R_inv*x4))
+        T = self.T
+        return self._RT_inv*(self.dH_dep_dT_g - T*self.dS_dep_dT_g
+                             - self.S_dep_g - self.G_dep_g*self._T_inv
+                             )*self.phi_g
 
-    @property
+    @cached_property
     def dphi_dP_l(self):
         r'''Derivative of fugacity coefficient with respect to pressure for
         the liquid phase, [1/Pa].
@@ -7038,13 +7599,10 @@ class GCEOS(object):
             \right)}\right) e^{\frac{- T \operatorname{S_{dep}}{\left(T,P
             \right)} + \operatorname{H_{dep}}{\left(T,P \right)}}{R T}}}{R T}
         '''
-        T = self.T
-        x0 = self.S_dep_l
-        x1 = self.H_dep_l
-        x2 = 1.0/(R*T)
-        return -x2*(T*self.dS_dep_dP_l - self.dH_dep_dP_l)*exp(-x2*(T*x0 - x1))
+        return self._RT_inv*(self.dH_dep_dP_l
+                             - self.T*self.dS_dep_dP_l)*self.phi_l
 
-    @property
+    @cached_property
     def dphi_dP_g(self):
         r'''Derivative of fugacity coefficient with respect to pressure for
         the gas phase, [1/Pa].
@@ -7056,13 +7614,10 @@ class GCEOS(object):
             \right)}\right) e^{\frac{- T \operatorname{S_{dep}}{\left(T,P
             \right)} + \operatorname{H_{dep}}{\left(T,P \right)}}{R T}}}{R T}
         '''
-        T = self.T
-        x0 = self.S_dep_g
-        x1 = self.H_dep_g
-        x2 = 1.0/(R*T)
-        return -x2*(T*self.dS_dep_dP_g - self.dH_dep_dP_g)*exp(-x2*(T*x0 - x1))
+        return self._RT_inv*(self.dH_dep_dP_g
+                             - self.T*self.dS_dep_dP_g)*self.phi_g
 
-    @property
+    @cached_property
     def dbeta_dT_g(self):
         r'''Derivative of isobaric expansion coefficient with respect to
         temperature for the gas phase, [1/K^2].
@@ -7073,11 +7628,10 @@ class GCEOS(object):
             \frac{\left(\frac{\partial}{\partial T} V{\left (T,P \right )_g}
             \right)^{2}}{V^{2}{\left (T,P \right )_g}}
         '''
-        V_inv = 1.0/self.V_g
-        dV_dT = self.dV_dT_g
-        return V_inv*(self.d2V_dT2_g - dV_dT*dV_dT*V_inv)
+        beta = self.beta_g
+        return self.rho_g*self.d2V_dT2_g - beta*beta
 
-    @property
+    @cached_property
     def dbeta_dT_l(self):
         r'''Derivative of isobaric expansion coefficient with respect to
         temperature for the liquid phase, [1/K^2].
@@ -7088,11 +7642,10 @@ class GCEOS(object):
             \frac{\left(\frac{\partial}{\partial T} V{\left (T,P \right )_l}
             \right)^{2}}{V^{2}{\left (T,P \right )_l}}
         '''
-        V_inv = 1.0/self.V_l
-        dV_dT = self.dV_dT_l
-        return V_inv*(self.d2V_dT2_l - dV_dT*dV_dT*V_inv)
+        beta = self.beta_l
+        return self.rho_l*self.d2V_dT2_l - beta*beta
 
-    @property
+    @cached_property
     def dbeta_dP_g(self):
         r'''Derivative of isobaric expansion coefficient with respect to
         pressure for the gas phase, [1/(Pa*K)].
@@ -7104,12 +7657,9 @@ class GCEOS(object):
             \right )_g} \frac{\partial}{\partial T} V{\left (T,P \right )_g}}
             {V^{2}{\left (T,P \right )_g}}
         '''
-        V_inv = 1.0/self.V_g
-        dV_dT = self.dV_dT_g
-        dV_dP = self.dV_dP_g
-        return V_inv*(self.d2V_dTdP_g - dV_dT*dV_dP*V_inv)
+        return self.rho_g*(self.d2V_dTdP_g - self.beta_g*self.dV_dP_g)
 
-    @property
+    @cached_property
     def dbeta_dP_l(self):
         r'''Derivative of isobaric expansion coefficient with respect to
         pressure for the liquid phase, [1/(Pa*K)].
@@ -7121,12 +7671,9 @@ class GCEOS(object):
             \right )_l} \frac{\partial}{\partial T} V{\left (T,P \right )_l}}
             {V^{2}{\left (T,P \right )_l}}
         '''
-        V_inv = 1.0/self.V_l
-        dV_dT = self.dV_dT_l
-        dV_dP = self.dV_dP_l
-        return V_inv*(self.d2V_dTdP_l - dV_dT*dV_dP*V_inv)
+        return self.rho_l*(self.d2V_dTdP_l - self.beta_l*self.dV_dP_l)
 
-    @property
+    @cached_property
     def da_alpha_dP_g_V(self):
         r'''Derivative of the `a_alpha` with respect to
         pressure at constant volume (varying T) for the gas phase,
@@ -7139,7 +7686,7 @@ class GCEOS(object):
         '''
         return self.da_alpha_dT*self.dT_dP_g
 
-    @property
+    @cached_property
     def da_alpha_dP_l_V(self):
         r'''Derivative of the `a_alpha` with respect to
         pressure at constant volume (varying T) for the liquid phase,
@@ -7152,7 +7699,7 @@ class GCEOS(object):
         '''
         return self.da_alpha_dT*self.dT_dP_l
 
-    @property
+    @cached_property
     def d2a_alpha_dTdP_g_V(self):
         r'''Derivative of the temperature derivative of `a_alpha` with respect
         to pressure at constant volume (varying T) for the gas phase,
@@ -7166,7 +7713,7 @@ class GCEOS(object):
             '''
         return self.d2a_alpha_dT2*self.dT_dP_g
 
-    @property
+    @cached_property
     def d2a_alpha_dTdP_l_V(self):
         r'''Derivative of the temperature derivative of `a_alpha` with respect
         to pressure at constant volume (varying T) for the liquid phase,
@@ -7180,7 +7727,7 @@ class GCEOS(object):
             '''
         return self.d2a_alpha_dT2*self.dT_dP_l
 
-    @property
+    @cached_property
     def d2P_dVdP_g(self):
         r'''Second derivative of pressure with respect to molar volume and
         then pressure for the gas phase, [mol/m^3].
@@ -7198,28 +7745,9 @@ class GCEOS(object):
             {\left(P \right)}\right)^{2}}
 
         '''
-        r'''Feels like a really strange derivative. Have not been able to construct
-        it from others yet. Value is Symmetric - can calculate it both ways.
-        Still feels like there should be a general method for obtaining these derivatives.
-
-        from sympy import *
-        P, T, R, b, delta, epsilon = symbols('P, T, R, b, delta, epsilon')
-        a_alpha, V = symbols(r'a\alpha, V', cls=Function)
+        return self.d2P_dV2_g*self.dV_dP_g
 
-        dP_dV = 1/(1/(-R*T/(V(P) - b)**2 - a_alpha(T)*(-2*V(P) - delta)/(V(P)**2 + V(P)*delta + epsilon)**2))
-        cse(diff(dP_dV, P), optimizations='basic')
-        '''
-        T, P, b, delta, epsilon = self.T, self.P, self.b, self.delta, self.epsilon
-        x0 = self.V_g
-        x1 = self.a_alpha
-        x2 = delta*x0 + epsilon + x0*x0
-        x50 = self.dV_dP_g
-        x51 = x0 + x0 + delta
-        x52 = 1.0/(b - x0)
-        x2_inv = 1.0/x2
-        return 2.0*(-R*T*x52*x52*x52 + x1*x2_inv*x2_inv*(1.0 - x51*x51*x2_inv))*x50
-
-    @property
+    @cached_property
     def d2P_dVdP_l(self):
         r'''Second derivative of pressure with respect to molar volume and
         then pressure for the liquid phase, [mol/m^3].
@@ -7237,17 +7765,9 @@ class GCEOS(object):
             {\left(P \right)}\right)^{2}}
 
         '''
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        x0 = self.V_l
-        x1 = self.a_alpha
-        x2 = delta*x0 + epsilon + x0*x0
-        x50 = self.dV_dP_l
-        x51 = x0 + x0 + delta
-        x52 = 1.0/(b - x0)
-        x2_inv = 1.0/x2
-        return 2.0*(-R*T*x52*x52*x52 + x1*x2_inv*x2_inv*(1.0 - x51*x51*x2_inv))*x50
+        return self.d2P_dV2_l*self.dV_dP_l
 
-    @property
+    @cached_property
     def d2P_dVdT_TP_g(self):
         r'''Second derivative of pressure with respect to molar volume and
         then temperature at constant temperature then pressure for the gas
@@ -7269,21 +7789,9 @@ class GCEOS(object):
             \right)}}{\left(\delta V{\left(T \right)} + \epsilon + V^{2}{\left(
             T \right)}\right)^{2}}
         '''
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        x0 = self.V_g
-        x2 = 2.0*self.dV_dT_g
-        x1 = self.b - x0
-        x1_inv = 1.0/x1
-        x3 = delta*x0 + epsilon + x0*x0
-        x3_inv = 1.0/x3
-        x4 = x3_inv*x3_inv
-        x5 = self.a_alpha
-        x6 = x2*x5
-        x7 = delta + x0 + x0
-        return (-x1_inv*x1_inv*R*(T*x2*x1_inv + 1.0) + x4*x6
-                + x4*x7*(self.da_alpha_dT - x6*x7*x3_inv))
+        return self.d2P_dV2_g*self.dV_dT_g + self.d2P_dTdV_g
 
-    @property
+    @cached_property
     def d2P_dVdT_TP_l(self):
         r'''Second derivative of pressure with respect to molar volume and
         then temperature at constant temperature then pressure for the liquid
@@ -7305,21 +7813,9 @@ class GCEOS(object):
             \right)}}{\left(\delta V{\left(T \right)} + \epsilon + V^{2}{\left(
             T \right)}\right)^{2}}
         '''
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        x0 = self.V_l
-        x2 = 2.0*self.dV_dT_l
-        x1 = self.b - x0
-        x1_inv = 1.0/x1
-        x3 = delta*x0 + epsilon + x0*x0
-        x3_inv = 1.0/x3
-        x4 = x3_inv*x3_inv
-        x5 = self.a_alpha
-        x6 = x2*x5
-        x7 = delta + x0 + x0
-        return (-x1_inv*x1_inv*R*(T*x2*x1_inv + 1.0) + x4*x6
-                + x4*x7*(self.da_alpha_dT - x6*x7*x3_inv))
+        return self.d2P_dV2_l*self.dV_dT_l + self.d2P_dTdV_l
 
-    @property
+    @cached_property
     def d2P_dT2_PV_g(self):
         r'''Second derivative of pressure with respect to temperature twice,
         but with pressure held constant the first time and volume held
@@ -7336,19 +7832,9 @@ class GCEOS(object):
             \operatorname{a\alpha}{\left(T \right)}}{\delta V{\left(T \right)}
             + \epsilon + V^{2}{\left(T \right)}}
         '''
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        V = self.V_g
-        dV_dT = self.dV_dT_g
-
-        x2 = self.a_alpha
-        x0 = V
-        x1 = dV_dT
-        x3 = delta*x0 + epsilon + x0*x0
-        x3_inv = 1.0/x3
-        x50 = 1.0/(b - x0)
-        return (-R*x1*x50*x50 + x1*(delta + x0 + x0)*self.da_alpha_dT*x3_inv*x3_inv - self.d2a_alpha_dT2*x3_inv)
+        return self.d2P_dTdV_g*self.dV_dT_g + self.d2P_dT2_g
 
-    @property
+    @cached_property
     def d2P_dT2_PV_l(self):
         r'''Second derivative of pressure with respect to temperature twice,
         but with pressure held constant the first time and volume held
@@ -7365,19 +7851,9 @@ class GCEOS(object):
             \operatorname{a\alpha}{\left(T \right)}}{\delta V{\left(T \right)}
             + \epsilon + V^{2}{\left(T \right)}}
         '''
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        V = self.V_l
-        dV_dT = self.dV_dT_l
-
-        x0 = V
-        x1 = dV_dT
-        x2 = self.a_alpha
-        x3 = delta*x0 + epsilon + x0*x0
-        x3_inv = 1.0/x3
-        x50 = 1.0/(b - x0)
-        return (-R*x1*x50*x50 + x1*(delta + x0 + x0)*self.da_alpha_dT*x3_inv*x3_inv - self.d2a_alpha_dT2*x3_inv)
+        return self.d2P_dTdV_l*self.dV_dT_l + self.d2P_dT2_l
 
-    @property
+    @cached_property
     def d2P_dTdP_g(self):
         r'''Second derivative of pressure with respect to temperature and,
         then pressure; and with volume held constant at first, then temperature,
@@ -7392,16 +7868,9 @@ class GCEOS(object):
             {\left(\delta V{\left(P \right)} + \epsilon + V^{2}{\left(P
             \right)}\right)^{2}}
         '''
-        V = self.V_g
-        dV_dP = self.dV_dP_g
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        da_alpha_dT = self.da_alpha_dT
-        x0 = V - b
-        x1 = delta*V + epsilon + V*V
-        return (-R*dV_dP/(x0*x0) - (-delta*dV_dP - 2.0*V*dV_dP)*da_alpha_dT/(x1*x1))
-
+        return self.d2P_dTdV_g*self.dV_dP_g
 
-    @property
+    @cached_property
     def d2P_dTdP_l(self):
         r'''Second derivative of pressure with respect to temperature and,
         then pressure; and with volume held constant at first, then temperature,
@@ -7416,20 +7885,14 @@ class GCEOS(object):
             {\left(\delta V{\left(P \right)} + \epsilon + V^{2}{\left(P
             \right)}\right)^{2}}
         '''
-        V = self.V_l
-        dV_dP = self.dV_dP_l
-        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
-        da_alpha_dT = self.da_alpha_dT
-        x0 = V - b
-        x1 = delta*V + epsilon + V*V
-        return (-R*dV_dP/(x0*x0) - (-delta*dV_dP - 2.0*V*dV_dP)*da_alpha_dT/(x1*x1))
+        return self.d2P_dTdV_l*self.dV_dP_l
 
     @property
     def lnphi_l(self):
         r'''The natural logarithm of the fugacity coefficient for
         the liquid phase, [-].
         '''
-        return self.G_dep_l*R_inv/self.T
+        return self.G_dep_l*self._RT_inv
 
     @property
     def lnphi_g(self):
@@ -7439,6 +7902,16 @@ class GCEOS(object):
         return log(self.phi_g)
 
 
+def _collect_cache_attributes(cls):
+    names = list(cls._cache_attributes_extra)
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if isinstance(value, cached_property) and name not in names:
+                names.append(name)
+    return tuple(names)
+
+GCEOS._cache_attributes = _collect_cache_attributes(GCEOS)
+
 
 class PR(GCEOS):
     r'''Class for solving the Peng-Robinson [1]_ [2]_ cubic
@@ -7618,6 +8091,7 @@ class PR(GCEOS):
 
     _P_zero_l_cheb_coeffs = [0.13358936990391557, -0.20047353906149878, 0.15101308518135467, -0.11422662323168498, 0.08677799907222833, -0.06622719396774103, 0.05078577177767531, -0.03913992025038471, 0.030322206247168845, -0.023618484941949063, 0.018500212460075605, -0.014575143278285305, 0.011551352410948363, -0.00921093058565245, 0.007390713292456164, -0.005968132800177682, 0.00485080886172241, -0.003968872414987763, 0.003269291360484698, -0.002711665819666899, 0.0022651044970457743, -0.0019058978265104418, 0.0016157801830935644, -0.0013806283122768208, 0.0011894838915417153, -0.0010338173333182162, 0.0009069721482541163, -0.0008037443041438563, 0.0007200633946601682, -0.0006527508698173454, 0.0005993365082194993, -0.0005579199462298259, 0.0005270668422661141, -0.0005057321913053223, 0.0004932057251527365, -0.00024453764761005106]
     P_zero_l_cheb_limits = (0.002068158270122966, 27.87515959722943)
+    _P_zero_l_cheb_affine = cheb_affine_constants(*P_zero_l_cheb_limits)
 
     def __init__(self, Tc, Pc, omega, T=None, P=None, V=None):
         self.Tc = Tc
@@ -7633,6 +8107,28 @@ class PR(GCEOS):
         self.delta, self.epsilon = 2.0*b, -b*b
         self.solve()
 
+    @cached_property
+    def _Tc_inv(self):
+        return 1.0/self.Tc
+
+    @cached_property
+    def _sqrt_Tc_inv(self):
+        return sqrt(self._Tc_inv)
+
+    @cached_property
+    def _kappa_over_Tc(self):
+        return self.kappa*self._Tc_inv
+
+    @cached_property
+    def _inv_disc(self):
+        # delta^2 - 4 epsilon = 8 b^2, never zero
+        return 0.125/(self.b*self.b)
+
+    @cached_property
+    def _inv_sqrt_disc(self):
+        # 1/sqrt(8 b^2) = sqrt(2)/(4 b)
+        return 0.3535533905932738/self.b
+
     def a_alpha_pure(self, T):
         r'''Method to calculate :math:`a \alpha` for this EOS. Uses the set values of
         `Tc`, `kappa`, and `a`.
@@ -7664,7 +8160,7 @@ class PR(GCEOS):
         >>> eos.a_alpha_pure(250.0)
         15.66839156301
         '''
-        x0 = (1.0 + self.kappa*(1.0 - sqrt(T/self.Tc)))
+        x0 = (1.0 + self.kappa*(1.0 - sqrt(T*self._Tc_inv)))
         return self.a*x0*x0
 
     def a_alpha_and_derivatives_pure(self, T):
@@ -7719,19 +8215,55 @@ class PR(GCEOS):
         # Thermodynamics of aqueous systems with industrial applications 133 (1980): 393-414.
         # Applies up to Tr .85.
         # Suggested in Equations of State And PVT Analysis.
-        Tc, kappa, a = self.Tc, self.kappa, self.a
+        kappa, a = self.kappa, self.a
         x0 = sqrt(T)
-        x1 = 1.0/sqrt(Tc)
+        x1 = self._sqrt_Tc_inv
         x2 = kappa*(x0*x1 - 1.) - 1.
         x3 = a*kappa
         x4 = x1*x2/x0
 
         a_alpha = a*x2*x2
         da_alpha_dT = x4*x3
-        d2a_alpha_dT2 = 0.5*x3*(kappa*x1*x1 - x4)/T
+        d2a_alpha_dT2 = 0.5*x3*(self._kappa_over_Tc - x4)/T
 
         return a_alpha, da_alpha_dT, d2a_alpha_dT2
 
+    def a_alpha_and_derivatives_pure_vec(self, T):
+        r'''Method to calculate :math:`a \alpha` and its first and second
+        derivatives for many temperatures at once. The expressions are those
+        of :obj:`PR.a_alpha_and_derivatives_pure`, evaluated elementwise.
+
+        Parameters
+        ----------
+        T : ndarray
+            Temperatures at which to calculate the values, [K]
+
+        Returns
+        -------
+        a_alpha : ndarray
+            Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+        da_alpha_dT : ndarray
+            Temperature derivative of coefficient calculated by EOS-specific
+            method, [J^2/mol^2/Pa/K]
+        d2a_alpha_dT2 : ndarray
+            Second temperature derivative of coefficient calculated by
+            EOS-specific method, [J^2/mol^2/Pa/K^2]
+
+        Examples
+        --------
+        >>> eos = PR(Tc=658.0, Pc=1820000.0, omega=0.562, T=500., P=1e5)
+        >>> eos.a_alpha_and_derivatives_pure_vec(np.array([250.0, 500.0]))[0]
+        array([15.66839156,  9.91551361])
+        '''
+        kappa, a = self.kappa, self.a
+        T = np.asarray(T, dtype=float)
+        x0 = np.sqrt(T)
+        x1 = self._sqrt_Tc_inv
+        x2 = kappa*(x0*x1 - 1.) - 1.
+        x3 = a*kappa
+        x4 = x1*x2/x0
+        return a*x2*x2, x4*x3, 0.5*x3*(self._kappa_over_Tc - x4)/T
+
     def d3a_alpha_dT3_pure(self, T):
         r'''Method to calculate the third temperature derivative of `a_alpha`.
         Uses the set values of `Tc`, `kappa`, and `a`. This property is not
@@ -7767,10 +8299,9 @@ class PR(GCEOS):
         -9.8038800671e-08
         '''
         kappa = self.kappa
-        x0 = 1.0/self.Tc
         T_inv = 1.0/T
-        x1 = sqrt(T*x0)
-        return -self.a*0.75*kappa*(kappa*x0 - x1*(kappa*(x1 - 1.0) - 1.0)*T_inv)*T_inv*T_inv
+        x1 = sqrt(T*self._Tc_inv)
+        return -self.a*0.75*kappa*(self._kappa_over_Tc - x1*(kappa*(x1 - 1.0) - 1.0)*T_inv)*T_inv*T_inv
 
     def P_max_at_V(self, V):
         r'''Method to calculate the maximum pressure the EOS can create at a
@@ -7813,7 +8344,10 @@ class PR(GCEOS):
             Tc, a, b, kappa = self.Tc, self.a, self.b, self.kappa
         except:
             Tc, a, b, kappa = self.Tcs[0], self.ais[0], self.bs[0], self.kappas[0]
-        P_max = (-R*Tc*a*(kappa**2 + 2*kappa + 1)/(R*Tc*V**2 + 2*R*Tc*V*b - R*Tc*b**2 - V*a*kappa**2 + a*b*kappa**2))
+        RTc = R*Tc
+        kappa_p1 = kappa + 1.0
+        P_max = (-RTc*a*kappa_p1*kappa_p1
+                 /(RTc*(V*(V + 2.0*b) - b*b) - a*kappa*kappa*(V - b)))
         if P_max < 0.0:
             # No positive pressure - it's negative
             return None
@@ -7871,7 +8405,6 @@ class PR(GCEOS):
         '''
         self.no_T_spec = True
         Tc, a, b, kappa = self.Tc, self.a, self.b, self.kappa
-        # Needs to be improved to do a NR or two at the end!
         x0 = V*V
         x1 = R*Tc
         x2 = x0*x1
@@ -7921,13 +8454,9 @@ class PR(GCEOS):
 
         # 2.*a*kappa - add a negative sign to get the high temperature solution
         # sometimes it is complex!
-#            try:
         root_term = sqrt(V_m_b**3*(x0 + x6 - x8)*(P*x7 -
                                           P*x9 + x25 + x33 + x34 + x35
                                           + x36 - x37))
-#            except ValueError:
-#                # negative number in sqrt
-#                return super(PR, self).solve_T(P, V)
 
         x100 = 2.*a*kappa*x11*(root_term*(kappa + 1.))
         x101 = (x31*V_m_b*((4.*V)*(R*Tc*a*b*kappa) + x0*x33 - x0*x35 + x12*x38
@@ -7942,166 +8471,32 @@ class PR(GCEOS):
             # Ruined, call the numerical method; sometimes it happens
             return super(PR, self).solve_T(P, V, solution=solution)
 
-        Tc_inv = 1.0/Tc
+        Tc_inv = self._Tc_inv
 
         T_calc_high = (x102*(-x100 - x101))
         if solution is not None and solution == 'g':
             T_calc = T_calc_high
-        if True:
-            c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
-
-            rt = (T_calc*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-            if abs(err/P) > 1e-2:
-                # Numerical issue - such a bad solution we cannot converge
-                return super(PR, self).solve_T(P, V, solution=solution)
-
-            # Newton step - might as well compute it
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-            if derr == 0.0:
-                return T_calc
-            T_calc = T_calc - err/derr
-
-            # Step 2 - cannot find occasion to need more steps, most of the time
-            # this does nothing!
-            rt = (T_calc*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-            T_calc = T_calc - err/derr
-
-            return T_calc
-
-
-            c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
-
-            rt = (T_calc_high*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc_high - alpha_root*alpha_root*c2 - P
-
-            # Newton step - might as well compute it
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc_high
-            T_calc_high = T_calc_high - err/derr
-
-            # Step 2 - cannot find occasion to need more steps, most of the time
-            # this does nothing!
-            rt = (T_calc_high*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc_high - alpha_root*alpha_root*c2 - P
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc_high
-            T_calc_high = T_calc_high - err/derr
-
-
-
-
-
-            delta, epsilon = self.delta, self.epsilon
-            w0 = 1.0*(delta*delta - 4.0*epsilon)**-0.5
-            w1 = delta*w0
-            w2 = 2.0*w0
-
-#            print(T_calc, T_calc_high)
-
-            a_alpha_low = a*(1.0 + kappa*(1.0-(T_calc/Tc)**0.5))**2.0
-            a_alpha_high = a*(1.0 + kappa*(1.0-(T_calc_high/Tc)**0.5))**2.0
-
-            err_low = abs((R*T_calc/(V-b) - a_alpha_low/(V*V + delta*V + epsilon) - P))
-            err_high = abs((R*T_calc_high/(V-b) - a_alpha_high/(V*V + delta*V + epsilon) - P))
-#                print(err_low, err_high, T_calc, T_calc_high, a_alpha_low, a_alpha_high)
+        # TODO: when solution is None, choose between the two roots by
+        # residual and G_dep instead of always taking the low-T one
 
-            RT_low = R*T_calc
-            G_dep_low = (P*V - RT_low - RT_low*clog(P/RT_low*(V-b)).real
-                        - w2*a_alpha_low*catanh(2.0*V*w0 + w1).real)
+        c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
 
-            RT_high = R*T_calc_high
-            G_dep_high = (P*V - RT_high - RT_high*clog(P/RT_high*(V-b)).real
-                        - w2*a_alpha_high*catanh(2.0*V*w0 + w1).real)
-
-#                print(G_dep_low, G_dep_high)
-            # ((err_low > err_high*2)) and
-            if  (T_calc.imag != 0.0 and T_calc_high.imag == 0.0) or (G_dep_high < G_dep_low and (err_high < err_low)):
-                T_calc = T_calc_high
+        rt = sqrt(T_calc*Tc_inv)
+        alpha_root = (1.0 + kappa*(1.0-rt))
+        err = c1*T_calc - alpha_root*alpha_root*c2 - P
+        if abs(err/P) > 1e-2:
+            # Numerical issue - such a bad solution we cannot converge
+            return super(PR, self).solve_T(P, V, solution=solution)
 
+        # One Halley step - the residual is cheap to differentiate twice,
+        # and the cubic convergence covers the two Newton steps it replaces
+        derr = c1 + c2*kappa*rt*alpha_root/T_calc
+        if derr == 0.0:
             return T_calc
+        d2err = -0.5*c2*kappa*(kappa + 1.0)*rt/(T_calc*T_calc)
+        T_calc = T_calc - 2.0*err*derr/(2.0*derr*derr - err*d2err)
 
-
-#            if err_high < err_low:
-#                T_calc = T_calc_high
-
-#            for Ti in (T_calc, T_calc_high):
-#                a_alpha = a*(1.0 + kappa*(1.0-(Ti/Tc)**0.5))**2.0
-#
-#
-#                # Compute P, and the difference?
-#                self.P = float(R*self.T/(V-self.b) - self.a_alpha/(V*V + self.delta*V + self.epsilon)
-#
-#
-#
-#                RT = R*Ti
-#                print(RT, V-b, P/RT*(V-b))
-#                G_dep = (P*V - RT - RT*log(P/RT*(V-b))
-#                            - w2*a_alpha*catanh(2.0*V*w0 + w1).real)
-#                print(G_dep)
-#                if G_dep < G_dep_base:
-#                    T = Ti
-#                    G_dep_base = G_dep
-#            T_calc = T
-
-#            print(T_calc, T_calc_high)
-
-
-#            T_calc = (-Tc*(2.*a*kappa*x11*sqrt(V_m_b**3*(x0 + x6 - x8)*(P*x7 -
-#                                              P*x9 + x25 + x33 + x34 + x35
-#                                              + x36 - x37))*(kappa + 1.) -
-#                x31*V_m_b*((4.*V)*(R*Tc*a*b*kappa) + x0*x33 - x0*x35 + x12*x38
-#                         + x16*x38 + x18*x39 - x18*x41 - x20*x42 - x22*x42
-#                         - x23*x38 + x24*x38 + x25*x6 - x26 - x27 + x28 + x29
-#                         + x3*x39 - x3*x41 + x30*x34 - x33*x8 + x36*x6
-#                         + 3*x37*x8 + x39*x40 - x40*x41))/(x11*x31))
-#            print(T_calc2/T_calc)
-
-            # Validation code - although the solution is analytical some issues
-            # with floating points can still occur
-            # Although 99.9 % of points anyone would likely want are plenty good,
-            # there are some edge cases as P approaches T or goes under it.
-
-#            c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
-#
-#            rt = (T_calc*Tc_inv)**0.5
-#            alpha_root = (1.0 + kappa*(1.0-rt))
-#            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-#
-#            # Newton step - might as well compute it
-#            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-#            T_calc = T_calc - err/derr
-#
-#            # Step 2 - cannot find occasion to need more steps, most of the time
-#            # this does nothing!
-#            rt = (T_calc*Tc_inv)**0.5
-#            alpha_root = (1.0 + kappa*(1.0-rt))
-#            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-#            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-#            T_calc = T_calc - err/derr
-##            print(T_calc)
-#            return T_calc
-
-#            P_inv = 1.0/P
-#            if abs(err/P) < 1e-6:
-#                return T_calc
-##            print(abs(err/P))
-##            return GCEOS.solve_T(self, P, V)
-#            for i in range(7):
-#                rt = (T_calc*Tc_inv)**0.5
-#                alpha_root = (1.0 + kappa*(1.0-rt))
-#                err = c1*T_calc - alpha_root*alpha_root*c2 - P
-#                derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-#
-#                T_calc = T_calc - err/derr
-#                print(err/P, T_calc, derr)
-#                if abs(err/P) < 1e-12:
-#                    return T_calc
-#            return T_calc
+        return T_calc
 
 
     # starts at 0.0008793111898930736
@@ -8124,6 +8519,415 @@ class PR(GCEOS):
     Psat_coeffs_low = [[2338676895826482.5, -736415034973095.6, 105113277697825.1, -8995168780410.754, 514360029044.81494, -20734723655.83978, 605871516.8891307, -12994014.122638363, 204831.11357912835, -2351.9913154464143, 18.149657683324232, 0.8151930684866298, -0.7871881357728392, 0.5624577476810062, -3.35530139647672, -4.836964162535651e-13], [-0.13805715433070773, 0.8489231609102119, -2.450329797856018, 4.447856574793218, -5.767299107094559, 5.794674157897756, -4.825296555657044, 3.5520183799445926, -2.4600869594916634, 1.6909163275418595, -1.2021498414235525, 0.9254639369127162, -0.7875982246546266, 0.5624585116206676, -3.3553013938160787, -3.331224185387782e-11], [-2.3814071133383825e-06, 5.318261908739265e-05, -0.0005538990617858645, 0.0035761255785055936, -0.016054997425247523, 0.05333504500541739, -0.13636391080337568, 0.27593424749870343, -0.4517901507372948, 0.6114112167354924, -0.7059858408782421, 0.7385376731146207, -0.7329884294338728, 0.5509890744823249, -3.353773232516225, -9.646546737407391e-05], [2.6058661808460023e-11, -1.75914103924121e-09, 5.396299167286894e-08, -1.0007922530068192e-06, 1.2554484077194732e-05, -0.0001125821062183067, 0.0007410322067253991, -0.0035992993229111833, 0.012657105041028169, -0.030121969848977304, 0.03753504314148813, 0.02349666014556937, -0.18469580367455368, 0.24005237728233714, -3.239469690554324, -0.020289142467969867], [-1.082394018559102e-15, 1.2914854481231322e-13, -7.104839518580019e-12, 2.3832489222439473e-10, -5.425087002560749e-09, 8.804418548276272e-08, -1.0364065054630989e-06, 8.719985338278278e-06, -4.8325538208084174e-05, 0.00011200959608941485, 0.0008028675551716892, -0.010695106054891056, 0.06594801536296582, -0.27725262867260253, -2.6977571369079514, -0.2635895959694814], [1.1488824622125947e-20, -3.331154652317046e-18, 4.503372697637035e-16, -3.7684497582121125e-14, 2.1852058912840643e-12, -9.313780852814459e-11, 3.019939074381905e-09, -7.605074783395472e-08, 1.5052679183948458e-06, -2.354701523431422e-05, 0.00029127690705745875, -0.0028399757838276493, 0.02173245057169364, -0.13135011490812692, -2.9774476427885146, -0.01942256817236654], [1.0436558787976772e-24, -5.473723131383567e-22, 1.3452696879486453e-19, -2.0573736968717295e-17, 2.1924486360657888e-15, -1.7272619586846295e-13, 1.0413985148866247e-11, -4.906312890258065e-10, 1.8279149292524938e-08, -5.414588408693672e-07, 1.275367009914141e-05, -0.00023786604002741, 0.0034903075344121025, -0.04033658323380905, -3.2676007023496245, 0.42749816097639837], [9.060766533667912e-29, -9.196819760777788e-26, 4.3601925662975664e-23, -1.2818245897574232e-20, 2.615903295904718e-18, -3.930631843509798e-16, 4.500311702777485e-14, -4.007582103109645e-12, 2.808196479352211e-10, -1.5562164421777763e-08, 6.818206236433737e-07, -2.350273523243411e-05, 0.0006326097721162514, -0.013277937187152783, -3.4305615375066876, 0.8983326523220114], [1.1247677438654667e-33, -2.4697583969349065e-30, 2.5286510080356973e-27, -1.6024926981128421e-24, 7.03655740810716e-22, -2.2705238015446456e-19, 5.57121222696514e-17, -1.0609879702627998e-14, 1.5863699537553053e-12, -1.8713657213281574e-10, 1.7407548458856668e-08, -1.2702047168798462e-06, 7.210856106809965e-05, -0.0031754110755806966, -3.5474790036315795, 1.555110704923493]]
 
 
+eos_list = [PR]
+'''List of all cubic equation of state classes in this module.'''
+eos_full_path_dict = {c.__full_path__: c for c in eos_list}
+'''Dictionary of cubic equation of state classes keyed by their full import
+path, as stored by :obj:`GCEOS.as_json`.'''
+
+
+class EOSArray(object):
+    r'''Structure-of-arrays form of a pure-component cubic EOS, holding many
+    `T`-`P` states of one model as NumPy arrays instead of one EOS object per
+    state. The volume solution and the main departure properties are
+    calculated for all states together.
+
+    Parameters
+    ----------
+    eos : GCEOS
+        Any solved pure-component EOS, which supplies the model parameters
+        and :math:`a \alpha`, [-]
+    Ts : array-like
+        Temperatures, [K]
+    Ps : array-like
+        Pressures, [Pa]
+
+    Attributes
+    ----------
+    V_l : ndarray
+        Liquid-like molar volumes, NaN where there is no such root, [m^3/mol]
+    V_g : ndarray
+        Vapor-like molar volumes, NaN where there is no such root, [m^3/mol]
+    Z_l : ndarray
+        Liquid-like compressibility factors, [-]
+    Z_g : ndarray
+        Vapor-like compressibility factors, [-]
+    H_dep_l : ndarray
+        Liquid-like departure enthalpies, [J/mol]
+    H_dep_g : ndarray
+        Vapor-like departure enthalpies, [J/mol]
+    S_dep_l : ndarray
+        Liquid-like departure entropies, [J/mol/K]
+    S_dep_g : ndarray
+        Vapor-like departure entropies, [J/mol/K]
+
+    Notes
+    -----
+    As in :obj:`GCEOS.set_from_PT`, when only one physical root exists it is
+    assigned to a phase with the phase identification parameter.
+
+    Examples
+    --------
+    >>> base = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=500.0, P=1E6)
+    >>> states = EOSArray(base, Ts=[300.0, 400.0, 500.0], Ps=1e6)
+    >>> states.V_l
+    array([0.00013038, 0.00015607,        nan])
+    '''
+
+    def __init__(self, eos, Ts, Ps):
+        self.eos = eos
+        self.b, self.delta, self.epsilon = eos.b, eos.delta, eos.epsilon
+        self.T, self.P = np.broadcast_arrays(np.asarray(Ts, dtype=float),
+                                             np.asarray(Ps, dtype=float))
+        try:
+            alphas = eos.a_alpha_and_derivatives_pure_vec(self.T)
+        except AttributeError:
+            T_unique, T_index = np.unique(self.T, return_inverse=True)
+            alphas = np.array([eos.a_alpha_and_derivatives(T) for T in T_unique.tolist()])
+            alphas = alphas[T_index.ravel()].reshape(self.T.shape + (3,))
+            alphas = (alphas[..., 0], alphas[..., 1], alphas[..., 2])
+        self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2 = alphas
+        self.solve()
+
+    @classmethod
+    def from_scalars(cls, eos_class, Tc, Pc, omega, Ts, Ps, **kwargs):
+        r'''Method to construct an :obj:`EOSArray` directly from the critical
+        properties of a fluid, without a separately created EOS.
+
+        Parameters
+        ----------
+        eos_class : type
+            EOS class such as :obj:`PR`, [-]
+        Tc : float
+            Critical temperature, [K]
+        Pc : float
+            Critical pressure, [Pa]
+        omega : float
+            Acentric factor, [-]
+        Ts : array-like
+            Temperatures, [K]
+        Ps : array-like
+            Pressures, [Pa]
+
+        Returns
+        -------
+        obj : EOSArray
+            Array of EOS states, [-]
+        '''
+        Ts, Ps = np.broadcast_arrays(np.asarray(Ts, dtype=float),
+                                     np.asarray(Ps, dtype=float))
+        eos = eos_class(Tc=Tc, Pc=Pc, omega=omega, T=float(Ts.flat[0]),
+                        P=float(Ps.flat[0]), **kwargs)
+        return cls(eos, Ts, Ps)
+
+    def to_TP(self, Ts, Ps):
+        r'''Method to construct a new :obj:`EOSArray` of the same model at the
+        specified states.
+
+        Parameters
+        ----------
+        Ts : array-like
+            Temperatures, [K]
+        Ps : array-like
+            Pressures, [Pa]
+
+        Returns
+        -------
+        obj : EOSArray
+            Array of EOS states, [-]
+        '''
+        return self.__class__(self.eos, Ts, Ps)
+
+    def discriminant(self):
+        r'''Method to compute the discriminant of the cubic volume solution
+        at every state; see :obj:`GCEOS.discriminant`.
+
+        Returns
+        -------
+        discriminant : ndarray
+            Discriminants, [-]
+        '''
+        return eos_discriminant(self.T, self.P, self.b, self.delta,
+                                self.epsilon, self.a_alpha)
+
+    def solve(self):
+        T, P, b, delta, epsilon = self.T, self.P, self.b, self.delta, self.epsilon
+        a_alpha = self.a_alpha
+        RT = R*T
+        P_RT = P/RT
+        B = b*P_RT
+        deltas = delta*P_RT
+        thetas = a_alpha*P_RT/RT
+        epsilons = epsilon*P_RT*P_RT
+        Zs = polyroots_vec((1.0, deltas - B - 1.0, thetas + epsilons - deltas*(B + 1.0),
+                            -(epsilons*(B + 1.0) + thetas*B)))
+        Vs = Zs*(RT/P)[..., None]
+        Vs_real = Vs.real
+        good = (Vs_real > b) & (np.abs(Vs.imag) <= 1e-12*np.abs(Vs_real))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            V_l = np.where(good, Vs_real, np.inf).min(axis=-1)
+            V_g = np.where(good, Vs_real, -np.inf).max(axis=-1)
+            V_l[np.isinf(V_l)] = np.nan
+            V_g[np.isinf(V_g)] = np.nan
+
+            dP_dV, dP_dT, d2P_dV2, _, d2P_dTdV = self._P_derivatives(V_l)
+            PIP = V_l*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV)
+        one_root = V_l == V_g
+        is_l = PIP > 1.00000000000001
+        V_l[one_root & ~is_l] = np.nan
+        V_g[one_root & is_l] = np.nan
+        self.V_l, self.V_g = V_l, V_g
+        self.Z_l, self.Z_g = P*V_l/RT, P*V_g/RT
+        self.H_dep_l, self.S_dep_l = self._departures(V_l)
+        self.H_dep_g, self.S_dep_g = self._departures(V_g)
+
+    def derivatives(self, phase='l'):
+        r'''Method to compute the primitive and derived partial derivatives
+        of the EOS for one phase at every state; see
+        :obj:`eos_derivatives_batch` for the derived set.
+
+        Parameters
+        ----------
+        phase : str, optional
+            'l' or 'g', [-]
+
+        Returns
+        -------
+        derivatives : dict[str, ndarray]
+            Derivatives keyed by the name of the :obj:`GCEOS` property
+            without its phase suffix, NaN where the phase does not exist,
+            [various]
+        '''
+        V = self.V_l if phase == 'l' else self.V_g
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dP_dV, dP_dT, d2P_dV2, d2P_dT2, d2P_dTdV = self._P_derivatives(V)
+            derivatives = eos_derivatives_batch(V, dP_dV, dP_dT, d2P_dV2,
+                                                d2P_dT2, d2P_dTdV)
+        derivatives.update(dP_dV=dP_dV, dP_dT=dP_dT, d2P_dV2=d2P_dV2,
+                           d2P_dT2=d2P_dT2, d2P_dTdV=d2P_dTdV)
+        return derivatives
+
+    def departure_derivatives(self, phase='l'):
+        r'''Method to compute the first temperature and pressure derivatives
+        of the departure enthalpy and entropy, and the fugacity coefficient
+        with its derivatives, for one phase at every state; see
+        :obj:`eos_departure_derivatives_batch` and
+        :obj:`eos_phi_derivatives_batch`.
+
+        Parameters
+        ----------
+        phase : str, optional
+            'l' or 'g', [-]
+
+        Returns
+        -------
+        derivatives : dict[str, ndarray]
+            Derivatives keyed by the name of the :obj:`GCEOS` property
+            without its phase suffix, NaN where the phase does not exist,
+            [various]
+        '''
+        V = self.V_l if phase == 'l' else self.V_g
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dP_dV, dP_dT = self._P_derivatives(V)[:2]
+            dV_dP = 1.0/dP_dV
+            dV_dT = -dP_dT*dV_dP
+        derivatives = eos_departure_derivatives_batch(
+                self.T, self.P, V, dV_dT, dV_dP, self.b, self.delta,
+                self.epsilon, self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2)
+        if phase == 'l':
+            H_dep, S_dep = self.H_dep_l, self.S_dep_l
+        else:
+            H_dep, S_dep = self.H_dep_g, self.S_dep_g
+        derivatives.update(eos_phi_derivatives_batch(
+                self.T, H_dep, S_dep, derivatives['dH_dep_dT'],
+                derivatives['dH_dep_dP'], derivatives['dS_dep_dT'],
+                derivatives['dS_dep_dP']))
+        return derivatives
+
+    def departure_second_derivatives(self, phase='l'):
+        r'''Method to compute the second temperature derivatives of the
+        departure enthalpy and entropy for one phase at every state; see
+        :obj:`eos_departure_second_derivatives_batch`.
+
+        Parameters
+        ----------
+        phase : str, optional
+            'l' or 'g', [-]
+
+        Returns
+        -------
+        derivatives : dict[str, ndarray]
+            Derivatives keyed by the name of the :obj:`GCEOS` property
+            without its phase suffix, NaN where the phase does not exist,
+            [various]
+        '''
+        V = self.V_l if phase == 'l' else self.V_g
+        derivatives = self.derivatives(phase)
+        T_unique, T_index = np.unique(self.T, return_inverse=True)
+        d3a_alpha_dT3 = np.array([self.eos.d3a_alpha_dT3_pure(T)
+                                  for T in T_unique.tolist()])
+        d3a_alpha_dT3 = d3a_alpha_dT3[T_index.ravel()].reshape(self.T.shape)
+        return eos_departure_second_derivatives_batch(
+                self.T, self.P, V, derivatives['dV_dT'],
+                derivatives['d2V_dT2'], self.b, self.delta, self.epsilon,
+                self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2,
+                d3a_alpha_dT3)
+
+    def _P_derivatives(self, V):
+        return eos_P_derivatives_batch(self.T, V, self.b, self.delta,
+                                       self.epsilon, self.a_alpha,
+                                       self.da_alpha_dT, self.d2a_alpha_dT2)
+
+    def _departures(self, V):
+        T, P, b, delta = self.T, self.P, self.b, self.delta
+        RT = R*T
+        x11 = 1.0/sqrt(delta*delta - 4.0*self.epsilon)
+        arg = x11*(V + V + delta)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x12 = x11*np.log(np.abs((1.0 + arg)/(1.0 - arg)))
+            H_dep = x12*(T*self.da_alpha_dT - self.a_alpha) - RT + P*V
+            S_dep = -R*np.log(RT/(P*(V - b))) + self.da_alpha_dT*x12
+        return H_dep, S_dep
+
+
+class EOSBatch(object):
+    r'''Structure-of-arrays view of many solved pure-component EOS
+    objects, which may be of different fluids and models. The parameters
+    and volumes of every object are collected once into NumPy arrays so that
+    derivatives can be calculated for all of them together, instead of
+    through the properties of each object in turn.
+
+    Parameters
+    ----------
+    eoses : list[GCEOS]
+        Solved pure-component EOSs, [-]
+
+    Attributes
+    ----------
+    V_l : ndarray
+        Liquid-like molar volumes, NaN where there is no such root, [m^3/mol]
+    V_g : ndarray
+        Vapor-like molar volumes, NaN where there is no such root, [m^3/mol]
+    H_dep_l : ndarray
+        Liquid-like departure enthalpies, [J/mol]
+    H_dep_g : ndarray
+        Vapor-like departure enthalpies, [J/mol]
+    S_dep_l : ndarray
+        Liquid-like departure entropies, [J/mol/K]
+    S_dep_g : ndarray
+        Vapor-like departure entropies, [J/mol/K]
+
+    Examples
+    --------
+    >>> eoses = [PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5),
+    ...          PR(Tc=126.2, Pc=3394387.5, omega=0.04, T=300.0, P=1e5)]
+    >>> batch = EOSBatch(eoses)
+    >>> batch.V_l
+    array([0.00013063,        nan])
+    '''
+
+    def __init__(self, eoses):
+        self.eoses = eoses = list(eoses)
+        nan = float('nan')
+        for attr in ('T', 'P', 'b', 'delta', 'epsilon', 'a_alpha',
+                     'da_alpha_dT', 'd2a_alpha_dT2', 'V_l', 'V_g', 'H_dep_l',
+                     'H_dep_g', 'S_dep_l', 'S_dep_g'):
+            setattr(self, attr, np.array([getattr(eos, attr, nan) for eos in eoses]))
+
+    def derivatives(self, phase='l'):
+        r'''Method to compute the primitive and derived partial derivatives
+        of every EOS for one phase; see :obj:`EOSArray.derivatives`.
+
+        Parameters
+        ----------
+        phase : str, optional
+            'l' or 'g', [-]
+
+        Returns
+        -------
+        derivatives : dict[str, ndarray]
+            Derivatives keyed by the name of the :obj:`GCEOS` property
+            without its phase suffix, NaN where the phase does not exist,
+            [various]
+        '''
+        V = self.V_l if phase == 'l' else self.V_g
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dP_dV, dP_dT, d2P_dV2, d2P_dT2, d2P_dTdV = eos_P_derivatives_batch(
+                    self.T, V, self.b, self.delta, self.epsilon, self.a_alpha,
+                    self.da_alpha_dT, self.d2a_alpha_dT2)
+            derivatives = eos_derivatives_batch(V, dP_dV, dP_dT, d2P_dV2,
+                                                d2P_dT2, d2P_dTdV)
+        derivatives.update(dP_dV=dP_dV, dP_dT=dP_dT, d2P_dV2=d2P_dV2,
+                           d2P_dT2=d2P_dT2, d2P_dTdV=d2P_dTdV)
+        return derivatives
+
+    def departure_derivatives(self, phase='l'):
+        r'''Method to compute the first temperature and pressure derivatives
+        of the departure enthalpy and entropy, and the fugacity coefficient
+        with its derivatives, of every EOS for one phase; see
+        :obj:`eos_departure_derivatives_batch` and
+        :obj:`eos_phi_derivatives_batch`.
+
+        Parameters
+        ----------
+        phase : str, optional
+            'l' or 'g', [-]
+
+        Returns
+        -------
+        derivatives : dict[str, ndarray]
+            Derivatives keyed by the name of the :obj:`GCEOS` property
+            without its phase suffix, NaN where the phase does not exist,
+            [various]
+        '''
+        V = self.V_l if phase == 'l' else self.V_g
+        T, b, delta, epsilon = self.T, self.b, self.delta, self.epsilon
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dP_dV, dP_dT = eos_P_derivatives_batch(
+                    T, V, b, delta, epsilon, self.a_alpha, self.da_alpha_dT,
+                    self.d2a_alpha_dT2)[:2]
+            dV_dP = 1.0/dP_dV
+            dV_dT = -dP_dT*dV_dP
+        derivatives = eos_departure_derivatives_batch(
+                T, self.P, V, dV_dT, dV_dP, b, delta, epsilon, self.a_alpha,
+                self.da_alpha_dT, self.d2a_alpha_dT2)
+        if phase == 'l':
+            H_dep, S_dep = self.H_dep_l, self.S_dep_l
+        else:
+            H_dep, S_dep = self.H_dep_g, self.S_dep_g
+        derivatives.update(eos_phi_derivatives_batch(
+                T, H_dep, S_dep, derivatives['dH_dep_dT'],
+                derivatives['dH_dep_dP'], derivatives['dS_dep_dT'],
+                derivatives['dS_dep_dP']))
+        return derivatives
+
+    def departure_second_derivatives(self, phase='l'):
+        r'''Method to compute the second temperature derivatives of the
+        departure enthalpy and entropy of every EOS for one phase; see
+        :obj:`eos_departure_second_derivatives_batch`.
+
+        Parameters
+        ----------
+        phase : str, optional
+            'l' or 'g', [-]
+
+        Returns
+        -------
+        derivatives : dict[str, ndarray]
+            Derivatives keyed by the name of the :obj:`GCEOS` property
+            without its phase suffix, NaN where the phase does not exist,
+            [various]
+        '''
+        V = self.V_l if phase == 'l' else self.V_g
+        derivatives = self.derivatives(phase)
+        d3a_alpha_dT3 = np.array([eos.d3a_alpha_dT3 for eos in self.eoses])
+        return eos_departure_second_derivatives_batch(
+                self.T, self.P, V, derivatives['dV_dT'],
+                derivatives['d2V_dT2'], self.b, self.delta, self.epsilon,
+                self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2,
+                d3a_alpha_dT3)
+
+
 if __name__ == "__main__":
 
     eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
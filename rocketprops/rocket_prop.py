@@ -49,6 +49,7 @@ __status__ = "4 - Beta" # "3 - Alpha", "4 - Beta", "5 - Production/Stable"
 # import statements here. (built-in first, then 3rd party, then yours)
 #
 from math import exp, log, log10
+from functools import lru_cache
 import importlib
 from rocketprops.unit_conv_data import get_value
 from rocketprops.prop_names import prop_names
@@ -56,7 +57,6 @@ from rocketprops.prop_names import prop_names
 from rocketprops.mixing_functions import isMMH_N2H4_Blend, isMON_Ox, isFLOX_Ox, isN2H4_UDMH_Blend
 from rocketprops.InterpProp_scipy import InterpProp
 
-from scipy import optimize
 from rocketprops.mixing_functions import Li_Tcm, mixing_simple, DIPPR9H_cond, Filippov_cond, \
                                          Winterfeld_Scriven_Davis_surf, mixing_logarithmic
 from rocketprops.mixing_functions import Mnn_Freeze_terp, MON_Freeze_terp, Axx_Freeze_terp
@@ -99,6 +99,16 @@ def get_prop( name, suppress_warning=False ):
         return None
     
 
+@lru_cache(maxsize=16)
+def _get_base_prop( name ):
+    """
+    Cached get_prop for the pure constituents used by build_mixture.
+    These objects are shared by every mixture built from them and are never
+    handed back to the caller of build_mixture.
+    """
+    return get_prop( name )
+
+
 
 class Propellant(object):
     """
@@ -134,6 +144,14 @@ class Propellant(object):
         
         lbm_per_cuin = self.Pc * self.MolWt / (18540.0 * self.Tc * self.Zc)
         return lbm_per_cuin * 27.67990471 # g/ml
+
+    @property
+    def Vc(self):
+        """Return critical molar volume in cm**3/gmole."""
+        SGc = self.SGc
+        if SGc is None:
+            return None
+        return self.MolWt / SGc
     
     def set_std_state(self):
         raise NotImplementedError
@@ -811,12 +829,12 @@ def solve_Tnbp( tL, pvapL ):
     
     Pvap_terp = InterpProp( tL, pvapL, extrapOK=True)
     
-    def func( T ):
-        return 14.6959 - max(0.0, Pvap_terp( T ))
-    
-    sol = optimize.root_scalar(func, bracket=[tL[0], tL[-1]], method='brentq')
-    # print( 'sol.root=',sol.root )
-    return sol.root
+    # Inside the table the interpolant is a piecewise cubic, so the 1 atm
+    # crossing comes straight from its roots, without a root-finder callback.
+    rootL = Pvap_terp.interpFunc.solve( 14.6959, extrapolate=False )
+    if len(rootL) == 0:
+        raise ValueError('Vapor pressure table does not span 14.6959 psia')
+    return float( rootL[0] )
 
 
 def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
@@ -853,13 +871,13 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
         f = (p2 - p3) / (p3 - p1)
         """
         if mmhPcent <= 86.0:
-            mmh_lo_prop = get_prop('N2H4')
-            mmh_hi_prop = get_prop('MHF3')
+            mmh_lo_prop = _get_base_prop('N2H4')
+            mmh_hi_prop = _get_base_prop('MHF3')
             # mass_fracL=[noPcent, 100-noPcent]
             mass_fracL=[(86-mmhPcent)/(mmhPcent), 1.0]
         else:
-            mmh_lo_prop = get_prop('MHF3')
-            mmh_hi_prop = get_prop('MMH')
+            mmh_lo_prop = _get_base_prop('MHF3')
+            mmh_hi_prop = _get_base_prop('MMH')
             mass_fracL=[(100-mmhPcent)/(mmhPcent-86), 1.0]
 
         prop_objL=[mmh_lo_prop, mmh_hi_prop]  # will normalize below
@@ -872,13 +890,13 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
         Tfreeze = Axx_Freeze_terp( 100.0 - n2h4Pcent )
 
         if n2h4Pcent <= 50.0:
-            mmh_lo_prop = get_prop('UDMH')
-            mmh_hi_prop = get_prop('A50')
+            mmh_lo_prop = _get_base_prop('UDMH')
+            mmh_hi_prop = _get_base_prop('A50')
             # mass_fracL=[noPcent, 100-noPcent]
             mass_fracL=[(50-n2h4Pcent)/(n2h4Pcent), 1.0]
         else:
-            mmh_lo_prop = get_prop('A50')
-            mmh_hi_prop = get_prop('N2H4')
+            mmh_lo_prop = _get_base_prop('A50')
+            mmh_hi_prop = _get_base_prop('N2H4')
             mass_fracL=[(100-n2h4Pcent)/(n2h4Pcent-50), 1.0]
 
         prop_objL=[mmh_lo_prop, mmh_hi_prop]  # will normalize below
@@ -904,17 +922,17 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
         f = (p2 - p3) / (p3 - p1)
         """
         if noPcent <= 10.0:
-            mon_lo_prop = get_prop('N2O4')
-            mon_hi_prop = get_prop('MON10')
+            mon_lo_prop = _get_base_prop('N2O4')
+            mon_hi_prop = _get_base_prop('MON10')
             # mass_fracL=[noPcent, 100-noPcent]
             mass_fracL=[(10-noPcent)/(noPcent), 1.0]
         elif noPcent <= 25.0:
-            mon_lo_prop = get_prop('MON10')
-            mon_hi_prop = get_prop('MON25')
+            mon_lo_prop = _get_base_prop('MON10')
+            mon_hi_prop = _get_base_prop('MON25')
             mass_fracL=[(25-noPcent)/(noPcent-10), 1.0]
         elif noPcent <= 30.0:
-            mon_lo_prop = get_prop('MON25')
-            mon_hi_prop = get_prop('MON30')
+            mon_lo_prop = _get_base_prop('MON25')
+            mon_hi_prop = _get_base_prop('MON30')
             mass_fracL=[(30-noPcent)/(noPcent-25), 1.0]
         else:
             raise Exception('Maximum MON value allowed in RocketProps is MON30.')
@@ -926,8 +944,8 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
         Tfreeze = MON_Freeze_terp( noPcent )
         # raise Exception('MON logic needs work')
     elif f2Pcent:
-        lox_prop = get_prop('LOX')
-        lf2_prop = get_prop('LF2')
+        lox_prop = _get_base_prop('LOX')
+        lf2_prop = _get_base_prop('LF2')
         prop_objL=[lf2_prop, lox_prop]
         mass_fracL=[f2Pcent, 100-f2Pcent]  # will normalize below
 
@@ -1011,7 +1029,7 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
     tmpD['P'] = mixing_simple(mole_fracL, [Pobj.P for Pobj in prop_objL])  # psia
 
     # Vc = MolWt / SGc # (cm**3/gmole)
-    VcL = [ Pobj.MolWt/Pobj.SGc for Pobj in prop_objL ]
+    VcL = [ Pobj.Vc for Pobj in prop_objL ]
 
     # Properties of Liquids and Gases 5th Ed. Eqn 5-3.1
     # Switch to Li method from mixing_simple:  tmpD['Tc'] = mixing_simple(mole_fracL, [Pobj.Tc for Pobj in prop_objL])  # degR
@@ -1121,27 +1139,33 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
 
         tL.append( T )
         trL.append( T/Tc )
+
+        # pseudo reduced temperature and vapor pressure of each constituent,
+        # used by every property below
+        ptrL = [ pTr(Pobj, T, Tr) for Pobj in prop_objL ]
+        pvap_objL = [ Pobj.PvapAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL) ]
+
         # liquid density
-        VmL = [ Pobj.MolWt/Pobj.SGLiqAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL ]
+        VmL = [ Pobj.MolWt/Pobj.SGLiqAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL) ]
 
-        pL.append( sum( [y* Pobj.PvapAtTr( pTr(Pobj, T, Tr) ) for (y,Pobj) in zip(mole_fracL, prop_objL)] ) ) # Raoult's Law
+        pL.append( sum( [y*pvap for (y,pvap) in zip(mole_fracL, pvap_objL)] ) ) # Raoult's Law
 
-        cpL.append( mixing_simple(mass_fracL, [ Pobj.CpAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]) )
+        cpL.append( mixing_simple(mass_fracL, [ Pobj.CpAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL)]) )
 
-        hvapL.append( mixing_simple(mass_fracL, [ Pobj.HvapAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]) )
+        hvapL.append( mixing_simple(mass_fracL, [ Pobj.HvapAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL)]) )
         
         # surfL.append( mixing_simple(mass_fracL, [ Pobj.SurfAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]) )
-        sL = [ Pobj.SurfAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]
+        sL = [ Pobj.SurfAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL)]
         if Tr < 1.0:
             surfL.append( Winterfeld_Scriven_Davis_surf(mole_fracL, sL, VmL) )
         else:
             surfL.append( 0.0 )
         
         # viscL.append( mixing_simple     (mass_fracL, [ Pobj.ViscAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]) )
-        viscL.append( mixing_logarithmic(mass_fracL, [ Pobj.ViscAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]) )
+        viscL.append( mixing_logarithmic(mass_fracL, [ Pobj.ViscAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL)]) )
         
         # thermal conductivity
-        tmp_condL = [Pobj.CondAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL]
+        tmp_condL = [Pobj.CondAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL)]
         if len(mass_fracL) == 2:
             # Recommended in Perry Handbook 8th Ed. page 2-512
             condL.append(  Filippov_cond( mass_fracL, tmp_condL ) )
@@ -1153,10 +1177,10 @@ def build_mixture( prop_name=''): #, prop_objL=None, mass_fracL=None):
         # Amgat mixing rule from thermo package: https://thermo.readthedocs.io/
         SG_liqL.append( MolWt / Vm )
 
-        Z = mixing_simple(mole_fracL, [Pobj.ZVapAtTr( pTr(Pobj, T, Tr) ) for Pobj in prop_objL])
+        Z = mixing_simple(mole_fracL, [Pobj.ZVapAtTr( ptr ) for (Pobj,ptr) in zip(prop_objL, ptrL)])
 
-        MW = sum( [y*Pobj.MolWt* Pobj.PvapAtTr( pTr(Pobj, T, Tr) ) \
-                   for (y,Pobj) in zip(mole_fracL, prop_objL)] ) / pL[-1]
+        MW = sum( [y*Pobj.MolWt*pvap \
+                   for (y,Pobj,pvap) in zip(mole_fracL, prop_objL, pvap_objL)] ) / pL[-1]
 
         # print( 'MW =',MW, '  MolWt =', MolWt)
         SGg = pL[-1] * MW / (18540.0 * T * (Z/27.67990471)) # g/ml
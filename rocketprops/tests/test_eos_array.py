@@ -0,0 +1,219 @@
+import unittest
+# import unittest2 as unittest # for versions of python < 2.7
+
+"""
+Checks the array and batch forms of the cubic EOS in rocketprops/backup/eos.py
+against the scalar PR object, state by state.
+"""
+
+import sys, os
+
+here = os.path.abspath(os.path.dirname(__file__)) # Needed for py.test
+up_one = os.path.split( here )[0]  # Needed to find rocketprops development version
+backup = os.path.join( up_one, 'backup' )
+if here not in sys.path[:2]:
+    sys.path.insert(0, here)
+if backup not in sys.path[:3]:
+    sys.path.insert(0, backup)
+
+import numpy as np
+import eos
+from eos import PR, EOSArray, EOSBatch, polyroots_vec
+
+TC, PC, OMEGA = 507.6, 3025000.0, 0.2975
+
+FLUIDS = [(507.6, 3025000.0, 0.2975), (126.2, 3394387.5, 0.04),
+          (190.56, 4599000.0, 0.008), (647.1, 22064000.0, 0.344)]
+
+
+def scalar_value(e, name, phase):
+    """Value of a phase property of a scalar EOS, NaN if the phase does not exist"""
+    if not hasattr(e, 'V_' + phase):
+        return float('nan')
+    if name.endswith('_V'):
+        return getattr(e, name[:-2] + '_' + phase + '_V')
+    return getattr(e, name + '_' + phase)
+
+
+class MyTest(unittest.TestCase):
+
+    def assertClose(self, a, b, rtol=1e-9, msg=None):
+        """NaN only matches NaN; otherwise relative agreement within rtol."""
+        if np.isnan(b):
+            self.assertTrue( np.isnan(a), msg )
+        else:
+            self.assertLessEqual( abs(a - b), rtol*abs(b), msg )
+
+    def test_EOSArray_matches_scalar_PR(self):
+        """Check EOSArray V, H_dep for both phases over a 40x40 T-P grid"""
+        Ts, Ps = np.meshgrid( np.linspace(100.0, 1000.0, 40), np.logspace(2.0, 8.0, 40) )
+        A = EOSArray.from_scalars( PR, TC, PC, OMEGA, Ts, Ps )
+        self.assertEqual( A.V_l.shape, Ts.shape )
+
+        for T, P, V_l, V_g, H_l, H_g in zip( Ts.ravel(), Ps.ravel(), A.V_l.ravel(),
+                                             A.V_g.ravel(), A.H_dep_l.ravel(), A.H_dep_g.ravel() ):
+            e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=float(T), P=float(P))
+            msg = 'T=%s, P=%s' %(T, P)
+            self.assertClose( V_l, scalar_value(e, 'V', 'l'), msg=msg )
+            self.assertClose( V_g, scalar_value(e, 'V', 'g'), msg=msg )
+            self.assertClose( H_l, scalar_value(e, 'H_dep', 'l'), rtol=1e-7, msg=msg )
+            self.assertClose( H_g, scalar_value(e, 'H_dep', 'g'), rtol=1e-7, msg=msg )
+
+    def test_EOSArray_derivatives(self):
+        """Check the eos_*_batch kernels through EOSArray against scalar PR"""
+        base = PR(Tc=TC, Pc=PC, omega=OMEGA, T=500.0, P=1e6)
+        Ts = np.array([200., 300., 400., 500., 600.])
+        Ps = np.array([1e5, 1e6, 3e6, 1e6, 5e6])
+        A = EOSArray( base, Ts, Ps )
+        for phase in 'lg':
+            results = [A.derivatives(phase), A.departure_derivatives(phase),
+                       A.departure_second_derivatives(phase)]
+            for i, (T, P) in enumerate( zip(Ts, Ps) ):
+                e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=P)
+                for d in results:
+                    for name, values in d.items():
+                        self.assertClose( values[i], scalar_value(e, name, phase), rtol=1e-7,
+                                          msg='%s_%s at T=%s, P=%s' %(name, phase, T, P) )
+
+    def test_EOSArray_discriminant_and_to_TP(self):
+        """Check EOSArray.discriminant and EOSArray.to_TP"""
+        base = PR(Tc=TC, Pc=PC, omega=OMEGA, T=500.0, P=1e6)
+        A = EOSArray( base, [300.0, 400.0, 500.0], 1e6 )
+        for T, disc in zip( A.T, A.discriminant() ):
+            self.assertClose( disc, PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=1e6).discriminant() )
+
+        B = A.to_TP( [350.0, 450.0], [2e6, 3e6] )
+        self.assertIs( B.eos, base )
+        self.assertClose( B.V_l[0], PR(Tc=TC, Pc=PC, omega=OMEGA, T=350.0, P=2e6).V_l )
+
+    def test_EOSBatch_matches_scalar_PR(self):
+        """Check EOSBatch over several fluids against each scalar PR"""
+        eoses = [PR(Tc=Tc, Pc=Pc, omega=omega, T=T, P=P) for (Tc, Pc, omega) in FLUIDS
+                 for (T, P) in [(150.0, 1e5), (300.0, 2e6)]]
+        B = EOSBatch( eoses )
+        for phase in 'lg':
+            results = [B.derivatives(phase), B.departure_derivatives(phase),
+                       B.departure_second_derivatives(phase)]
+            for i, e in enumerate( eoses ):
+                self.assertClose( getattr(B, 'V_' + phase)[i], scalar_value(e, 'V', phase) )
+                for d in results:
+                    for name, values in d.items():
+                        self.assertClose( values[i], scalar_value(e, name, phase), rtol=1e-7,
+                                          msg='%s_%s of eos %d' %(name, phase, i) )
+
+    def test_discriminant_vec(self):
+        """Check discriminant_vec against discriminant element-wise"""
+        e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=500.0, P=1e6)
+        Ps = np.logspace(3.0, 9.0, 13)
+        for P, disc in zip( Ps, e.discriminant_vec(Ps=Ps) ):
+            self.assertClose( disc, e.discriminant(P=P) )
+
+        Ts = np.linspace(200.0, 800.0, 13)
+        for T, disc in zip( Ts, e.discriminant_vec(Ts=Ts) ):
+            self.assertClose( disc, e.discriminant(T=T) )
+            # R*T must be that of each T, not of the object
+            self.assertClose( disc, PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=1e6).discriminant() )
+
+        for T, P, disc in zip( Ts, Ps, e.discriminant_vec(Ts=Ts, Ps=Ps) ):
+            self.assertClose( disc, e.discriminant(T=T, P=P) )
+
+    def test_P_discriminant_zeros_analytical_vec(self):
+        """Check the vectorized discriminant zeros against the scalar quartic"""
+        e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=500.0, P=1e6)
+        Ts = np.linspace(200.0, 800.0, 7)
+        a_alphas = np.array([e.a_alpha_and_derivatives(T, full=False) for T in Ts])
+        roots = PR.P_discriminant_zeros_analytical_vec( Ts, e.b, e.delta, e.epsilon, a_alphas )
+        self.assertEqual( roots.shape, (7, 4) )
+        for T, a_alpha, row in zip( Ts, a_alphas, roots ):
+            coeffs = eos.eos_P_discriminant_zero_coeffs( T, e.b, e.delta, e.epsilon, a_alpha )
+            for root in np.roots( coeffs ):
+                self.assertLessEqual( np.abs(row - root).min(), 1e-8*abs(root) )
+
+    def test_evaluate(self):
+        """Check evaluate against the properties of a new object"""
+        e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=500.0, P=1e6)
+        for T, P, phase in [(300.0, 1e5, 'l'), (500.0, 1e5, 'g'), (600.0, 1e7, None)]:
+            new = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=P)
+            values = e.evaluate( T, P, props=('Z', 'H_dep', 'S_dep'), phase=phase )
+            if phase is None:
+                phase = new.phase if new.phase != 'l/g' else new.more_stable_phase
+            expect = tuple( getattr(new, name + '_' + phase) for name in ('Z', 'H_dep', 'S_dep') )
+            self.assertEqual( values, expect )
+
+    def test_polyroots_vec(self):
+        """Check polyroots_vec against np.roots for a stack of cubics"""
+        rng = np.random.RandomState(0)
+        coeffs = rng.uniform(-2.0, 2.0, (4, 25))
+        coeffs[0] += 3.0
+        roots = polyroots_vec( tuple(coeffs) )
+        self.assertEqual( roots.shape, (25, 3) )
+        for i in range(25):
+            expect = np.sort_complex( np.roots(coeffs[:, i]) )
+            self.assertTrue( np.allclose(np.sort_complex(roots[i]), expect, rtol=1e-10, atol=1e-12) )
+
+    def test_to_TP_not_shared(self):
+        """Check that to_TP objects are only reused when an instance opts in"""
+        e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=300.0, P=1e5)
+        f = PR(Tc=TC, Pc=PC, omega=OMEGA, T=310.0, P=1e5)
+        self.assertIsNot( e.to_TP(350.0, 2e5), f.to_TP(350.0, 2e5) )
+        self.assertIsNot( e.to_TP(350.0, 2e5), e.to_TP(350.0, 2e5) )
+
+        e.to_cache_size = 2
+        first = e.to_TP(350.0, 2e5)
+        self.assertIs( e.to_TP(350.0, 2e5), first )
+        e.to_TP(351.0, 2e5)
+        e.to_TP(350.0, 2e5) # most recently used again
+        e.to_TP(352.0, 2e5) # evicts 351 K
+        self.assertIs( e.to_TP(350.0, 2e5), first )
+        self.assertNotIn( 'to_cache_size', e.as_json() )
+
+    def test_dT_drho_finite_difference(self):
+        """Check dT_drho_l/g against a central difference of T(rho) at constant P"""
+        for T, P in [(300.0, 1e5), (450.0, 1.5e6)]:
+            e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=P)
+            dT = 1e-5*T
+            low = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T - dT, P=P)
+            high = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T + dT, P=P)
+            for phase in 'lg':
+                V = 'V_' + phase
+                drho = 1.0/getattr(high, V) - 1.0/getattr(low, V)
+                self.assertClose( getattr(e, 'dT_drho_' + phase), 2.0*dT/drho, rtol=1e-7,
+                                  msg='dT_drho_%s at T=%s, P=%s' %(phase, T, P) )
+
+    def test_json_round_trip(self):
+        """Check that an object restored by from_json rebuilds its cached values"""
+        e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=300.0, P=1e5)
+        d = e.as_json()
+        self.assertEqual( [k for k in d if k.startswith('_')], [] )
+
+        new = PR.from_json( d )
+        self.assertEqual( new.discriminant(), e.discriminant() )
+        self.assertEqual( new.discriminant(P=1e7), e.discriminant(P=1e7) )
+        self.assertEqual( new.a_alpha_pure(250.0), e.a_alpha_pure(250.0) )
+        self.assertEqual( new.a_alpha_and_derivatives_pure(250.0), e.a_alpha_and_derivatives_pure(250.0) )
+        self.assertEqual( new.d3a_alpha_dT3_pure(250.0), e.d3a_alpha_dT3_pure(250.0) )
+
+    def test_resolve_full_alphas_clears_cache(self):
+        """Check that cached values are recalculated after resolve_full_alphas"""
+        for T, P in [(200.0, 1e7), (600.0, 1e7)]:
+            expect = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=P)
+            e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=T, P=P)
+            e.solve(full_alphas=False)
+            e.dH_dep_dT_l # cached with the placeholder alpha derivatives
+            e.resolve_full_alphas()
+            self.assertEqual( e.dH_dep_dT_l, expect.dH_dep_dT_l )
+            self.assertEqual( e._T_da_alpha_dT_minus_a_alpha, expect._T_da_alpha_dT_minus_a_alpha )
+
+    def test_json_round_trip_departures(self):
+        """Check V_dep and U_dep of both phases on an object restored by from_json"""
+        e = PR(Tc=TC, Pc=PC, omega=OMEGA, T=300.0, P=1e5)
+        self.assertEqual( e.phase, 'l/g' )
+        new = PR.from_json( e.as_json() )
+        for name in ('V_dep_l', 'V_dep_g', 'U_dep_l', 'U_dep_g'):
+            self.assertEqual( getattr(new, name), getattr(e, name), name )
+
+
+if __name__ == '__main__':
+    # Can test just this file from command prompt
+    #  or it can be part of test discovery from nose, unittest, pytest, etc.
+    unittest.main()
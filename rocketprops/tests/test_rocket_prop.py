@@ -52,7 +52,8 @@ if here not in sys.path[:2]:
 if up_one not in sys.path[:2]:
     sys.path.insert(0, up_one)
 
-from rocketprops.rocket_prop import get_prop; 
+from rocketprops.rocket_prop import get_prop, solve_Tnbp
+from rocketprops.InterpProp_scipy import InterpProp
 
 class MyTest(unittest.TestCase):
 
@@ -75,6 +76,31 @@ class MyTest(unittest.TestCase):
         # See if the self.myclass object exists
         self.assertTrue(result)
 
+    def test_Vc(self):
+        """Check that Vc is MolWt/SGc and follows changes to SGc"""
+        p = self.myclass
+        self.assertAlmostEqual(p.Vc, p.MolWt / p.SGc, places=10)
+
+        p.Zc *= 1.1
+        self.assertAlmostEqual(p.Vc, p.MolWt / p.SGc, places=10)
+
+    def test_solve_Tnbp(self):
+        """Check that solve_Tnbp lands on 1 atm of the vapor pressure curve"""
+        p = self.myclass
+        pvapL = [10.0**log10p for log10p in p.log10pL]
+        Tnbp = solve_Tnbp( p.tL, pvapL )
+
+        self.assertTrue( p.tL[0] < Tnbp < p.tL[-1] )
+        self.assertAlmostEqual(Tnbp, p.Tnbp, delta=0.1)
+
+        Pvap_terp = InterpProp( p.tL, pvapL, extrapOK=True)
+        self.assertAlmostEqual(Pvap_terp(Tnbp), 14.6959, places=8)
+
+        # table entirely above 1 atm has no normal boiling point
+        i = [j for j,P in enumerate(pvapL) if P > 14.6959][0]
+        with self.assertRaises(ValueError):
+            solve_Tnbp( p.tL[i:], pvapL[i:] )
+
 
 if __name__ == '__main__':
     # Can test just this file from command prompt